@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Measures how long manimgl takes to start, running each case several
+times in a fresh interpreter and reporting the median.
+
+    python benchmarks/startup_time.py [-n RUNS] [--importtime]
+
+With --importtime, also lists the modules slowest to import for
+"from manimlib import *", as reported by python -X importtime.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess as sp
+import sys
+import time
+
+
+CASES = [
+    ("import manimlib", ["-c", "import manimlib"]),
+    ("manimgl --version", ["-m", "manimlib", "--version"]),
+    ("from manimlib import *", ["-c", "from manimlib import *"]),
+]
+
+
+def time_command(args: list[str], n_runs: int) -> float:
+    times = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        sp.run([sys.executable, *args], check=True, stdout=sp.DEVNULL, stderr=sp.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def get_slowest_imports(statement: str, n_modules: int = 15) -> list[tuple[int, str]]:
+    stderr = sp.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True, stdout=sp.DEVNULL, stderr=sp.PIPE, text=True,
+    ).stderr
+    results = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        results.append((int(cumulative), name.strip()))
+    return sorted(results, reverse=True)[:n_modules]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+
+    # Warm up the bytecode and file system caches
+    time_command(CASES[-1][1], 1)
+    for name, command in CASES:
+        print(f"{name:<28}{1000 * time_command(command, args.runs):8.1f} ms")
+
+    if args.importtime:
+        print("\nSlowest imports for from manimlib import * (cumulative):")
+        for microseconds, name in get_slowest_imports("from manimlib import *"):
+            print(f"{microseconds / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,213 @@
-import pkg_resources
+import importlib
+import importlib.metadata
+import importlib.util
 
-__version__ = pkg_resources.get_distribution("manimgl").version
+__version__ = importlib.metadata.version("manimgl")
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from manimlib.typing import *
 
-from manimlib.constants import *
-
-from manimlib.window import *
-
-from manimlib.animation.animation import *
-from manimlib.animation.composition import *
-from manimlib.animation.creation import *
-from manimlib.animation.fading import *
-from manimlib.animation.growing import *
-from manimlib.animation.indication import *
-from manimlib.animation.movement import *
-from manimlib.animation.numbers import *
-from manimlib.animation.rotation import *
-from manimlib.animation.specialized import *
-from manimlib.animation.transform import *
-from manimlib.animation.transform_matching_parts import *
-from manimlib.animation.update import *
-
-from manimlib.camera.camera import *
-
-from manimlib.mobject.boolean_ops import *
-from manimlib.mobject.changing import *
-from manimlib.mobject.coordinate_systems import *
-from manimlib.mobject.frame import *
-from manimlib.mobject.functions import *
-from manimlib.mobject.geometry import *
-from manimlib.mobject.interactive import *
-from manimlib.mobject.matrix import *
-from manimlib.mobject.mobject import *
-from manimlib.mobject.mobject_update_utils import *
-from manimlib.mobject.number_line import *
-from manimlib.mobject.numbers import *
-from manimlib.mobject.probability import *
-from manimlib.mobject.shape_matchers import *
-from manimlib.mobject.svg.brace import *
-from manimlib.mobject.svg.drawings import *
-from manimlib.mobject.svg.string_mobject import *
-from manimlib.mobject.svg.svg_mobject import *
-from manimlib.mobject.svg.special_tex import *
-from manimlib.mobject.svg.tex_mobject import *
-from manimlib.mobject.svg.text_mobject import *
-from manimlib.mobject.three_dimensions import *
-from manimlib.mobject.types.dot_cloud import *
-from manimlib.mobject.types.image_mobject import *
-from manimlib.mobject.types.point_cloud_mobject import *
-from manimlib.mobject.types.surface import *
-from manimlib.mobject.types.vectorized_mobject import *
-from manimlib.mobject.value_tracker import *
-from manimlib.mobject.vector_field import *
-
-from manimlib.scene.interactive_scene import *
-from manimlib.scene.scene import *
-
-from manimlib.utils.bezier import *
-from manimlib.utils.color import *
-from manimlib.utils.dict_ops import *
-from manimlib.utils.customization import *
-from manimlib.utils.debug import *
-from manimlib.utils.directories import *
-from manimlib.utils.file_ops import *
-from manimlib.utils.images import *
-from manimlib.utils.iterables import *
-from manimlib.utils.paths import *
-from manimlib.utils.rate_functions import *
-from manimlib.utils.simple_functions import *
-from manimlib.utils.shaders import *
-from manimlib.utils.sounds import *
-from manimlib.utils.space_ops import *
-from manimlib.utils.tex import *
+    from manimlib.constants import *
+
+    from manimlib.window import *
+
+    from manimlib.animation.animation import *
+    from manimlib.animation.composition import *
+    from manimlib.animation.creation import *
+    from manimlib.animation.fading import *
+    from manimlib.animation.growing import *
+    from manimlib.animation.indication import *
+    from manimlib.animation.movement import *
+    from manimlib.animation.numbers import *
+    from manimlib.animation.rotation import *
+    from manimlib.animation.specialized import *
+    from manimlib.animation.transform import *
+    from manimlib.animation.transform_matching_parts import *
+    from manimlib.animation.update import *
+
+    from manimlib.camera.camera import *
+
+    from manimlib.mobject.boolean_ops import *
+    from manimlib.mobject.changing import *
+    from manimlib.mobject.coordinate_systems import *
+    from manimlib.mobject.frame import *
+    from manimlib.mobject.functions import *
+    from manimlib.mobject.geometry import *
+    from manimlib.mobject.interactive import *
+    from manimlib.mobject.matrix import *
+    from manimlib.mobject.mobject import *
+    from manimlib.mobject.mobject_file import *
+    from manimlib.mobject.mobject_update_utils import *
+    from manimlib.mobject.number_line import *
+    from manimlib.mobject.numbers import *
+    from manimlib.mobject.probability import *
+    from manimlib.mobject.shape_matchers import *
+    from manimlib.mobject.svg.brace import *
+    from manimlib.mobject.svg.drawings import *
+    from manimlib.mobject.svg.string_mobject import *
+    from manimlib.mobject.svg.svg_mobject import *
+    from manimlib.mobject.svg.special_tex import *
+    from manimlib.mobject.svg.tex_mobject import *
+    from manimlib.mobject.svg.text_mobject import *
+    from manimlib.mobject.three_dimensions import *
+    from manimlib.mobject.types.dot_cloud import *
+    from manimlib.mobject.types.image_mobject import *
+    from manimlib.mobject.types.point_cloud_mobject import *
+    from manimlib.mobject.types.surface import *
+    from manimlib.mobject.types.vectorized_mobject import *
+    from manimlib.mobject.value_tracker import *
+    from manimlib.mobject.vector_field import *
+
+    from manimlib.scene.audio_mixer import *
+    from manimlib.scene.frame_sinks import *
+    from manimlib.scene.interactive_scene import *
+    from manimlib.scene.scene import *
+
+    from manimlib.utils.bezier import *
+    from manimlib.utils.color import *
+    from manimlib.utils.dict_ops import *
+    from manimlib.utils.customization import *
+    from manimlib.utils.debug import *
+    from manimlib.utils.directories import *
+    from manimlib.utils.file_ops import *
+    from manimlib.utils.images import *
+    from manimlib.utils.iterables import *
+    from manimlib.utils.paths import *
+    from manimlib.utils.rate_functions import *
+    from manimlib.utils.simple_functions import *
+    from manimlib.utils.shaders import *
+    from manimlib.utils.sounds import *
+    from manimlib.utils.space_ops import *
+    from manimlib.utils.tex import *
+
+
+# Rather than importing everything above up front, names are looked up in
+# these modules the first time they're asked for, so that using one part of
+# manimlib, like the command line interface, doesn't pay to import the rest.
+# Where several modules share a name, the later one wins, as with the star
+# imports this stands in for.
+_PUBLIC_MODULES = [
+    "manimlib.constants",
+
+    "manimlib.window",
+
+    "manimlib.animation.animation",
+    "manimlib.animation.composition",
+    "manimlib.animation.creation",
+    "manimlib.animation.fading",
+    "manimlib.animation.growing",
+    "manimlib.animation.indication",
+    "manimlib.animation.movement",
+    "manimlib.animation.numbers",
+    "manimlib.animation.rotation",
+    "manimlib.animation.specialized",
+    "manimlib.animation.transform",
+    "manimlib.animation.transform_matching_parts",
+    "manimlib.animation.update",
+
+    "manimlib.camera.camera",
+
+    "manimlib.mobject.boolean_ops",
+    "manimlib.mobject.changing",
+    "manimlib.mobject.coordinate_systems",
+    "manimlib.mobject.frame",
+    "manimlib.mobject.functions",
+    "manimlib.mobject.geometry",
+    "manimlib.mobject.interactive",
+    "manimlib.mobject.matrix",
+    "manimlib.mobject.mobject",
+    "manimlib.mobject.mobject_file",
+    "manimlib.mobject.mobject_update_utils",
+    "manimlib.mobject.number_line",
+    "manimlib.mobject.numbers",
+    "manimlib.mobject.probability",
+    "manimlib.mobject.shape_matchers",
+    "manimlib.mobject.svg.brace",
+    "manimlib.mobject.svg.drawings",
+    "manimlib.mobject.svg.string_mobject",
+    "manimlib.mobject.svg.svg_mobject",
+    "manimlib.mobject.svg.special_tex",
+    "manimlib.mobject.svg.tex_mobject",
+    "manimlib.mobject.svg.text_mobject",
+    "manimlib.mobject.three_dimensions",
+    "manimlib.mobject.types.dot_cloud",
+    "manimlib.mobject.types.image_mobject",
+    "manimlib.mobject.types.point_cloud_mobject",
+    "manimlib.mobject.types.surface",
+    "manimlib.mobject.types.vectorized_mobject",
+    "manimlib.mobject.value_tracker",
+    "manimlib.mobject.vector_field",
+
+    "manimlib.scene.audio_mixer",
+    "manimlib.scene.frame_sinks",
+    "manimlib.scene.interactive_scene",
+    "manimlib.scene.scene",
+
+    "manimlib.utils.bezier",
+    "manimlib.utils.color",
+    "manimlib.utils.dict_ops",
+    "manimlib.utils.customization",
+    "manimlib.utils.debug",
+    "manimlib.utils.directories",
+    "manimlib.utils.file_ops",
+    "manimlib.utils.images",
+    "manimlib.utils.iterables",
+    "manimlib.utils.paths",
+    "manimlib.utils.rate_functions",
+    "manimlib.utils.simple_functions",
+    "manimlib.utils.shaders",
+    "manimlib.utils.sounds",
+    "manimlib.utils.space_ops",
+    "manimlib.utils.tex",
+]
+
+
+def _get_public_names(module) -> list[str]:
+    """
+    The names "from module import *" would bring in
+    """
+    if hasattr(module, "__all__"):
+        return list(module.__all__)
+    return [name for name in vars(module) if not name.startswith("_")]
+
+
+def _load_public_namespace() -> list[str]:
+    """
+    Imports all of _PUBLIC_MODULES, adding their names to this
+    namespace, and sets __all__ to the list of those names
+    """
+    if "__all__" not in globals():
+        namespace = dict()
+        for module_name in _PUBLIC_MODULES:
+            module = importlib.import_module(module_name)
+            for name in _get_public_names(module):
+                namespace[name] = getattr(module, name)
+        globals().update(namespace)
+        # Star imports also brought in the submodules imported along the way
+        submodules = [
+            name for name, value in globals().items()
+            if getattr(value, "__name__", None) == f"{__name__}.{name}"
+        ]
+        globals()["__all__"] = [*namespace, *submodules]
+    return globals()["__all__"]
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        return _load_public_namespace()
+    if not name.startswith("__"):
+        # Submodules, as in "from manimlib import extract_scene"
+        if importlib.util.find_spec(f"{__name__}.{name}") is not None:
+            return importlib.import_module(f"{__name__}.{name}")
+        for module_name in reversed(_PUBLIC_MODULES):
+            module = importlib.import_module(module_name)
+            if name in _get_public_names(module):
+                globals()[name] = getattr(module, name)
+                return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_load_public_namespace()})
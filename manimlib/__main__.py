@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 from manimlib import __version__
 import manimlib.config
-import manimlib.extract_scene
 import manimlib.logger
 import manimlib.utils.init_config
 
@@ -18,8 +17,11 @@ def main():
     if args.config:
         manimlib.utils.init_config.init_customization()
     else:
+        # Imported only here, so that the options above don't
+        # wait on importing everything needed to render
+        from manimlib import extract_scene
         config = manimlib.config.get_configuration(args)
-        scenes = manimlib.extract_scene.main(config)
+        scenes = extract_scene.main(config)
 
         for scene in scenes:
             scene.run()
@@ -31,6 +31,19 @@ class ShowPartial(Animation, ABC):
         self.should_match_start = should_match_start
         super().__init__(mobject, **kwargs)
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        # Submobjects using VMobject.pointwise_become_partial are cut down together
+        alpha = self.time_spanned_alpha(alpha)
+        batch = []
+        for i, (submob, start_submob) in enumerate(self.families):
+            sub_alpha = self.get_sub_alpha(alpha, i, len(self.families))
+            if type(submob).pointwise_become_partial is VMobject.pointwise_become_partial:
+                batch.append((submob, start_submob, *self.get_bounds(sub_alpha)))
+            else:
+                self.interpolate_submobject(submob, start_submob, sub_alpha)
+        if batch:
+            VMobject.pointwise_become_partial_batch(*zip(*batch))
+
     def interpolate_submobject(
         self,
         submob: VMobject,
@@ -122,6 +135,20 @@ class DrawBorderThenFill(Animation):
     def get_all_mobjects(self) -> list[Mobject]:
         return [*super().get_all_mobjects(), self.outline]
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        # Submobjects whose outlines are still being drawn are cut down together
+        alpha = self.time_spanned_alpha(alpha)
+        batch = []
+        for i, (submob, start, outline) in enumerate(self.families):
+            sub_alpha = self.get_sub_alpha(alpha, i, len(self.families))
+            index, subalpha = integer_interpolate(0, 2, sub_alpha)
+            if index == 0 and type(submob).pointwise_become_partial is VMobject.pointwise_become_partial:
+                batch.append((submob, outline, 0, subalpha))
+            else:
+                self.interpolate_submobject(submob, start, outline, sub_alpha)
+        if batch:
+            VMobject.pointwise_become_partial_batch(*zip(*batch))
+
     def interpolate_submobject(
         self,
         submob: VMobject,
@@ -15,6 +15,9 @@ from manimlib.constants import FRAME_WIDTH
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.render_backend import create_standalone_context
+from manimlib.utils.render_backend import get_missing_capabilities
+from manimlib.utils.render_backend import get_renderer_description
 
 from typing import TYPE_CHECKING
 
@@ -47,6 +50,11 @@ class Camera(object):
         # without multisampling, for 3d scenes one might want
         # to set samples to be greater than 0.
         samples: int = 0,
+        # How to create the OpenGL context when there is no window,
+        # one of "default", "egl" or "software"
+        render_backend: str = "default",
+        # Threads for Mesa's llvmpipe when render_backend is "software"
+        software_render_threads: int = 0,
     ):
         self.background_image = background_image
         self.window = window
@@ -58,6 +66,8 @@ class Camera(object):
         self.pixel_array_dtype = pixel_array_dtype
         self.light_source_position = light_source_position
         self.samples = samples
+        self.render_backend = render_backend
+        self.software_render_threads = software_render_threads
 
         self.rgb_max_val: float = np.iinfo(self.pixel_array_dtype).max
         self.background_rgba: list[float] = list(color_to_rgba(
@@ -74,7 +84,14 @@ class Camera(object):
 
     def init_context(self) -> None:
         if self.window is None:
-            self.ctx: moderngl.Context = moderngl.create_standalone_context()
+            self.ctx: moderngl.Context = create_standalone_context(
+                self.render_backend, self.software_render_threads
+            )
+            missing = get_missing_capabilities(self.ctx)
+            if missing:
+                raise Exception("{} is missing {}".format(
+                    get_renderer_description(self.ctx), ", ".join(missing)
+                ))
         else:
             self.ctx: moderngl.Context = self.window.ctx
 
@@ -88,6 +105,10 @@ class Camera(object):
         # This is the frame buffer we'll draw into when emitting frames
         self.draw_fbo = self.get_fbo(samples=0)
 
+        # When previewing at reduced resolution, frames are drawn here,
+        # and then stretched over the window
+        self.reduced_fbo = None
+
         if self.window is None:
             self.window_fbo = None
             self.fbo = self.fbo_for_files
@@ -103,10 +124,28 @@ class Camera(object):
     def use_window_fbo(self, use: bool = True):
         assert self.window is not None
         if use:
-            self.fbo = self.window_fbo
+            self.fbo = self.reduced_fbo or self.window_fbo
         else:
             self.fbo = self.fbo_for_files
 
+    def set_preview_resolution(self, scale: float | None) -> None:
+        """
+        With a scale, frames for the window are drawn at that fraction of
+        its resolution, without multisampling, and stretched to fill it.
+        With None, they are drawn straight into the window again.
+        """
+        assert self.window is not None
+        if self.reduced_fbo is not None:
+            self.reduced_fbo.release()
+            self.reduced_fbo = None
+        if scale is not None:
+            size = tuple(max(int(scale * n), 1) for n in self.window_fbo.size)
+            self.reduced_fbo = self.ctx.framebuffer(
+                color_attachments=self.ctx.texture(size, components=self.n_channels),
+                depth_attachment=self.ctx.depth_renderbuffer(size),
+            )
+        self.use_window_fbo(True)
+
     # Methods associated with the frame buffer
     def get_fbo(
         self,
@@ -129,15 +168,20 @@ class Camera(object):
         if self.window:
             self.window.clear()
 
-    def blit(self, src_fbo, dst_fbo):
+    def blit(self, src_fbo, dst_fbo, flip: bool = False):
         """
-        Copy blocks between fbo's using Blit
+        Copy blocks between fbo's using Blit, optionally
+        turning the image upside down
         """
         gl.glBindFramebuffer(gl.GL_READ_FRAMEBUFFER, src_fbo.glo)
         gl.glBindFramebuffer(gl.GL_DRAW_FRAMEBUFFER, dst_fbo.glo)
+        # Viewports start at the origin, so they double as the corners to blit
+        x0, y0, x1, y1 = dst_fbo.viewport
+        if flip:
+            y0, y1 = y1, y0
         gl.glBlitFramebuffer(
             *src_fbo.viewport,
-            *dst_fbo.viewport,
+            x0, y0, x1, y1,
             gl.GL_COLOR_BUFFER_BIT, gl.GL_LINEAR
         )
 
@@ -149,6 +193,28 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def read_fbo_into(
+        self,
+        buffer: moderngl.Buffer,
+        dtype: str = 'f1',
+        top_row_first: bool = False,
+    ) -> None:
+        """
+        When buffer is a pixel buffer object, the read happens asynchronously,
+        only blocking once the contents of that buffer are read out.
+
+        OpenGL gives rows from the bottom of the image up, but with top_row_first
+        the image is flipped while being copied on the GPU, so that they come out
+        in the order which image and video formats expect.
+        """
+        self.blit(self.fbo, self.draw_fbo, flip=top_row_first)
+        self.draw_fbo.read_into(
+            buffer,
+            viewport=self.draw_fbo.viewport,
+            components=self.n_channels,
+            dtype=dtype,
+        )
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -233,10 +299,9 @@ class Camera(object):
             mobject.render(self.ctx, self.uniforms)
 
         if self.window:
-            self.window.swap_buffers()
             if self.fbo is not self.window_fbo:
                 self.blit(self.fbo, self.window_fbo)
-                self.window.swap_buffers()
+            self.window.swap_buffers()
 
     def refresh_uniforms(self) -> None:
         frame = self.frame
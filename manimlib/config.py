@@ -13,6 +13,7 @@ import yaml
 from manimlib.logger import log
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.init_config import init_customization
+from manimlib.utils.render_backend import RENDER_BACKENDS
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -157,6 +158,18 @@ def parse_cli():
             "-c", "--color",
             help="Background color",
         )
+        parser.add_argument(
+            "--render_backend",
+            choices=RENDER_BACKENDS,
+            help="How to create the OpenGL context when there is no preview " + \
+                 "window, \"software\" being for machines with no GPU",
+        )
+        parser.add_argument(
+            "--compare_backend",
+            choices=RENDER_BACKENDS,
+            help="Render the last frame of each scene with both the configured " + \
+                 "backend and this one, and report how much they differ",
+        )
         parser.add_argument(
             "--leave_progress_bars",
             action="store_true",
@@ -167,16 +180,52 @@ def parse_cli():
             action="store_true",
             help="Show progress bar for each animation",
         )
+        parser.add_argument(
+            "--profile_updaters",
+            action="store_true",
+            help="Report how much time is spent in each updater",
+        )
+        parser.add_argument(
+            "--adaptive_preview",
+            action="store_true",
+            help="In the preview window, drop frames and lower the rendering quality " + \
+                 "when needed to keep up with the frame rate",
+        )
         parser.add_argument(
             "--prerun",
             action="store_true",
             help="Calculate total framecount, to display in a progress bar, by doing " + \
                  "an initial run of the scene which skips animations."
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="When writing to file, render scenes in this many parallel processes",
+        )
+        parser.add_argument(
+            "--split_scenes",
+            action="store_true",
+            help="With --workers, also split each scene into ranges of animations " + \
+                 "which are rendered in separate processes, then concatenated",
+        )
         parser.add_argument(
             "--video_dir",
             help="Directory to write video",
         )
+        parser.add_argument(
+            "--encoding_profile",
+            help="Name of the set of encoding settings, from encoding_profiles " + \
+                 "in the configuration, to write movies with, e.g. preview, " + \
+                 "archive or intermediate",
+        )
+        parser.add_argument(
+            "--frame_sink",
+            action="append",
+            help="Also send raw rgba frames to a named pipe or file path, " + \
+                 "\"tcp:HOST:PORT\", \"unix:SOCKET_PATH\" or \"images:DIRECTORY\". " + \
+                 "Can be given more than once",
+        )
         parser.add_argument(
             "--config_file",
             help="Path to the custom configuration file",
@@ -399,6 +448,9 @@ def get_output_directory(args: Namespace, custom_config: dict) -> str:
 
 
 def get_file_writer_config(args: Namespace, custom_config: dict) -> dict:
+    # Imported here, as frame_sinks depends on constants, which depends on this module
+    from manimlib.scene.frame_sinks import get_frame_sink
+
     result = {
         "write_to_movie": not args.skip_animations and args.write_file,
         "save_last_frame": args.skip_animations and args.write_file,
@@ -408,6 +460,7 @@ def get_file_writer_config(args: Namespace, custom_config: dict) -> dict:
         "movie_file_extension": get_file_ext(args),
         "output_directory": get_output_directory(args, custom_config),
         "file_name": args.file_name,
+        "frame_sinks": [get_frame_sink(spec) for spec in args.frame_sink or []],
         "input_file_path": args.file or "",
         "open_file_upon_completion": args.open,
         "show_file_location_upon_completion": args.finder,
@@ -415,6 +468,17 @@ def get_file_writer_config(args: Namespace, custom_config: dict) -> dict:
         **custom_config["file_writer_config"],
     }
 
+    profile_name = args.encoding_profile or custom_config["encoding_profile"]
+    if profile_name:
+        profiles = custom_config["encoding_profiles"]
+        if profile_name not in profiles:
+            log.error(f"No encoding profile named {profile_name}, options are {', '.join(profiles)}")
+            sys.exit(2)
+        result.update(profiles[profile_name])
+        if args.transparent or args.gif:
+            # These need their own container formats, whatever the profile
+            result["movie_file_extension"] = get_file_ext(args)
+
     if args.vcodec:
         result["video_codec"] = args.vcodec
     elif args.transparent:
@@ -478,11 +542,13 @@ def get_camera_config(args: Namespace, custom_config: dict) -> dict:
             "frame_shape": ((width / height) * get_frame_height(), get_frame_height()),
         },
         "fps": fps,
+        "render_backend": args.render_backend or custom_config["render_backend"],
+        "software_render_threads": custom_config["software_render_threads"],
     })
 
     try:
         bg_color = args.color or custom_config["style"]["background_color"]
-        camera_config["background_color"] = colour.Color(bg_color)
+        camera_config["background_color"] = colour.Color(bg_color).hex_l
     except ValueError as err:
         log.error("Please use a valid color")
         log.error(err)
@@ -518,7 +584,12 @@ def get_configuration(args: Namespace) -> dict:
         "presenter_mode": args.presenter_mode,
         "leave_progress_bars": args.leave_progress_bars,
         "show_animation_progress": args.show_animation_progress,
+        "profile_updaters": args.profile_updaters,
+        "adaptive_preview": args.adaptive_preview,
         "prerun": args.prerun,
+        "workers": args.workers,
+        "split_scenes": args.split_scenes,
+        "compare_backend": args.compare_backend,
         "embed_exception_mode": custom_config["embed_exception_mode"],
         "embed_error_sound": custom_config["embed_error_sound"],
     }
@@ -4,6 +4,7 @@ import numpy as np
 
 from manimlib.event_handler.event_listner import EventListener
 from manimlib.event_handler.event_type import EventType
+from manimlib.utils.spatial_index import BoundingBoxIndex
 
 
 class EventDispatcher(object):
@@ -18,10 +19,13 @@ class EventDispatcher(object):
         self.mouse_drag_point = np.array((0., 0., 0.))
         self.pressed_keys: set[int] = set()
         self.draggable_object_listners: list[EventListener] = []
+        # Lazily built, and reset whenever listners of that type change
+        self.listner_indices: dict[EventType, BoundingBoxIndex] = dict()
 
     def add_listner(self, event_listner: EventListener):
         assert isinstance(event_listner, EventListener)
         self.event_listners[event_listner.event_type].append(event_listner)
+        self.listner_indices.pop(event_listner.event_type, None)
         return self
 
     def remove_listner(self, event_listner: EventListener):
@@ -32,8 +36,18 @@ class EventDispatcher(object):
         except:
             # raise ValueError("Handler is not handling this event, so cannot remove it.")
             pass
+        self.listner_indices.pop(event_listner.event_type, None)
         return self
 
+    def get_listners_touching_mouse(self, event_type: EventType) -> list[EventListener]:
+        listners = self.event_listners[event_type]
+        if event_type not in self.listner_indices:
+            self.listner_indices[event_type] = BoundingBoxIndex(
+                listner.mobject for listner in listners
+            )
+        index = self.listner_indices[event_type]
+        return [listners[i] for i in index.get_indices_touching_point(self.mouse_point)]
+
     def dispatch(self, event_type: EventType, **event_data):
         if event_type == EventType.MouseMotionEvent:
             self.mouse_point = event_data["point"]
@@ -44,11 +58,9 @@ class EventDispatcher(object):
         elif event_type == EventType.KeyReleaseEvent:
             self.pressed_keys.difference_update({event_data["symbol"]})  # Modifiers?
         elif event_type == EventType.MousePressEvent:
-            self.draggable_object_listners = [
-                listner
-                for listner in self.event_listners[EventType.MouseDragEvent]
-                if listner.mobject.is_point_touching(self.mouse_point)
-            ]
+            self.draggable_object_listners = self.get_listners_touching_mouse(
+                EventType.MouseDragEvent
+            )
         elif event_type == EventType.MouseReleaseEvent:
             self.draggable_object_listners = []
 
@@ -62,12 +74,10 @@ class EventDispatcher(object):
                     return propagate_event
 
         elif event_type.value.startswith('mouse'):
-            for listner in self.event_listners[event_type]:
-                if listner.mobject.is_point_touching(self.mouse_point):
-                    propagate_event = listner.callback(
-                        listner.mobject, event_data)
-                    if propagate_event is not None and propagate_event is False:
-                        return propagate_event
+            for listner in self.get_listners_touching_mouse(event_type):
+                propagate_event = listner.callback(listner.mobject, event_data)
+                if propagate_event is not None and propagate_event is False:
+                    return propagate_event
 
         elif event_type.value.startswith('key'):
             for listner in self.event_listners[event_type]:
@@ -1,11 +1,20 @@
+from concurrent.futures import ProcessPoolExecutor
 import copy
 import inspect
+import multiprocessing
+import os
 import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
 
 from manimlib.config import get_custom_config
+from manimlib.config import get_module
 from manimlib.logger import log
 from manimlib.scene.interactive_scene import InteractiveScene
 from manimlib.scene.scene import Scene
+from manimlib.utils.file_ops import get_sorted_integer_files
 
 
 class BlankScene(InteractiveScene):
@@ -61,20 +70,26 @@ def get_scene_config(config):
     }
 
 
-def compute_total_frames(scene_class, scene_config):
-    """
-    When a scene is being written to file, a copy of the scene is run with
-    skip_animations set to true so as to count how many frames it will require.
-    This allows for a total progress bar on rendering, and also allows runtime
-    errors to be exposed preemptively for long running scenes.
-    """
+def prerun_scene(scene_class, scene_config):
     pre_config = copy.deepcopy(scene_config)
     pre_config["file_writer_config"]["write_to_movie"] = False
     pre_config["file_writer_config"]["save_last_frame"] = False
     pre_config["file_writer_config"]["quiet"] = True
+    pre_config["file_writer_config"]["frame_sinks"] = []
     pre_config["skip_animations"] = True
     pre_scene = scene_class(**pre_config)
     pre_scene.run()
+    return pre_scene
+
+
+def compute_total_frames(scene_class, scene_config):
+    """
+    When a scene is being written to file, a copy of the scene is run with
+    skip_animations set to true so as to count how many frames it will require.
+    This allows for a total progress bar on rendering, and also allows runtime
+    errors to be exposed preemptively for long running scenes.
+    """
+    pre_scene = prerun_scene(scene_class, scene_config)
     total_time = pre_scene.time - pre_scene.skip_time
     return int(total_time * scene_config["camera_config"]["fps"])
 
@@ -86,9 +101,9 @@ def scene_from_class(scene_class, scene_config, config):
     return scene_class(**scene_config)
 
 
-def get_scenes_to_render(all_scene_classes, scene_config, config):
+def get_scene_classes_to_render(all_scene_classes, config):
     if config["write_all"]:
-        return [sc(**scene_config) for sc in all_scene_classes]
+        return all_scene_classes
 
     names_to_classes = {sc.__name__ : sc for sc in all_scene_classes}
     scene_names = config["scene_names"]
@@ -103,13 +118,205 @@ def get_scenes_to_render(all_scene_classes, scene_config, config):
         classes_to_run = [all_scene_classes[0]]
     else:
         classes_to_run = prompt_user_for_choice(all_scene_classes)
+    return classes_to_run
+
 
+def get_scenes_to_render(scene_classes, scene_config, config):
+    if config["write_all"]:
+        return [sc(**scene_config) for sc in scene_classes]
     return [
         scene_from_class(scene_class, scene_config, config)
-        for scene_class in classes_to_run
+        for scene_class in scene_classes
     ]
 
 
+def render_scene_in_subprocess(file_path, scene_name, scene_config, prerun):
+    """
+    Runs in a separate process, so the scene class is looked up by
+    re-importing the module at file_path rather than being pickled.
+
+    Returns the path of the movie written, along with the arguments
+    of each sound added to it.
+    """
+    module = get_module(file_path)
+    names_to_classes = {
+        sc.__name__: sc
+        for sc in get_scene_classes_from_module(module)
+    }
+    scene = scene_from_class(
+        names_to_classes[scene_name], scene_config, dict(prerun=prerun)
+    )
+    scene.run()
+    file_writer = scene.file_writer
+    if file_writer.write_to_movie:
+        file_path = file_writer.get_movie_file_path()
+    elif file_writer.save_last_frame:
+        file_path = file_writer.get_image_file_path()
+    else:
+        file_path = None
+    return file_path, file_writer.added_sounds
+
+
+def get_animation_ranges(scene_class, scene_config, n_ranges):
+    """
+    Uses a skipped run of the scene to count its animations, and divides
+    those between the configured start and end animation numbers into at
+    most n_ranges consecutive ranges
+    """
+    start = scene_config.get("start_at_animation_number") or 0
+    end = scene_config.get("end_at_animation_number")
+    n_plays = prerun_scene(scene_class, scene_config).num_plays
+    if end is not None:
+        n_plays = min(n_plays, end)
+    indices = np.arange(start, n_plays)
+    if len(indices) == 0:
+        return []
+    splits = np.array_split(indices, min(n_ranges, len(indices)))
+    return [(int(split[0]), int(split[-1]) + 1) for split in splits]
+
+
+def get_animation_range_config(scene_config, directory, start, end):
+    range_config = copy.deepcopy(scene_config)
+    range_config["start_at_animation_number"] = start
+    range_config["end_at_animation_number"] = end
+    range_config["file_writer_config"].update(
+        # Each range is written as if it were a single, long, partial
+        # movie file, so that combine_movie_files can stitch them together
+        output_directory=directory,
+        file_name="{:05}".format(start),
+        break_into_partial_movies=False,
+        mix_sounds=False,
+        quiet=True,
+        open_file_upon_completion=False,
+        show_file_location_upon_completion=False,
+    )
+    return range_config
+
+
+def render_scenes_in_parallel(scene_classes, scene_config, config):
+    """
+    Renders each scene in its own process, or, if split_scenes is set,
+    renders ranges of each scene's animations in their own processes
+    and then concatenates the results.
+    """
+    file_path = config["module"].__file__
+    fw_config = scene_config["file_writer_config"]
+    split_scenes = config["split_scenes"] and fw_config["write_to_movie"]
+    worker_config = copy.deepcopy(scene_config)
+    worker_config["file_writer_config"]["quiet"] = True
+
+    executor = ProcessPoolExecutor(
+        max_workers=config["workers"],
+        # Forking a process holding an OpenGL context is unsafe
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    with executor:
+        if not split_scenes:
+            futures = [
+                executor.submit(
+                    render_scene_in_subprocess,
+                    file_path, sc.__name__, worker_config, config["prerun"]
+                )
+                for sc in scene_classes
+            ]
+            for future in futures:
+                movie_path, _ = future.result()
+                if movie_path is not None and not fw_config["quiet"]:
+                    log.info(f"File ready at {movie_path}")
+            return
+
+        scenes_and_futures = []
+        for scene_class in scene_classes:
+            ranges = get_animation_ranges(scene_class, scene_config, config["workers"])
+            # This scene never runs, it is only used to combine the
+            # movie files rendered for each range of animations.  It keeps
+            # the configured start and end, which combine_movie_files uses
+            # to choose which of those files to include.
+            full_config = copy.deepcopy(scene_config)
+            full_config["file_writer_config"]["break_into_partial_movies"] = True
+            scene = scene_class(**full_config)
+            scene.num_plays = ranges[-1][1] if ranges else 0
+            directory = scene.file_writer.partial_movie_directory
+            # Clear out partial movie files from previous renders
+            get_sorted_integer_files(directory, remove_indices_greater_than=-1)
+            futures = [
+                executor.submit(
+                    render_scene_in_subprocess,
+                    file_path, scene_class.__name__,
+                    get_animation_range_config(worker_config, directory, start, end),
+                    False,
+                )
+                for start, end in ranges
+            ]
+            scenes_and_futures.append((scene, futures))
+
+        for scene, futures in scenes_and_futures:
+            for future in futures:
+                _, added_sounds = future.result()
+                for sound_args in added_sounds:
+                    scene.file_writer.add_sound(*sound_args)
+            scene.file_writer.finish()
+
+
+def compare_render_backends(scene_classes, scene_config, config):
+    """
+    Renders the last frame of each scene with both the configured render
+    backend and config["compare_backend"], and logs how far apart their
+    pixel values are, out of 255.  Each backend gets its own process, since
+    the driver settings a backend chooses last for the life of a process.
+
+    Returns a dictionary mapping scene names to the largest and
+    mean differences.
+    """
+    file_path = config["module"].__file__
+    backends = (
+        scene_config["camera_config"]["render_backend"],
+        config["compare_backend"],
+    )
+    results = dict()
+    with tempfile.TemporaryDirectory() as directory:
+        futures = []
+        for backend in backends:
+            backend_config = copy.deepcopy(scene_config)
+            backend_config["camera_config"]["render_backend"] = backend
+            backend_config["skip_animations"] = True
+            backend_config["preview"] = False
+            backend_config["file_writer_config"].update(
+                write_to_movie=False,
+                save_last_frame=True,
+                output_directory=os.path.join(directory, backend),
+                quiet=True,
+                open_file_upon_completion=False,
+                show_file_location_upon_completion=False,
+                frame_sinks=[],
+            )
+            executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            with executor:
+                futures.append([
+                    executor.submit(
+                        render_scene_in_subprocess,
+                        file_path, sc.__name__, backend_config, False
+                    )
+                    for sc in scene_classes
+                ])
+
+        for scene_class, *scene_futures in zip(scene_classes, *futures):
+            frames = [
+                np.array(Image.open(future.result()[0]), dtype=float)
+                for future in scene_futures
+            ]
+            diffs = abs(frames[0] - frames[1])
+            results[scene_class.__name__] = (diffs.max(), diffs.mean())
+            log.info(
+                f"{scene_class.__name__}: {backends[1]} differs from {backends[0]} " + \
+                f"by at most {diffs.max():.0f}, and by {diffs.mean():.3f} on average"
+            )
+    return results
+
+
 def get_scene_classes_from_module(module):
     if hasattr(module, "SCENES_IN_ORDER"):
         return module.SCENES_IN_ORDER
@@ -131,5 +338,15 @@ def main(config):
         return [BlankScene(**scene_config)]
 
     all_scene_classes = get_scene_classes_from_module(module)
-    scenes = get_scenes_to_render(all_scene_classes, scene_config, config)
+    scene_classes = get_scene_classes_to_render(all_scene_classes, config)
+    if config["compare_backend"]:
+        compare_render_backends(scene_classes, scene_config, config)
+        return []
+    if config["workers"] > 1 and not config["preview"]:
+        if scene_config["file_writer_config"]["frame_sinks"]:
+            log.warning("Frame sinks need frames in order, so scenes are not rendered in parallel")
+        else:
+            render_scenes_in_parallel(scene_classes, scene_config, config)
+            return []
+    scenes = get_scenes_to_render(scene_classes, scene_config, config)
     return scenes
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import partial
 import numbers
 
 import numpy as np
@@ -188,11 +189,8 @@ class CoordinateSystem(ABC):
         # sample frequency
         t_range[2] /= self.num_sampled_graph_points_per_tick
 
-        def parametric_function(t: float) -> Vect3:
-            return self.c2p(t, function(t))
-
         graph = ParametricCurve(
-            parametric_function,
+            partial(self._get_graph_point, function),
             t_range=tuple(t_range),
             **kwargs
         )
@@ -209,14 +207,21 @@ class CoordinateSystem(ABC):
         function: Callable[[float], Vect3],
         **kwargs
     ) -> ParametricCurve:
-        dim = self.dimension
         graph = ParametricCurve(
-            lambda t: self.coords_to_point(*function(t)[:dim]),
+            partial(self._get_parametric_curve_point, function),
             **kwargs
         )
         graph.underlying_function = function
         return graph
 
+    # These are bound with partial, rather than wrapped in closures,
+    # so that the curves they make can be saved, see Mobject.save_to_file
+    def _get_graph_point(self, function: Callable[[float], float], t: float) -> Vect3:
+        return self.c2p(t, function(t))
+
+    def _get_parametric_curve_point(self, function: Callable[[float], Vect3], t: float) -> Vect3:
+        return self.coords_to_point(*function(t)[:self.dimension])
+
     def input_to_graph_point(
         self,
         x: float,
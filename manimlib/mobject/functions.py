@@ -11,10 +11,12 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, Sequence, Tuple
-    from manimlib.typing import ManimColor, Vect3
+    from manimlib.typing import ManimColor, Vect3, Vect3Array
 
 
 class ParametricCurve(VMobject):
+    max_sampling_refinements: int = 8
+
     def __init__(
         self,
         t_func: Callable[[float], Sequence[float] | Vect3],
@@ -23,6 +25,11 @@ class ParametricCurve(VMobject):
         # TODO, automatically figure out discontinuities
         discontinuities: Sequence[float] = [],
         use_smoothing: bool = True,
+        # If true, samples are added where the curve bends away from
+        # the chords between the samples spaced by the step of t_range,
+        # and removed where it is flat, to within sampling_tolerance
+        adaptive_sampling: bool = False,
+        sampling_tolerance: float = 1e-3,
         **kwargs
     ):
         self.t_func = t_func
@@ -30,11 +37,88 @@ class ParametricCurve(VMobject):
         self.epsilon = epsilon
         self.discontinuities = discontinuities
         self.use_smoothing = use_smoothing
+        self.adaptive_sampling = adaptive_sampling
+        self.sampling_tolerance = sampling_tolerance
         super().__init__(**kwargs)
 
     def get_point_from_function(self, t: float) -> Vect3:
         return np.array(self.t_func(t))
 
+    def get_points_from_function(self, t_values: np.ndarray) -> Vect3Array:
+        """
+        Evaluates t_func on all of t_values in one call when it supports arrays,
+        returning either an array of points or a list of coordinate arrays, and
+        otherwise falls back to evaluating it value by value
+        """
+        n = len(t_values)
+        if n > self.dim:
+            try:
+                result = self.t_func(t_values)
+                if isinstance(result, np.ndarray):
+                    points = result.astype(float)
+                else:
+                    # Lists like [t, f(t), 0] mix arrays and scalars
+                    points = np.array(np.broadcast_arrays(*result), dtype=float)
+                if points.shape == (self.dim, n):
+                    points = points.T
+                if points.shape == (n, self.dim) and all(
+                    np.allclose(points[i], self.t_func(t_values[i]), equal_nan=True)
+                    for i in {0, n // 2, n - 1}
+                ):
+                    return points
+            except Exception:
+                pass
+        return np.array([self.t_func(t) for t in t_values])
+
+    def refine_samples(
+        self,
+        t_values: np.ndarray,
+        points: Vect3Array
+    ) -> tuple[np.ndarray, Vect3Array]:
+        # Repeatedly split segments whose midpoint strays too far from their chord
+        active = np.ones(len(t_values) - 1, dtype=bool)
+        for _ in range(self.max_sampling_refinements):
+            indices = np.where(active)[0]
+            if len(indices) == 0:
+                break
+            mid_ts = 0.5 * (t_values[indices] + t_values[indices + 1])
+            mid_points = self.get_points_from_function(mid_ts)
+            chord_mids = 0.5 * (points[indices] + points[indices + 1])
+            to_split = np.linalg.norm(mid_points - chord_mids, axis=1) > self.sampling_tolerance
+            split_indices = indices[to_split]
+            t_values = np.insert(t_values, split_indices + 1, mid_ts[to_split])
+            points = np.insert(points, split_indices + 1, mid_points[to_split], axis=0)
+            # Only the two halves of each split segment need checking again
+            active = np.zeros(len(t_values) - 1, dtype=bool)
+            first_halves = split_indices + np.arange(len(split_indices))
+            active[first_halves] = True
+            active[first_halves + 1] = True
+        return t_values, points
+
+    def coarsen_samples(self, points: Vect3Array) -> Vect3Array:
+        # Repeatedly remove every other sample which lies within tolerance of
+        # the line between its neighbors.  Each gap tracks how far previously
+        # removed samples within it might be from its chord, so that the
+        # total error stays bounded by the tolerance.
+        gap_errors = np.zeros(len(points) - 1)
+        while len(points) > 2:
+            indices = np.arange(1, len(points) - 1, 2)
+            prev_points = points[indices - 1]
+            vects = points[indices + 1] - prev_points
+            offsets = points[indices] - prev_points
+            norms = np.linalg.norm(vects, axis=1)
+            norms[norms == 0] = 1
+            dists = np.linalg.norm(np.cross(offsets, vects), axis=1) / norms
+            errors = dists + np.maximum(gap_errors[indices - 1], gap_errors[indices])
+            to_remove = errors < self.sampling_tolerance
+            if not to_remove.any():
+                break
+            # The gap before each removed sample absorbs the one after it
+            gap_errors[indices[to_remove] - 1] = errors[to_remove]
+            gap_errors = np.delete(gap_errors, indices[to_remove])
+            points = np.delete(points, indices[to_remove], axis=0)
+        return points
+
     def init_points(self):
         t_min, t_max, step = self.t_range
 
@@ -43,8 +127,11 @@ class ParametricCurve(VMobject):
         boundary_times = [t_min, t_max, *(jumps - self.epsilon), *(jumps + self.epsilon)]
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = [*np.arange(t1, t2, step), t2]
-            points = np.array([self.t_func(t) for t in t_range])
+            t_range = np.array([*np.arange(t1, t2, step), t2])
+            points = self.get_points_from_function(t_range)
+            if self.adaptive_sampling and len(points) > 1:
+                t_range, points = self.refine_samples(t_range, points)
+                points = self.coarsen_samples(points)
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
         if self.use_smoothing:
@@ -78,10 +165,10 @@ class FunctionGraph(ParametricCurve):
         self.function = function
         self.x_range = x_range
 
-        def parametric_function(t):
-            return [t, function(t), 0]
+        super().__init__(self.parametric_function, self.x_range, **kwargs)
 
-        super().__init__(parametric_function, self.x_range, **kwargs)
+    def parametric_function(self, t: float) -> list[float]:
+        return [t, self.function(t), 0]
 
 
 class ImplicitFunction(VMobject):
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import copy
 from functools import wraps
+import inspect
 import itertools as it
 import os
 import pickle
 import random
 import sys
+import time
 
 import moderngl
 import numbers
@@ -68,6 +70,10 @@ class Mobject(object):
     dim: int = 3
     shader_folder: str = ""
     render_primitive: int = moderngl.TRIANGLE_STRIP
+    # When set to a dict, the time spent in each updater is accumulated into it
+    updater_profile: Optional[dict[str, list[float]]] = None
+    # Set while get_snapshot is copying, see there
+    _copies_share_data: bool = False
     # Must match in attributes of vert shader
     data_dtype: np.dtype = np.dtype([
         ('point', np.float32, (3,)),
@@ -109,6 +115,14 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        self._data_version: int = 0
+        # Counts changes to data computed lazily from what's already there,
+        # which don't call for updaters depending on this mobject to rerun
+        self._derived_data_version: int = 0
+        # Only counts changes to points, for data derived from them
+        self._points_version: int = 0
+        # Whether the data array might also belong to a snapshot
+        self._data_is_shared: bool = False
         self.shader_code_replacements: dict[str, str] = dict()
 
         self.init_data()
@@ -204,15 +218,47 @@ class Mobject(object):
 
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version += 1
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
         return self
 
+    def note_changed_derived_data(self) -> Self:
+        """
+        For data recomputed from the rest, like joint angles, which renderers
+        need to re-read but which updaters reading this mobject can ignore
+        """
+        self._derived_data_version += 1
+        return self.note_changed_data(recurse_up=False)
+
+    def get_input_version(self) -> int:
+        """
+        Version of the data as seen by updaters reading from this mobject
+        """
+        return self._data_version - self._derived_data_version
+
+    def note_changed_points(self) -> Self:
+        self._points_version += 1
+        return self.note_changed_data()
+
+    def unshare_data(self) -> Self:
+        """
+        If this mobject's data array might be shared with a snapshot
+        (see get_snapshot), replaces it with a copy of its own.  Anything
+        writing to the data array in place should call this first, as the
+        affects_data family of decorators does.
+        """
+        if self._data_is_shared:
+            self.data = self.data.copy()
+            self._data_is_shared = False
+        return self
+
     @staticmethod
     def affects_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            self.unshare_data()
             result = func(self, *args, **kwargs)
             self.note_changed_data()
             return result
@@ -222,21 +268,45 @@ class Mobject(object):
     def affects_family_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            for mob in self.get_family():
+                mob.unshare_data()
             result = func(self, *args, **kwargs)
             for mob in self.family_members_with_points():
                 mob.note_changed_data()
             return result
         return wrapper
 
+    @staticmethod
+    def affects_points(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            self.unshare_data()
+            result = func(self, *args, **kwargs)
+            self.note_changed_points()
+            return result
+        return wrapper
+
+    @staticmethod
+    def affects_family_points(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            for mob in self.get_family():
+                mob.unshare_data()
+            result = func(self, *args, **kwargs)
+            for mob in self.family_members_with_points():
+                mob.note_changed_points()
+            return result
+        return wrapper
+
     # Only these methods should directly affect points
-    @affects_data
+    @affects_points
     def set_data(self, data: np.ndarray) -> Self:
         assert data.dtype == self.data.dtype
         self.resize_points(len(data))
         self.data[:] = data
         return self
 
-    @affects_data
+    @affects_points
     def resize_points(
         self,
         new_length: int,
@@ -252,13 +322,13 @@ class Mobject(object):
         self.refresh_bounding_box()
         return self
 
-    @affects_data
+    @affects_points
     def set_points(self, points: Vect3Array | list[Vect3]) -> Self:
         self.resize_points(len(points), resize_func=resize_preserving_order)
         self.data["point"][:] = points
         return self
 
-    @affects_data
+    @affects_points
     def append_points(self, new_points: Vect3Array) -> Self:
         n = self.get_num_points()
         self.resize_points(n + len(new_points))
@@ -269,13 +339,13 @@ class Mobject(object):
         self.refresh_bounding_box()
         return self
 
-    @affects_family_data
+    @affects_family_points
     def reverse_points(self) -> Self:
         for mob in self.get_family():
             mob.data[:] = mob.data[::-1]
         return self
 
-    @affects_family_data
+    @affects_family_points
     def apply_points_function(
         self,
         func: Callable[[np.ndarray], np.ndarray],
@@ -339,12 +409,13 @@ class Mobject(object):
         return self.bounding_box
 
     def compute_bounding_box(self) -> Vect3Array:
+        # The (cached) boxes of submobjects already account for their families
         all_points = np.vstack([
             self.get_points(),
             *(
-                mob.get_bounding_box()
-                for mob in self.get_family()[1:]
-                if mob.has_points()
+                submob.get_bounding_box()
+                for submob in self.submobjects
+                if submob.family_has_points()
             )
         ])
         if len(all_points) == 0:
@@ -356,6 +427,9 @@ class Mobject(object):
             mids = (mins + maxs) / 2
             return np.array([mins, mids, maxs])
 
+    def family_has_points(self) -> bool:
+        return any(mob.has_points() for mob in self.get_family())
+
     def refresh_bounding_box(
         self,
         recurse_down: bool = False,
@@ -410,14 +484,18 @@ class Mobject(object):
     def split(self) -> list[Self]:
         return self.submobjects
 
-    @affects_data
     def note_changed_family(self, only_changed_order=False) -> Self:
+        # Ancestors are each visited once, rather than having every level
+        # separately propagate its changes upwards
         self.family = None
         if not only_changed_order:
-            self.refresh_has_updater_status()
-            self.refresh_bounding_box()
-        for parent in self.parents:
-            parent.note_changed_family()
+            self._has_updaters_in_family = None
+            self._needs_new_bounding_box = True
+        for mob in self.get_ancestors():
+            mob.family = None
+            mob._has_updaters_in_family = None
+            mob._needs_new_bounding_box = True
+        self.note_changed_data()
         return self
 
     def get_family(self, recurse: bool = True) -> list[Mobject]:
@@ -456,12 +534,49 @@ class Mobject(object):
     def add(self, *mobjects: Mobject) -> Self:
         if self in mobjects:
             raise Exception("Mobject cannot contain self")
+        current_submobs = set(self.submobjects)
+        new_submobs = []
         for mobject in mobjects:
-            if mobject not in self.submobjects:
+            if mobject not in current_submobs:
                 self.submobjects.append(mobject)
+                current_submobs.add(mobject)
+                new_submobs.append(mobject)
             if self not in mobject.parents:
                 mobject.parents.append(self)
+        self.note_added_submobjects(new_submobs)
+        return self
+
+    def note_added_submobjects(self, new_submobs: list[Mobject]) -> Self:
+        """
+        Equivalent to note_changed_family for submobjects appended to the end,
+        except that the family of this mobject is extended rather than rebuilt,
+        and bounding boxes which are still valid, for this mobject and its
+        ancestors, are grown to include the new submobjects rather than being
+        recomputed from scratch
+        """
+        family = self.family
+        new_family_members = list(it.chain(*(sm.get_family() for sm in new_submobs)))
+        boxes_to_grow = []
+        new_box_mobs = [sm for sm in new_submobs if sm.family_has_points()]
+        if family is not None and new_box_mobs and any(mob.has_points() for mob in family):
+            boxes_to_grow = [
+                mob for mob in (self, *self.get_ancestors())
+                if not mob._needs_new_bounding_box
+                and type(mob).compute_bounding_box is Mobject.compute_bounding_box
+            ]
+
         self.note_changed_family()
+
+        if family is not None:
+            self.family = [*family, *new_family_members]
+        if boxes_to_grow:
+            new_boxes = np.vstack([sm.get_bounding_box() for sm in new_box_mobs])
+            for mob in boxes_to_grow:
+                bb = mob.bounding_box
+                bb[0] = np.minimum(bb[0], new_boxes.min(0))
+                bb[2] = np.maximum(bb[2], new_boxes.max(0))
+                bb[1] = (bb[0] + bb[2]) / 2
+                mob._needs_new_bounding_box = False
         return self
 
     def remove(
@@ -470,10 +585,15 @@ class Mobject(object):
         reassemble: bool = True,
         recurse: bool = True
     ) -> Self:
+        to_remove_set = set(to_remove)
         for parent in self.get_family(recurse):
+            if to_remove_set.isdisjoint(parent.submobjects):
+                continue
+            parent.submobjects[:] = [
+                sm for sm in parent.submobjects
+                if sm not in to_remove_set
+            ]
             for child in to_remove:
-                if child in parent.submobjects:
-                    parent.submobjects.remove(child)
                 if parent in child.parents:
                     child.parents.remove(parent)
             if reassemble:
@@ -646,12 +766,19 @@ class Mobject(object):
             return result
         return wrapper
 
-    @stash_mobject_pointers
-    def serialize(self) -> bytes:
-        return pickle.dumps(self)
+    def serialize(self, compress: bool = False) -> bytes:
+        """
+        Encodes this mobject and its family in the .mob format, see
+        manimlib.mobject.mobject_file.write_mobject
+        """
+        from manimlib.mobject.mobject_file import write_mobject
+        return write_mobject(self, compress)
 
     def deserialize(self, data: bytes) -> Self:
-        self.become(pickle.loads(data))
+        from manimlib.mobject.mobject_file import is_mobject_file
+        from manimlib.mobject.mobject_file import read_mobject
+        # Older versions pickled mobjects
+        self.become(read_mobject(data) if is_mobject_file(data) else pickle.loads(data))
         return self
 
     @stash_mobject_pointers
@@ -687,25 +814,47 @@ class Mobject(object):
         # Similarly, instead of calling match_updaters, since we know the status
         # won't have changed, just directly match.
         result.updaters = list(self.updaters)
+        result._updater_takes_dt = dict(self._updater_takes_dt)
+        result._updater_input_versions = dict()
         result._data_has_changed = True
         result.shader_wrapper = None
 
+        # When making a snapshot, the data array is left shared
+        share_data = self._copies_share_data
+        self._data_is_shared = self._data_is_shared or share_data
+        result._data_is_shared = share_data
+
         family = self.get_family()
         for attr, value in self.__dict__.items():
             if isinstance(value, Mobject) and value is not self:
                 if value in family:
                     setattr(result, attr, result.family[family.index(value)])
             elif isinstance(value, np.ndarray):
+                if share_data and value is self.data:
+                    continue
                 setattr(result, attr, value.copy())
         return result
 
+    def get_snapshot(self) -> Self:
+        """
+        Returns a copy for saved states, like those of a scene's undo stack,
+        whose family members share their data arrays with those of this
+        mobject, rather than duplicating them.  Whichever side first writes
+        to a shared array takes its own copy of it then, see unshare_data.
+        """
+        Mobject._copies_share_data = True
+        try:
+            return self.copy()
+        finally:
+            Mobject._copies_share_data = False
+
     def generate_target(self, use_deepcopy: bool = False) -> Self:
         self.target = self.copy(deep=use_deepcopy)
         self.target.saved_state = self.saved_state
         return self.target
 
     def save_state(self, use_deepcopy: bool = False) -> Self:
-        self.saved_state = self.copy(deep=use_deepcopy)
+        self.saved_state = self.copy(deep=True) if use_deepcopy else self.get_snapshot()
         self.saved_state.target = self.target
         return self
 
@@ -715,20 +864,32 @@ class Mobject(object):
         self.become(self.saved_state)
         return self
 
-    def save_to_file(self, file_path: str) -> Self:
-        with open(file_path, "wb") as fp:
-            fp.write(self.serialize())
+    def save_to_file(self, file_path: str, compress: bool = False) -> Self:
+        # Encode before touching the file, whose contents this mobject
+        # might still be mapped from, see Mobject.load, and write to a
+        # separate file first so that the old one is replaced, not truncated
+        data = self.serialize(compress)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as fp:
+            fp.write(data)
+        os.replace(temp_path, file_path)
         log.info(f"Saved mobject to {file_path}")
         return self
 
     @staticmethod
-    def load(file_path) -> Mobject:
+    def load(file_path: str, mmap: bool = False) -> Mobject:
+        from manimlib.mobject.mobject_file import is_mobject_file
+        from manimlib.mobject.mobject_file import load_mobject_file
+
         if not os.path.exists(file_path):
             log.error(f"No file found at {file_path}")
             sys.exit(2)
         with open(file_path, "rb") as fp:
-            mobject = pickle.load(fp)
-        return mobject
+            if not is_mobject_file(fp.read(8)):
+                # Saved by an older version, which pickled mobjects
+                fp.seek(0)
+                return pickle.load(fp)
+        return load_mobject_file(file_path, mmap)
 
     def become(self, mobject: Mobject, match_updaters=False) -> Self:
         """
@@ -831,6 +992,8 @@ class Mobject(object):
 
     def init_updaters(self):
         self.updaters: list[Updater] = list()
+        self._updater_takes_dt: dict[Updater, bool] = dict()
+        self._updater_input_versions: dict[Updater, tuple[int, ...]] = dict()
         self._has_updaters_in_family: Optional[bool] = False
         self.updating_suspended: bool = False
 
@@ -841,18 +1004,63 @@ class Mobject(object):
             for submob in self.submobjects:
                 submob.update(dt, recurse)
         for updater in self.updaters:
-            # This is hacky, but if an updater takes dt as an arg,
-            # it will be passed the change in time from here
-            if "dt" in updater.__code__.co_varnames:
-                updater(self, dt=dt)
-            else:
-                updater(self)
+            self.call_updater(updater, dt)
         return self
 
+    def call_updater(self, updater: Updater, dt: float) -> None:
+        # Updaters declaring which mobjects they read from, e.g. those made by
+        # mob.always.next_to(other), are skipped when neither those mobjects
+        # nor this one have changed since the last call
+        dependencies = getattr(updater, "dependencies", None)
+        if dependencies:
+            input_versions = tuple(mob.get_input_version() for mob in (self, *dependencies))
+            if self._updater_input_versions.get(updater) == input_versions:
+                return
+
+        if updater not in self._updater_takes_dt:
+            self._updater_takes_dt[updater] = updater_takes_dt(updater)
+        kwargs = dict(dt=dt) if self._updater_takes_dt[updater] else dict()
+
+        if Mobject.updater_profile is None:
+            updater(self, **kwargs)
+        else:
+            start = time.perf_counter()
+            updater(self, **kwargs)
+            record = Mobject.updater_profile.setdefault(get_updater_name(updater), [0.0, 0])
+            record[0] += time.perf_counter() - start
+            record[1] += 1
+
+        if dependencies:
+            self._updater_input_versions[updater] = tuple(
+                mob.get_input_version() for mob in (self, *dependencies)
+            )
+
     def get_updaters(self) -> list[Updater]:
         return self.updaters
 
+    def get_updater_dependencies(self) -> list[Mobject]:
+        """
+        All mobjects which updaters in this family have declared they read from
+        """
+        if not self.has_updaters():
+            return []
+        result = [
+            mob
+            for updater in self.updaters
+            for mob in getattr(updater, "dependencies", [])
+        ]
+        for submob in self.submobjects:
+            result.extend(submob.get_updater_dependencies())
+        return result
+
     def add_updater(self, update_func: Updater, call: bool = True) -> Self:
+        """
+        The updater is called with this mobject, and also passed dt if it
+        has a parameter by that name. If it has a "dependencies" attribute
+        listing the mobjects it reads from, it is only called when those,
+        or this mobject, have changed
+        """
+        self._updater_takes_dt[update_func] = updater_takes_dt(update_func)
         self.updaters.append(update_func)
         if call:
             self.update(dt=0)
@@ -860,6 +1068,7 @@ class Mobject(object):
         return self
 
     def insert_updater(self, update_func: Updater, index=0):
+        self._updater_takes_dt[update_func] = updater_takes_dt(update_func)
         self.updaters.insert(index, update_func)
         self.refresh_has_updater_status()
         return self
@@ -867,12 +1076,14 @@ class Mobject(object):
     def remove_updater(self, update_func: Updater) -> Self:
         while update_func in self.updaters:
             self.updaters.remove(update_func)
+        self._updater_input_versions.pop(update_func, None)
         self.refresh_has_updater_status()
         return self
 
     def clear_updaters(self, recurse: bool = True) -> Self:
         for mob in self.get_family(recurse):
             mob.updaters = []
+            mob._updater_input_versions = dict()
             mob._has_updaters_in_family = False
         for parent in self.get_ancestors():
             parent._has_updaters_in_family = False
@@ -880,6 +1091,7 @@ class Mobject(object):
 
     def match_updaters(self, mobject: Mobject) -> Self:
         self.updaters = list(mobject.updaters)
+        self._updater_input_versions = dict()
         self.refresh_has_updater_status()
         return self
 
@@ -1816,8 +2028,11 @@ class Mobject(object):
         alpha: float,
         path_func: Callable[[np.ndarray, np.ndarray, float], np.ndarray] = straight_path
     ) -> Self:
+        self.unshare_data()
         keys = [k for k in self.data.dtype.names if k not in self.locked_data_keys]
-        if keys:
+        if "point" in keys:
+            self.note_changed_points()
+        elif keys:
             self.note_changed_data()
         for key in keys:
             md1 = mobject1.data[key]
@@ -2045,8 +2260,7 @@ class Mobject(object):
         result = []
         for submobs, sid in batches:
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
+            shader_wrapper.read_in_mobjects(submobs)
             result.append(shader_wrapper)
         return result
 
@@ -2063,11 +2277,14 @@ class Mobject(object):
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return None
 
-    def render(self, ctx: Context, camera_uniforms: dict):
+    def refresh_shader_wrappers(self, ctx: Context) -> list[ShaderWrapper]:
         if self._data_has_changed:
             self.shader_wrappers = self.get_shader_wrapper_list(ctx)
             self._data_has_changed = False
-        for shader_wrapper in self.shader_wrappers:
+        return self.shader_wrappers
+
+    def render(self, ctx: Context, camera_uniforms: dict):
+        for shader_wrapper in self.refresh_shader_wrappers(ctx):
             shader_wrapper.update_program_uniforms(camera_uniforms)
             shader_wrapper.pre_render()
             shader_wrapper.render()
@@ -2309,15 +2526,40 @@ def override_animate(method):
     return decorator
 
 
+def updater_takes_dt(updater: Updater) -> bool:
+    try:
+        return "dt" in inspect.signature(updater).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def get_updater_name(updater: Updater) -> str:
+    name = getattr(updater, "__qualname__", type(updater).__name__)
+    code = getattr(updater, "__code__", None)
+    if code is None or "<lambda>" not in name:
+        return name
+    # Tell lambdas apart by where they are defined
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def get_mobject_args(args: Iterable, kwargs: dict) -> list[Mobject]:
+    return [arg for arg in (*args, *kwargs.values()) if isinstance(arg, Mobject)]
+
+
 class _UpdaterBuilder:
     def __init__(self, mobject: Mobject):
         self.mobject = mobject
 
     def __getattr__(self, method_name: str):
         def add_updater(*method_args, **method_kwargs):
-            self.mobject.add_updater(
-                lambda m: getattr(m, method_name)(*method_args, **method_kwargs)
-            )
+            def updater(m):
+                getattr(m, method_name)(*method_args, **method_kwargs)
+
+            updater.__qualname__ = f"always.{method_name}"
+            dependencies = get_mobject_args(method_args, method_kwargs)
+            if dependencies:
+                updater.dependencies = dependencies
+            self.mobject.add_updater(updater)
             return self
         return add_updater
 
@@ -2328,14 +2570,16 @@ class _FunctionalUpdaterBuilder:
 
     def __getattr__(self, method_name: str):
         def add_updater(*method_args, **method_kwargs):
-            self.mobject.add_updater(
-                lambda m: getattr(m, method_name)(
+            def updater(m):
+                getattr(m, method_name)(
                     *(arg() for arg in method_args),
                     **{
                         key: value()
                         for key, value in method_kwargs.items()
                     }
                 )
-            )
+
+            updater.__qualname__ = f"f_always.{method_name}"
+            self.mobject.add_updater(updater)
             return self
         return add_updater
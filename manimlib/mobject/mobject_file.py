@@ -0,0 +1,466 @@
+from __future__ import annotations
+
+import base64
+import importlib
+import io
+import json
+import pickle
+import struct
+import zlib
+
+import numpy as np
+
+from manimlib.logger import log
+from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.dot_cloud import DotCloud
+from manimlib.mobject.types.point_cloud_mobject import PMobject
+from manimlib.mobject.types.vectorized_mobject import VMobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["load_mobject_file", "write_mobject", "read_mobject"]
+
+
+MOBJECT_FILE_VERSION = 1
+MOBJECT_FILE_MAGIC = b"MANIMOB\0"
+# Magic, format version, and the length of the json header which follows
+PREAMBLE = struct.Struct("<8sHQ")
+# Data blocks start on multiples of this many bytes
+BLOCK_ALIGNMENT = 64
+
+# Loaded mobjects are built from a default instance of the first of these
+# their class inherits from, so whatever the current code expects of that
+# class is in place even if the class itself is not what it was
+BASE_CLASSES = [VMobject, DotCloud, PMobject, Mobject]
+
+# Attributes which are written separately, only make sense in the session
+# that wrote them, or are derived from the data.  Private attributes, those
+# starting with an underscore, are never written either.
+UNSAVED_ATTRS = {
+    "data",
+    "uniforms",
+    "submobjects",
+    "parents",
+    "family",
+    "target",
+    "saved_state",
+    "shader_wrapper",
+    "bounding_box",
+    "updaters",
+    "event_listners",
+    "partial_lengths",
+    "arc_length",
+    "subpath_end_indices",
+    "outer_vert_indices",
+}
+
+
+def is_mobject_file(data: bytes) -> bool:
+    return data.startswith(MOBJECT_FILE_MAGIC)
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Converts value to something json can write, raising a TypeError for
+    anything but numbers, strings, numeric arrays, and lists, tuples, sets
+    and string-keyed dicts of those
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        return {"array": value.tolist(), "dtype": value.dtype.str}
+    if isinstance(value, list):
+        return list(map(encode_value, value))
+    if isinstance(value, tuple):
+        return {"tuple": list(map(encode_value, value))}
+    if isinstance(value, (set, frozenset)):
+        return {"set": list(map(encode_value, value))}
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {"dict": {key: encode_value(val) for key, val in value.items()}}
+    raise TypeError(f"Cannot save value of type {type(value).__name__}")
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return list(map(decode_value, value))
+    if not isinstance(value, dict):
+        return value
+    if "array" in value:
+        return np.array(value["array"], dtype=value["dtype"])
+    if "tuple" in value:
+        return tuple(map(decode_value, value["tuple"]))
+    if "set" in value:
+        return set(map(decode_value, value["set"]))
+    return {key: decode_value(val) for key, val in value["dict"].items()}
+
+
+class MemberPickler(pickle.Pickler):
+    """
+    Pickles attributes which encode_value can't write, like functions,
+    writing references to the mobjects being saved by their indices
+    """
+    def __init__(self, file: io.BytesIO, member_indices: dict[int, int]):
+        super().__init__(file)
+        self.member_indices = member_indices
+
+    def persistent_id(self, obj: Any) -> int | None:
+        if isinstance(obj, Mobject):
+            return self.member_indices.get(id(obj))
+        return None
+
+
+class MemberUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, members: list[Mobject]):
+        super().__init__(file)
+        self.members = members
+
+    def persistent_load(self, pid: int) -> Mobject:
+        return self.members[pid]
+
+
+def pickle_value(value: Any, member_indices: dict[int, int]) -> dict[str, str]:
+    buffer = io.BytesIO()
+    MemberPickler(buffer, member_indices).dump(value)
+    return {"pickle": base64.b64encode(buffer.getvalue()).decode()}
+
+
+def unpickle_value(value: dict[str, str], members: list[Mobject]) -> Any:
+    buffer = io.BytesIO(base64.b64decode(value["pickle"]))
+    return MemberUnpickler(buffer, members).load()
+
+
+def is_pickled(value: Any) -> bool:
+    return isinstance(value, dict) and "pickle" in value
+
+
+def copy_values(values: dict[str, Any], mutable_keys: list[str]) -> dict[str, Any]:
+    result = dict(values)
+    for key in mutable_keys:
+        result[key] = result[key].copy()
+    return result
+
+
+def get_mutable_keys(values: dict[str, Any]) -> list[str]:
+    return [
+        key for key, value in values.items()
+        if isinstance(value, (list, set, dict, np.ndarray))
+    ]
+
+
+def get_class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def find_class(class_path: str) -> type | None:
+    module_name, _, qualname = class_path.partition(":")
+    try:
+        result = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            result = getattr(result, name)
+    except (ImportError, AttributeError):
+        return None
+    return result
+
+
+def get_saved_items(mob: Mobject) -> list[tuple[str, Any]]:
+    return [
+        (key, value)
+        for key, value in mob.__dict__.items()
+        if not key.startswith("_") and key not in UNSAVED_ATTRS
+    ]
+
+
+def get_referenced_mobjects(value: Any) -> list[Mobject]:
+    if isinstance(value, Mobject):
+        return [value]
+    if isinstance(value, (list, tuple)) and value and all(isinstance(v, Mobject) for v in value):
+        return list(value)
+    return []
+
+
+def get_members(mobject: Mobject) -> list[Mobject]:
+    """
+    Returns the family of mobject, along with the families of any other
+    mobjects its members point to, like the axes group of Axes
+    """
+    members = dict()
+    pending = [mobject]
+    while pending:
+        for mob in pending.pop().get_family():
+            if id(mob) in members:
+                continue
+            members[id(mob)] = mob
+            for key, value in get_saved_items(mob):
+                pending.extend(get_referenced_mobjects(value))
+    return list(members.values())
+
+
+class ValueTable(object):
+    """
+    Distinct json-encoded values, as most members of a family have
+    the same uniforms, and the same attributes as many others
+    """
+    def __init__(self):
+        self.values: list[Any] = []
+        self.indices: dict[str, int] = dict()
+
+    def add(self, value: Any) -> int:
+        key = json.dumps(value, sort_keys=True)
+        if key not in self.indices:
+            self.indices[key] = len(self.values)
+            self.values.append(value)
+        return self.indices[key]
+
+
+def write_mobject(mobject: Mobject, compress: bool = False) -> bytes:
+    """
+    Encodes mobject in the .mob format.
+
+    After a short binary preamble comes a json header describing each
+    member, as found by get_members, by its class, submobjects, uniforms,
+    and attributes, with repeated values given once in shared tables.
+    Attributes which aren't plain values, like functions, are pickled.  The data arrays of all members follow, one block
+    for each dtype holding the arrays of that dtype one after another.
+    Uncompressed, blocks are laid out so that they can be memory mapped.
+    """
+    members = get_members(mobject)
+    member_indices = {id(mob): index for index, mob in enumerate(members)}
+    classes = ValueTable()
+    value_sets = ValueTable()
+    dtypes = list(dict.fromkeys(mob.data.dtype for mob in members))
+    block_arrays = [[] for dtype in dtypes]
+    block_lengths = [0] * len(dtypes)
+
+    descriptions = []
+    unsaved = []
+    for mob in members:
+        attrs = dict()
+        # Attributes pointing to other members, as indices
+        member_attrs = dict()
+        for key, value in get_saved_items(mob):
+            referenced = get_referenced_mobjects(value)
+            if referenced:
+                indices = [member_indices[id(m)] for m in referenced]
+                member_attrs[key] = indices[0] if isinstance(value, Mobject) else indices
+                continue
+            try:
+                attrs[key] = encode_value(value)
+                continue
+            except TypeError:
+                pass
+            try:
+                attrs[key] = pickle_value(value, member_indices)
+            except Exception:
+                unsaved.append(f"{type(mob).__name__}.{key}")
+        base = next(cls for cls in BASE_CLASSES if isinstance(mob, cls))
+
+        block_index = dtypes.index(mob.data.dtype)
+        start = block_lengths[block_index]
+        block_lengths[block_index] += len(mob.data)
+        block_arrays[block_index].append(mob.data)
+
+        descriptions.append(dict(
+            cls=classes.add([get_class_path(type(mob)), base.__name__]),
+            submobjects=[member_indices[id(sm)] for sm in mob.submobjects],
+            uniforms=value_sets.add(encode_value(mob.uniforms)["dict"]),
+            attrs=value_sets.add(attrs),
+            member_attrs=member_attrs,
+            data=[block_index, start, block_lengths[block_index]],
+        ))
+
+    if unsaved:
+        log.warning(
+            "Could not save the attributes " + ", ".join(dict.fromkeys(unsaved)) +
+            ", which loaded mobjects will lack"
+        )
+
+    block_bytes = [
+        np.concatenate(arrays).tobytes() if arrays else b""
+        for arrays in block_arrays
+    ]
+    if compress:
+        block_bytes = list(map(zlib.compress, block_bytes))
+    blocks = []
+    offset = 0
+    for dtype, length, raw in zip(dtypes, block_lengths, block_bytes):
+        blocks.append(dict(
+            dtype=np.lib.format.dtype_to_descr(dtype),
+            length=length,
+            offset=offset,
+            nbytes=len(raw),
+        ))
+        offset += -(-len(raw) // BLOCK_ALIGNMENT) * BLOCK_ALIGNMENT
+
+    header = json.dumps(dict(
+        compression="zlib" if compress else None,
+        blocks=blocks,
+        classes=classes.values,
+        value_sets=value_sets.values,
+        members=descriptions,
+    )).encode()
+    # Pad the header so that the blocks begin aligned
+    header += b" " * (-(PREAMBLE.size + len(header)) % BLOCK_ALIGNMENT)
+    data_start = PREAMBLE.size + len(header)
+
+    result = bytearray(PREAMBLE.pack(MOBJECT_FILE_MAGIC, MOBJECT_FILE_VERSION, len(header)))
+    result += header
+    for block, raw in zip(blocks, block_bytes):
+        result += b"\0" * (data_start + block["offset"] - len(result))
+        result += raw
+    return bytes(result)
+
+
+def read_header(preamble_and_header: bytes) -> tuple[dict, int]:
+    """
+    Returns the header of a .mob file, and where its data blocks begin
+    """
+    magic, version, header_nbytes = PREAMBLE.unpack_from(preamble_and_header)
+    if magic != MOBJECT_FILE_MAGIC:
+        raise ValueError("Not a mobject file")
+    if version > MOBJECT_FILE_VERSION:
+        raise ValueError(
+            f"Mobject file has format version {version}, but only versions up "
+            f"to {MOBJECT_FILE_VERSION} can be read; try upgrading manimgl"
+        )
+    data_start = PREAMBLE.size + header_nbytes
+    header = json.loads(preamble_and_header[PREAMBLE.size:data_start])
+    return header, data_start
+
+
+def build_mobject(header: dict, block_arrays: list[np.ndarray]) -> Mobject:
+    # Instances are made by copying the attributes of default instances of
+    # their base classes, rather than calling any constructors
+    templates = dict()
+    for cls in BASE_CLASSES:
+        template_dict = {
+            key: value
+            for key, value in cls().__dict__.items()
+            if key not in ["data", "uniforms", "submobjects", "family"]
+        }
+        templates[cls.__name__] = template_dict
+
+    classes = []
+    missing_classes = []
+    for class_path, base_name in header["classes"]:
+        cls = find_class(class_path)
+        base = next(base for base in BASE_CLASSES if base.__name__ == base_name)
+        if cls is None or not issubclass(cls, base):
+            cls = base
+            missing_classes.append(class_path)
+        classes.append((cls, templates[base_name]))
+    if missing_classes:
+        log.warning(
+            "Could not find the classes " + ", ".join(missing_classes) +
+            ", loading instances as their nearest base class instead"
+        )
+
+    # Pickled attributes can refer to other members, so they're only
+    # unpickled once all members exist
+    pickled_sets = [
+        {key: value for key, value in values.items() if is_pickled(value)}
+        for values in header["value_sets"]
+    ]
+    value_sets = [
+        decode_value({"dict": {
+            key: value for key, value in values.items() if not is_pickled(value)
+        }})
+        for values in header["value_sets"]
+    ]
+    value_sets = [(values, get_mutable_keys(values)) for values in value_sets]
+    # Attributes of the template overridden by each set of saved ones
+    class_attrs = dict()
+
+    members = []
+    for description in header["members"]:
+        key = (description["cls"], description["attrs"])
+        if key not in class_attrs:
+            cls, template_dict = classes[key[0]]
+            attrs = {**template_dict, **value_sets[key[1]][0]}
+            class_attrs[key] = (cls, attrs, get_mutable_keys(attrs))
+        cls, attrs, mutable_keys = class_attrs[key]
+        mob = cls.__new__(cls)
+        mob.__dict__ = copy_values(attrs, mutable_keys)
+        mob.uniforms = copy_values(*value_sets[description["uniforms"]])
+        index, start, end = description["data"]
+        mob.data = block_arrays[index][start:end]
+        members.append(mob)
+
+    for mob, description in zip(members, header["members"]):
+        mob.submobjects = [members[index] for index in description["submobjects"]]
+        for sm in mob.submobjects:
+            sm.parents.append(mob)
+        for key, index in description["member_attrs"].items():
+            if isinstance(index, list):
+                setattr(mob, key, [members[i] for i in index])
+            else:
+                setattr(mob, key, members[index])
+
+    unloaded = []
+    for mob, description in zip(members, header["members"]):
+        for key, value in pickled_sets[description["attrs"]].items():
+            try:
+                setattr(mob, key, unpickle_value(value, members))
+            except Exception:
+                unloaded.append(f"{type(mob).__name__}.{key}")
+    if unloaded:
+        log.warning(
+            "Could not load the attributes " + ", ".join(dict.fromkeys(unloaded)) +
+            ", which were saved with pickle"
+        )
+
+    for mob in members:
+        mob.family = None
+        mob._has_updaters_in_family = None
+        mob._needs_new_bounding_box = True
+    return members[0]
+
+
+def read_mobject(data: bytes) -> Mobject:
+    header, data_start = read_header(data)
+    block_arrays = []
+    for block in header["blocks"]:
+        start = data_start + block["offset"]
+        raw = data[start:start + block["nbytes"]]
+        if header["compression"] == "zlib":
+            raw = zlib.decompress(raw)
+        dtype = np.lib.format.descr_to_dtype(block["dtype"])
+        # Copied, as np.frombuffer gives a read-only array
+        block_arrays.append(np.frombuffer(raw, dtype=dtype).copy())
+    return build_mobject(header, block_arrays)
+
+
+def load_mobject_file(file_path: str, mmap: bool = False) -> Mobject:
+    """
+    Reads a .mob file.  With mmap, unless the file is compressed, the data
+    arrays of the mobject are mapped straight from the file, copy-on-write,
+    so that only what's used gets read.  The file must then not be changed
+    in place while the mobject is in use; Mobject.save_to_file replaces
+    files rather than rewriting them for this reason.
+    """
+    with open(file_path, "rb") as fp:
+        preamble = fp.read(PREAMBLE.size)
+        magic, version, header_nbytes = PREAMBLE.unpack(preamble)
+        header, data_start = read_header(preamble + fp.read(header_nbytes))
+        if header["compression"] is not None or not mmap:
+            fp.seek(0)
+            return read_mobject(fp.read())
+
+    block_arrays = []
+    for block in header["blocks"]:
+        dtype = np.lib.format.descr_to_dtype(block["dtype"])
+        if block["length"] == 0:
+            block_arrays.append(np.zeros(0, dtype=dtype))
+            continue
+        block_arrays.append(np.memmap(
+            file_path, dtype=dtype, mode="c",
+            offset=data_start + block["offset"],
+            shape=(block["length"],),
+        ).view(np.ndarray))
+    return build_mobject(header, block_arrays)
@@ -5,6 +5,7 @@ import inspect
 from manimlib.constants import DEGREES
 from manimlib.constants import RIGHT
 from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.mobject import get_mobject_args
 from manimlib.utils.simple_functions import clip
 
 from typing import TYPE_CHECKING
@@ -27,7 +28,15 @@ def always(method, *args, **kwargs):
     assert_is_mobject_method(method)
     mobject = method.__self__
     func = method.__func__
-    mobject.add_updater(lambda m: func(m, *args, **kwargs))
+
+    def updater(mob):
+        func(mob, *args, **kwargs)
+
+    updater.__qualname__ = f"always({func.__qualname__})"
+    dependencies = get_mobject_args(args, kwargs)
+    if dependencies:
+        updater.dependencies = dependencies
+    mobject.add_updater(updater)
     return mobject
 
 
@@ -48,6 +57,7 @@ def f_always(method, *arg_generators, **kwargs):
         ]
         func(mob, *args, **kwargs)
 
+    updater.__qualname__ = f"f_always({func.__qualname__})"
     mobject.add_updater(updater)
     return mobject
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from functools import lru_cache
+from functools import partial
 
 import numpy as np
 
@@ -25,6 +26,42 @@ def char_to_cahced_mob(char: str, **text_config):
     return Text(char, **text_config)
 
 
+class GlyphAtlas(object):
+    """
+    Points and bounding boxes for the characters of DecimalNumbers drawn
+    with one text configuration, scaled to a font size of 1.  Each is read
+    once from the cached Text of its character, so that a DecimalNumber
+    changing value can rewrite the points of its digits in place, rather
+    than building and arranging new submobjects.
+    """
+    def __init__(self, **text_config):
+        self.text_config = text_config
+        self.glyphs: dict[str, tuple[list[np.ndarray], np.ndarray]] = dict()
+
+    def __reduce__(self):
+        # Unpickles as the shared atlas for the same configuration
+        return (partial(get_glyph_atlas, **self.text_config), ())
+
+    def get_glyph(self, char: str) -> tuple[list[np.ndarray], np.ndarray]:
+        """
+        Returns the points of each family member of the character's Text
+        which has points, and the lower left and upper right corners of
+        its bounding box
+        """
+        if char not in self.glyphs:
+            template = char_to_cahced_mob(char, **self.text_config)
+            self.glyphs[char] = (
+                [sm.get_points() / template.font_size for sm in template.family_members_with_points()],
+                template.get_bounding_box()[[0, 2]] / template.font_size,
+            )
+        return self.glyphs[char]
+
+
+@lru_cache()
+def get_glyph_atlas(**text_config) -> GlyphAtlas:
+    return GlyphAtlas(**text_config)
+
+
 class DecimalNumber(VMobject):
     def __init__(
         self,
@@ -55,6 +92,7 @@ class DecimalNumber(VMobject):
         self.edge_to_fix = edge_to_fix
         self.font_size = font_size
         self.text_config = dict(text_config)
+        self.glyph_atlas = get_glyph_atlas(**self.text_config)
 
         super().__init__(
             color=color,
@@ -74,13 +112,10 @@ class DecimalNumber(VMobject):
 
         # Submob_templates will be a list of cached Tex and Text mobjects,
         # with the intent of calling .copy or .become on them
-        submob_templates = list(map(self.char_to_mob, self.num_string))
-        if self.show_ellipsis:
-            dots = self.char_to_mob("...")
-            dots.arrange(RIGHT, buff=2 * dots[0].get_width())
-            submob_templates.append(dots)
-        if self.unit is not None:
-            submob_templates.append(self.char_to_mob(self.unit))
+        submob_templates = [
+            *map(self.char_to_mob, self.num_string),
+            *self.get_extra_templates(),
+        ]
 
         # Set internals
         font_size = self.get_font_size()
@@ -110,6 +145,112 @@ class DecimalNumber(VMobject):
         if self.include_background_rectangle:
             self.add_background_rectangle()
 
+    def get_extra_templates(self) -> list[Text]:
+        """
+        Templates for the submobjects following the digits, the
+        ellipsis and the unit, when shown
+        """
+        result = []
+        if self.show_ellipsis:
+            dots = self.char_to_mob("...")
+            dots.arrange(RIGHT, buff=2 * dots[0].get_width())
+            result.append(dots)
+        if self.unit is not None:
+            result.append(self.char_to_mob(self.unit))
+        return result
+
+    def can_set_digits_in_place(self, num_string: str) -> bool:
+        """
+        Whether the current submobjects can be reused to show num_string, which
+        needs one per character as now, each shaped like its new character
+        """
+        n_extras = int(self.show_ellipsis) + int(self.unit is not None)
+        if any([
+            self.include_background_rectangle,
+            len(num_string) != len(self.num_string),
+            len(self.submobjects) != len(num_string) + n_extras,
+        ]):
+            return False
+        return all(
+            len(sm.family_members_with_points()) == len(self.glyph_atlas.get_glyph(char)[0])
+            for sm, char in zip(self.submobjects, num_string)
+        )
+
+    def set_digits_in_place(
+        self,
+        number: float | complex,
+        num_string: str,
+        fixed_point: Vect3,
+    ) -> None:
+        """
+        Equivalent to set_submobjects_from_number followed by moving edge_to_fix
+        to fixed_point, for when can_set_digits_in_place holds, but writing the
+        points of each digit from the glyph atlas, and laying them out with array
+        arithmetic in place of arrange.  Styles are left to the caller.
+        """
+        old_string = self.num_string
+        self.number = number
+        self.num_string = num_string
+
+        font_size = self.get_font_size()
+        glyphs = [self.glyph_atlas.get_glyph(char) for char in num_string]
+        extras = self.submobjects[len(num_string):]
+        # Like the digits, the ellipsis and unit are reset to their
+        # templates, undoing any transformations since the last value
+        for sm, smt in zip(extras, self.get_extra_templates()):
+            sm.become(smt)
+            sm.scale(font_size / smt.font_size)
+        # Lower left and upper right corners of each submobject, where
+        # digits are drawn at the origin, and the ellipsis and unit are now
+        boxes = np.array([
+            *(font_size * box for points, box in glyphs),
+            *(sm.get_bounding_box()[[0, 2]] for sm in extras),
+        ])
+        sizes = boxes[:, 1] - boxes[:, 0]
+
+        # Find where the lower left corner of each should go, as arrange
+        # would put them, with bottoms aligned and centers at z = 0
+        digit_buff = self.digit_buff_per_font_unit * font_size
+        corners = np.zeros_like(sizes)
+        corners[1:, 0] = np.cumsum(sizes[:-1, 0] + digit_buff)
+        corners[:, 2] = -sizes[:, 2] / 2
+
+        # Handle alignment of special characters
+        for i, c in enumerate(num_string):
+            if c == "–" and len(num_string) > i + 1:
+                corners[i, 1] = corners[i + 1, 1] + sizes[i + 1, 1] / 2 - sizes[i, 1]
+            elif c == ",":
+                corners[i, 1] -= sizes[i, 1] / 2
+        if self.unit and self.unit.startswith("^"):
+            corners[-1, 1] = (corners[:, 1] + sizes[:, 1]).max() - sizes[-1, 1]
+
+        # Move the edge to fix into place
+        lower_left = corners.min(0)
+        upper_right = (corners + sizes).max(0)
+        edge_point = np.array([lower_left, (lower_left + upper_right) / 2, upper_right])[
+            (np.sign(self.edge_to_fix) + 1).astype(int), [0, 1, 2]
+        ]
+        corners += fixed_point - edge_point
+        shifts = corners - boxes[:, 0]
+
+        for sm, char, old_char, (points, box), shift in zip(
+            self.submobjects, num_string, old_string, glyphs, shifts
+        ):
+            # A digit which hasn't changed, and still has the shape of its
+            # glyph, is only moved, so its joint angles and unit normal stay
+            # valid.  One rotated or stretched since gets them recomputed.
+            for mob, glyph_points in zip(sm.family_members_with_points(), points):
+                new_points = font_size * glyph_points
+                old_points = mob.get_points()
+                refresh = (
+                    char != old_char
+                    or len(old_points) != len(new_points)
+                    or not np.allclose(old_points - old_points[0], new_points - new_points[0])
+                )
+                mob.set_points(new_points + shift, refresh=refresh)
+        for sm, shift in zip(extras, shifts[len(num_string):]):
+            sm.shift(shift)
+
     def get_num_string(self, number: float | complex) -> str:
         if isinstance(number, complex):
             formatter = self.get_complex_formatter()
@@ -188,8 +329,12 @@ class DecimalNumber(VMobject):
     def set_value(self, number: float | complex) -> Self:
         move_to_point = self.get_edge_center(self.edge_to_fix)
         style = self.family_members_with_points()[0].get_style()
-        self.set_submobjects_from_number(number)
-        self.move_to(move_to_point, self.edge_to_fix)
+        num_string = self.get_num_string(number)
+        if self.can_set_digits_in_place(num_string):
+            self.set_digits_in_place(number, num_string, move_to_point)
+        else:
+            self.set_submobjects_from_number(number)
+            self.move_to(move_to_point, self.edge_to_fix)
         self.set_style(**style)
         for submob in self.get_family():
             submob.uniforms.update(self.uniforms)
@@ -8,6 +8,7 @@ from manimlib.constants import BLACK, WHITE
 from manimlib.mobject.svg.svg_mobject import SVGMobject
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.utils.tex_file_writing import tex_content_to_svg_file
+from manimlib.utils.tex_file_writing import tex_contents_to_svg_files
 
 from typing import TYPE_CHECKING
 
@@ -83,11 +84,13 @@ class SingleStringTex(SVGMobject):
         )
         return file_path
 
-    def get_tex_file_body(self, tex_string: str) -> str:
+    def get_tex_file_body(self, tex_string: str, alignment: str | None = None) -> str:
         new_tex = self.get_modified_expression(tex_string)
         if self.math_mode:
             new_tex = "\\begin{align*}\n" + new_tex + "\n\\end{align*}"
-        return self.alignment + "\n" + new_tex
+        if alignment is None:
+            alignment = self.alignment
+        return alignment + "\n" + new_tex
 
     def get_modified_expression(self, tex_string: str) -> str:
         return self.modify_special_strings(tex_string.strip())
@@ -234,12 +237,16 @@ class OldTex(SingleStringTex):
             submob = self.copy()
             self.set_submobjects([submob])
             return self
+        tex_strings = [ts.strip() for ts in tex_strings if ts.strip()]
+        # Have the tex for all substrings compile at once, rather than one by
+        # one below, matching the default alignment and template of each SingleStringTex
+        tex_contents_to_svg_files([
+            (self.get_tex_file_body(tex_string, alignment=R"\centering"), "", "")
+            for tex_string in tex_strings
+        ], wait=False)
         new_submobjects = []
         curr_index = 0
         for tex_string in tex_strings:
-            tex_string = tex_string.strip()
-            if len(tex_string) == 0:
-                continue
             sub_tex_mob = SingleStringTex(tex_string, math_mode=self.math_mode)
             num_submobs = len(sub_tex_mob)
             if num_submobs == 0:
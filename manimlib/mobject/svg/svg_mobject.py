@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import types
 from xml.etree import ElementTree as ET
 
 import numpy as np
@@ -15,8 +16,13 @@ from manimlib.mobject.geometry import Polygon
 from manimlib.mobject.geometry import Polyline
 from manimlib.mobject.geometry import Rectangle
 from manimlib.mobject.geometry import RoundedRectangle
+from manimlib.mobject.mobject_file import load_mobject_file
+from manimlib.mobject.mobject_file import write_mobject
+from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.directories import get_mobject_data_dir
+from manimlib.utils.file_ops import guarantee_existence
+from manimlib.utils.hashing import get_hash
 from manimlib.utils.images import get_full_vector_image_path
 from manimlib.utils.iterables import hash_obj
 from manimlib.utils.simple_functions import hash_string
@@ -29,6 +35,9 @@ if TYPE_CHECKING:
 
 SVG_HASH_TO_MOB_MAP: dict[int, list[VMobject]] = {}
 PATH_TO_POINTS: dict[str, Vect3Array] = {}
+# Bump whenever a change in parsing would change the resulting geometry,
+# so that geometry cached on disk by earlier versions is not used
+SVG_GEOMETRY_CACHE_VERSION = 2
 
 
 def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
@@ -101,7 +110,7 @@ class SVGMobject(VMobject):
         if hash_val in SVG_HASH_TO_MOB_MAP:
             submobs = [sm.copy() for sm in SVG_HASH_TO_MOB_MAP[hash_val]]
         else:
-            submobs = self.mobjects_from_file(self.get_file_path())
+            submobs = self.mobjects_from_file_or_cache(self.get_file_path())
             SVG_HASH_TO_MOB_MAP[hash_val] = [sm.copy() for sm in submobs]
 
         self.add(*submobs)
@@ -131,6 +140,63 @@ class SVGMobject(VMobject):
 
         return self.mobjects_from_svg(svg)
 
+    def mobjects_from_file_or_cache(self, file_path: str) -> list[VMobject]:
+        """
+        Parsing svgs is slow, so the resulting submobjects are saved to
+        disk, to be loaded directly by later processes needing the same svg
+        """
+        cache_path = self.get_geometry_cache_path(file_path)
+        if os.path.exists(cache_path):
+            try:
+                return self.load_geometry_cache(cache_path)
+            except Exception as err:
+                log.debug(f"Failed to load svg geometry from {cache_path}: {err}")
+        submobs = self.mobjects_from_file(file_path)
+        self.save_geometry_cache(cache_path, submobs)
+        return submobs
+
+    def get_geometry_cache_path(self, file_path: str) -> str:
+        with open(file_path, "rb") as fp:
+            file_contents = fp.read()
+        # Methods of subclasses defined outside manimlib, e.g. in a scene
+        # file, might be edited between runs, so their code is part of the key
+        user_methods = [
+            (name, value)
+            for cls in type(self).__mro__
+            if not cls.__module__.startswith("manimlib")
+            for name, value in vars(cls).items()
+            if isinstance(value, types.FunctionType)
+        ]
+        key = get_hash(
+            SVG_GEOMETRY_CACHE_VERSION,
+            self.data_dtype.descr,
+            type(self),
+            self.hash_seed,
+            user_methods,
+            file_contents,
+        )
+        cache_dir = guarantee_existence(os.path.join(get_mobject_data_dir(), "svg_geometry"))
+        return os.path.join(cache_dir, key + ".mob")
+
+    def save_geometry_cache(self, cache_path: str, submobs: list[VMobject]) -> None:
+        # Saved in the .mob format, so that each submobject comes back with
+        # the class and attributes it was parsed with
+        group = VGroup(*submobs)
+        data = write_mobject(group)
+        group.remove(*submobs)
+        # Write to a separate file first, so that other processes
+        # never load a partially written cache
+        temp_path = f"{cache_path[:-4]}_{os.getpid()}.mob"
+        with open(temp_path, "wb") as fp:
+            fp.write(data)
+        os.replace(temp_path, cache_path)
+
+    def load_geometry_cache(self, cache_path: str) -> list[VMobject]:
+        group = load_mobject_file(cache_path)
+        submobs = list(group.submobjects)
+        group.remove(*submobs)
+        return submobs
+
     def get_file_path(self) -> str:
         if self.file_name is None:
             raise Exception("Must specify file for SVGMobject")
@@ -8,6 +8,7 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import color_to_hex
 from manimlib.utils.color import hex_to_int
 from manimlib.utils.tex_file_writing import tex_content_to_svg_file
+from manimlib.utils.tex_file_writing import tex_contents_to_svg_files
 from manimlib.utils.tex import num_tex_symbols
 from manimlib.logger import log
 
@@ -81,6 +82,16 @@ class Tex(StringMobject):
             self.additional_preamble
         )
 
+    def get_file_path(self, is_labelled: bool = False) -> str:
+        if not (is_labelled or self.use_labelled_svg):
+            # The labelled svg will be needed right after this one,
+            # so have it compile alongside
+            tex_contents_to_svg_files(
+                [(self.get_content(is_labelled=True), self.template, self.additional_preamble)],
+                wait=False
+            )
+        return super().get_file_path(is_labelled)
+
     def get_file_path_by_content(self, content: str) -> str:
         return tex_content_to_svg_file(
             content, self.template, self.additional_preamble, self.tex_string
@@ -109,9 +109,9 @@ class Sphere(Surface):
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
         return self.radius * np.array([
-            math.cos(u) * math.sin(v),
-            math.sin(u) * math.sin(v),
-            -math.cos(v)
+            np.cos(u) * np.sin(v),
+            np.sin(u) * np.sin(v),
+            -np.cos(v)
         ])
 
 
@@ -133,8 +133,8 @@ class Torus(Surface):
         )
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        P = np.array([math.cos(u), math.sin(u), 0])
-        return (self.r1 - self.r2 * math.cos(v)) * P - self.r2 * math.sin(v) * OUT
+        r = self.r1 - self.r2 * np.cos(v)
+        return np.array([r * np.cos(u), r * np.sin(u), -self.r2 * np.sin(v)])
 
 
 class Cylinder(Surface):
@@ -208,9 +208,9 @@ class Disk3D(Surface):
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
         return np.array([
-            u * math.cos(v),
-            u * math.sin(v),
-            0
+            u * np.cos(v),
+            u * np.sin(v),
+            0 * u
         ])
 
 
@@ -232,7 +232,7 @@ class Square3D(Surface):
         self.scale(side_length / 2)
 
     def uv_func(self, u: float, v: float) -> np.ndarray:
-        return np.array([u, v, 0])
+        return np.array([u, v, 0 * u])
 
 
 def square_to_cube_faces(square: T) -> list[T]:
@@ -66,32 +66,54 @@ class Surface(Mobject):
         self.compute_triangle_indices()
 
     def uv_func(self, u: float, v: float) -> tuple[float, float, float]:
-        # To be implemented in subclasses
+        # To be implemented in subclasses.  Implementations which
+        # also work when u and v are arrays of values will be
+        # evaluated on the whole uv grid at once.
         return (u, v, 0.0)
 
+    def get_points_from_uv(self, u_values: np.ndarray, v_values: np.ndarray) -> np.ndarray:
+        """
+        Returns an array of shape (len(u_values), dim), evaluating uv_func on all
+        pairs of values in one call when it supports arrays, and otherwise
+        falling back to evaluating it pair by pair
+        """
+        try:
+            result = np.array(np.broadcast_arrays(*self.uv_func(u_values, v_values)), dtype=float)
+            is_vectorized = result.shape == (self.dim, len(u_values)) and all(
+                np.allclose(result[:, i], self.uv_func(u_values[i], v_values[i]), equal_nan=True)
+                for i in {0, len(u_values) // 2, len(u_values) - 1}
+            )
+        except Exception:
+            is_vectorized = False
+        if is_vectorized:
+            return result.T
+        return np.array([
+            self.uv_func(u, v)
+            for u, v in zip(u_values, v_values)
+        ], dtype=float).reshape((len(u_values), self.dim))
+
     @Mobject.affects_data
     def init_points(self):
-        dim = self.dim
         nu, nv = self.resolution
-        u_range = np.linspace(*self.u_range, nu)
-        v_range = np.linspace(*self.v_range, nv)
-
-        # Get three lists:
-        # - Points generated by pure uv values
-        # - Those generated by values nudged by du
-        # - Those generated by values nudged by dv
-        uv_grid = np.array([[[u, v] for v in v_range] for u in u_range])
-        uv_plus_du = uv_grid.copy()
-        uv_plus_du[:, :, 0] += self.epsilon
-        uv_plus_dv = uv_grid.copy()
-        uv_plus_dv[:, :, 1] += self.epsilon
-
-        points, du_points, dv_points = [
-            np.apply_along_axis(
-                lambda p: self.uv_func(*p), 2, grid
-            ).reshape((nu * nv, dim))
-            for grid in (uv_grid, uv_plus_du, uv_plus_dv)
-        ]
+        u_grid, v_grid = np.meshgrid(
+            np.linspace(*self.u_range, nu),
+            np.linspace(*self.v_range, nv),
+            indexing="ij",
+        )
+        u_values = u_grid.flatten()
+        v_values = v_grid.flatten()
+        n_points = nu * nv
+        if n_points == 0:
+            return
+
+        # Get points generated by pure uv values, those generated by values
+        # nudged by du, and those generated by values nudged by dv,
+        # all in the same evaluation
+        all_points = self.get_points_from_uv(
+            np.hstack([u_values, u_values + self.epsilon, u_values]),
+            np.hstack([v_values, v_values, v_values + self.epsilon]),
+        )
+        points, du_points, dv_points = all_points.reshape((3, n_points, self.dim))
         self.set_points(points)
         self.data['du_point'][:] = du_points
         self.data['dv_point'][:] = dv_points
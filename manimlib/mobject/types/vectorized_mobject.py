@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from functools import wraps
+import hashlib
 
 import moderngl
 import numpy as np
@@ -24,10 +26,12 @@ from manimlib.utils.bezier import approx_smooth_quadratic_bezier_handles
 from manimlib.utils.bezier import smooth_quadratic_path
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.bezier import integer_interpolate
+from manimlib.utils.bezier import integer_interpolate_array
 from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.bezier import find_intersection
 from manimlib.utils.bezier import outer_interpolate
-from manimlib.utils.bezier import partial_quadratic_bezier_points
+from manimlib.utils.bezier import partial_quadratic_bezier_paths
+from manimlib.utils.bezier import subdivide_quadratic_bezier_path
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
 from manimlib.utils.color import color_gradient
 from manimlib.utils.color import rgb_to_hex
@@ -57,12 +61,16 @@ from typing import Generic, TypeVar, Iterable
 SubVmobjectType = TypeVar('SubVmobjectType', bound='VMobject')
 
 if TYPE_CHECKING:
-    from typing import Callable, Tuple, Any
+    from typing import Callable, Sequence, Tuple, Any
     from manimlib.typing import ManimColor, Vect3, Vect4, Vect3Array, Vect4Array, Self
     from moderngl.context import Context
 
 DEFAULT_STROKE_COLOR = GREY_A
 DEFAULT_FILL_COLOR = GREY_C
+# Least recently used triangulations are dropped past this many, as
+# every frame of, say, a Transform between filled shapes adds one
+MAX_CACHED_TRIANGULATIONS = 4096
+POINTS_HASH_TO_TRIANGULATION: OrderedDict[bytes, np.ndarray] = OrderedDict()
 
 
 class VMobject(Mobject):
@@ -114,8 +122,17 @@ class VMobject(Mobject):
         self.anti_alias_width = anti_alias_width
         self.fill_border_width = fill_border_width
 
-        self.needs_new_joint_angles = True
-        self.needs_new_unit_normal = True
+        # Points versions for which the joint angles, unit normal
+        # and base point held in data were last computed
+        self._joint_angles_version = -1
+        self._unit_normal_version = -1
+        self._base_point_version = -1
+        self._joint_angles_are_interpolated = False
+        # Likewise for the cumulative curve lengths and the arc length
+        self._partial_lengths_version = -1
+        self._arc_length_version = -1
+        self.partial_lengths = np.zeros(1)
+        self.arc_length = 0.0
         self.subpath_end_indices = None
         self.outer_vert_indices = np.zeros(0, dtype=int)
 
@@ -164,6 +181,7 @@ class VMobject(Mobject):
         if border_width is not None:
             self.border_width = border_width
             for mob in self.get_family(recurse):
+                mob.unshare_data()
                 data = mob.data if mob.has_points() > 0 else mob._data_defaults
                 data["fill_border_width"] = border_width
         return self
@@ -181,6 +199,7 @@ class VMobject(Mobject):
 
         if width is not None:
             for mob in self.get_family(recurse):
+                mob.unshare_data()
                 data = mob.data if mob.get_num_points() > 0 else mob._data_defaults
                 if isinstance(width, (float, int)):
                     data['stroke_width'][:, 0] = width
@@ -590,18 +609,11 @@ class VMobject(Mobject):
         for vmob in self.get_family(recurse):
             if not vmob.has_points():
                 continue
-            new_points = [vmob.get_points()[0]]
-            for tup in vmob.get_bezier_tuples():
-                n_divisions = tuple_to_subdivisions(*tup)
-                if n_divisions > 0:
-                    alphas = np.linspace(0, 1, n_divisions + 2)
-                    new_points.extend([
-                        partial_quadratic_bezier_points(tup, a1, a2)[1:]
-                        for a1, a2 in zip(alphas, alphas[1:])
-                    ])
-                else:
-                    new_points.append(tup[1:])
-            vmob.set_points(np.vstack(new_points))
+            n_divisions = [
+                max(tuple_to_subdivisions(*tup), 0)
+                for tup in vmob.get_bezier_tuples()
+            ]
+            vmob.set_points(subdivide_quadratic_bezier_path(vmob.get_points(), n_divisions))
         return self
 
     def subdivide_sharp_curves(
@@ -627,8 +639,20 @@ class VMobject(Mobject):
         return self
 
     def add_points_as_corners(self, points: Iterable[Vect3]) -> Self:
-        for point in points:
-            self.add_line_to(point)
+        # Equivalent to calling add_line_to on each point, but
+        # appending all new points at once
+        points = np.array(points, dtype=float).reshape(-1, self.dim)
+        if len(points) == 0:
+            return self
+        self.throw_error_if_no_points()
+        alphas = np.linspace(0, 1, 5 if self.long_lines else 3)[1:]
+        starts = np.vstack([
+            self.get_last_point(),
+            points[:-1].astype(self.data["point"].dtype),
+        ])
+        new_points = np.outer(1 - alphas, starts).reshape(len(alphas), -1, self.dim) \
+            + np.outer(alphas, points).reshape(len(alphas), -1, self.dim)
+        self.append_points(new_points.transpose(1, 0, 2).reshape(-1, self.dim))
         return self
 
     def set_points_as_corners(self, points: Iterable[Vect3]) -> Self:
@@ -773,6 +797,46 @@ class VMobject(Mobject):
         curve_func = self.get_nth_curve_function(n)
         return curve_func(residue)
 
+    def quick_points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Vectorized version of quick_point_from_proportion
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        num_curves = self.get_num_curves()
+        if num_curves == 0:
+            return np.tile(self.get_center(), (len(alphas), 1))
+        indices, residues = integer_interpolate_array(0, num_curves, alphas)
+        return self.get_points_on_curves(indices, residues)
+
+    def get_points_on_curves(self, indices: np.ndarray, props: np.ndarray) -> Vect3Array:
+        """
+        Returns the points a proportion props[i] of the way
+        along the bezier curve with index indices[i]
+        """
+        points = self.get_points()
+        indices = 2 * np.asarray(indices)
+        t = np.asarray(props)[..., np.newaxis]
+        return (1 - t)**2 * points[indices] + 2 * (1 - t) * t * points[indices + 1] + t**2 * points[indices + 2]
+
+    def get_partial_lengths(self) -> np.ndarray:
+        """
+        Returns the running total of the curve lengths, starting at 0,
+        where each curve's length is approximated with the straight line
+        from its start to its end, and null curves are given length 0.
+        This is only recomputed after the points change.
+        """
+        if self._partial_lengths_version != self._points_version:
+            points = self.get_points()
+            n_curves = max((len(points) - 1) // 2, 0)
+            starts = points[0:2 * n_curves:2]
+            handles = points[1:2 * n_curves:2]
+            ends = points[2:2 * n_curves + 1:2]
+            lengths = np.linalg.norm(ends - starts, axis=1)
+            lengths[(abs(handles - starts) < self.tolerance_for_point_equality).all(1)] = 0
+            self.partial_lengths = np.append(0, np.cumsum(lengths))
+            self._partial_lengths_version = self._points_version
+        return self.partial_lengths
+
     def curve_and_prop_of_partial_point(self, alpha) -> Tuple[int, float]:
         """
         If you want a point a proportion alpha along the curve, this
@@ -781,28 +845,35 @@ class VMobject(Mobject):
         """
         if alpha == 0:
             return (0, 0.0)
-        partials: list[float] = [0]
-        for tup in self.get_bezier_tuples():
-            if self.consider_points_equal(tup[0], tup[1]):
-                # Don't consider null curves
-                arclen = 0
-            else:
-                # Approximate length with straight line from start to end
-                arclen = get_norm(tup[2] - tup[0])
-            partials.append(partials[-1] + arclen)
+        partials = self.get_partial_lengths()
         full = partials[-1]
         if full == 0:
             return len(partials), 1.0
-        # First index where the partial length is more than alpha times the full length
-        index = next(
-            (i for i, x in enumerate(partials) if x >= full * alpha),
-            len(partials) - 1  # Default
-        )
+        # First index where the partial length is at least alpha times the full length
+        index = min(int(np.searchsorted(partials, full * alpha)), len(partials) - 1)
         residue = float(inverse_interpolate(
             partials[index - 1] / full, partials[index] / full, alpha
         ))
         return index - 1, residue
 
+    def curves_and_props_of_partial_points(self, alphas: Iterable[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized version of curve_and_prop_of_partial_point
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        partials = self.get_partial_lengths()
+        full = partials[-1]
+        if full == 0:
+            return np.full(alphas.shape, len(partials)), np.ones(alphas.shape)
+        indices = np.searchsorted(partials, full * alphas).clip(1, len(partials) - 1)
+        residues = inverse_interpolate(
+            partials[indices - 1] / full, partials[indices] / full, alphas
+        )
+        indices -= 1
+        indices[alphas == 0] = 0
+        residues[alphas == 0] = 0
+        return indices, residues
+
     def point_from_proportion(self, alpha: float) -> Vect3:
         if alpha <= 0:
             return self.get_start()
@@ -813,6 +884,20 @@ class VMobject(Mobject):
         index, residue = self.curve_and_prop_of_partial_point(alpha)
         return self.get_nth_curve_function(index)(residue)
 
+    def points_from_proportions(self, alphas: Iterable[float]) -> Vect3Array:
+        """
+        Vectorized version of point_from_proportion
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        num_curves = self.get_num_curves()
+        if num_curves == 0:
+            return np.tile(self.get_center(), (len(alphas), 1))
+        indices, residues = self.curves_and_props_of_partial_points(alphas.clip(0, 1))
+        result = self.get_points_on_curves(indices.clip(0, num_curves - 1), residues)
+        result[alphas <= 0] = self.get_start()
+        result[alphas >= 1] = self.get_end()
+        return result
+
     def get_anchors_and_handles(self) -> list[Vect3]:
         """
         returns anchors1, handles, anchors2,
@@ -841,15 +926,15 @@ class VMobject(Mobject):
 
     def get_arc_length(self, n_sample_points: int | None = None) -> float:
         if n_sample_points is not None:
-            points = np.array([
-                self.quick_point_from_proportion(a)
-                for a in np.linspace(0, 1, n_sample_points)
-            ])
+            points = self.quick_points_from_proportions(np.linspace(0, 1, n_sample_points))
             return poly_line_length(points)
-        points = self.get_points()
-        inner_len = poly_line_length(points[::2])
-        outer_len = poly_line_length(points)
-        return interpolate(inner_len, outer_len, 1 / 3)
+        if self._arc_length_version != self._points_version:
+            points = self.get_points()
+            inner_len = poly_line_length(points[::2])
+            outer_len = poly_line_length(points)
+            self.arc_length = interpolate(inner_len, outer_len, 1 / 3)
+            self._arc_length_version = self._points_version
+        return self.arc_length
 
     def get_area_vector(self) -> Vect3:
         # Returns a vector whose length is the area bound by
@@ -875,7 +960,7 @@ class VMobject(Mobject):
         if self.get_num_points() < 3:
             return OUT
 
-        if not self.needs_new_unit_normal and not refresh:
+        if not refresh and self._unit_normal_version == self._points_version:
             return self.data["base_normal"][1, :]
 
         area_vect = self.get_area_vector()
@@ -886,11 +971,32 @@ class VMobject(Mobject):
             p = self.get_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
         self.data["base_normal"][1::2] = normal
-        self.needs_new_unit_normal = False
+        self._unit_normal_version = self._points_version
         return normal
 
     def refresh_unit_normal(self) -> Self:
-        self.needs_new_unit_normal = True
+        self._unit_normal_version = -1
+        return self
+
+    def get_current_shape_data(self) -> tuple[bool, bool]:
+        """
+        Whether the joint angles and unit normal are up to date with the points
+        """
+        return (
+            self._joint_angles_version == self._points_version,
+            self._unit_normal_version == self._points_version,
+        )
+
+    def keep_shape_data(self, current: tuple[bool, bool]) -> Self:
+        """
+        After a change to the points known to leave the joint angles and unit
+        normal as they were, mark whichever of them were current as still current
+        """
+        angles_current, normal_current = current
+        if angles_current:
+            self._joint_angles_version = self._points_version
+        if normal_current:
+            self._unit_normal_version = self._points_version
         return self
 
     def rotate(
@@ -975,71 +1081,73 @@ class VMobject(Mobject):
         if len(points) == 1:
             return np.repeat(points, 2 * n + 1, 0)
 
-        bezier_tuples = list(self.get_bezier_tuples_from_points(points))
+        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
         atol = self.tolerance_for_point_equality
-        norms = [
-            0 if get_norm(tup[1] - tup[0]) < atol else get_norm(tup[2] - tup[0])
-            for tup in bezier_tuples
-        ]
-        # Calculate insertions per curve (ipc)
-        ipc = np.zeros(len(bezier_tuples), dtype=int)
-        for _ in range(n):
-            index = np.argmax(norms)
-            ipc[index] += 1
-            norms[index] *= ipc[index] / (ipc[index] + 1)
-
-        new_points = [points[0]]
-        for tup, n_inserts in zip(bezier_tuples, ipc):
-            # What was once a single quadratic curve defined
-            # by "tup" will now be broken into n_inserts + 1
-            # smaller quadratic curves
-            alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
-        return np.vstack(new_points)
+        norms = np.linalg.norm(a1 - a0, axis=1)
+        norms[np.linalg.norm(h - a0, axis=1) < atol] = 0
+        n_curves = len(norms)
+        total = norms.sum()
+
+        # Calculate insertions per curve (ipc).  Each insertion goes to the
+        # curve whose pieces are currently longest, so in all they go to the
+        # n largest values of norm / (k + 1), over curves and counts k >= 0
+        if total == 0:
+            ipc = np.zeros(n_curves, dtype=int)
+            ipc[0] = n
+        else:
+            # No curve can take more insertions than this
+            caps = np.minimum(n, (norms * (n + n_curves) / total).astype(int) + 1)
+            curve_indices = np.repeat(np.arange(n_curves), caps)
+            counts = np.arange(len(curve_indices)) - np.repeat(np.cumsum(caps) - caps, caps)
+            order = np.lexsort((counts, curve_indices, -norms[curve_indices] / (counts + 1)))
+            ipc = np.bincount(curve_indices[order[:n]], minlength=n_curves)
+
+        # What was once a single quadratic curve will now be
+        # broken into n_inserts + 1 smaller quadratic curves
+        return subdivide_quadratic_bezier_path(points, ipc)
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
-        vm_points = vmobject.get_points()
-        self.data["joint_angle"] = vmobject.data["joint_angle"]
-        if a <= 0 and b >= 1:
-            self.set_points(vm_points, refresh=False)
-            return self
-        num_curves = vmobject.get_num_curves()
+        VMobject.pointwise_become_partial_batch([self], [vmobject], [a], [b])
+        return self
 
-        # Partial curve includes three portions:
+    @staticmethod
+    def pointwise_become_partial_batch(
+        vmobjects: Sequence[VMobject],
+        sources: Sequence[VMobject],
+        lower: Sequence[float],
+        upper: Sequence[float],
+    ) -> None:
+        """
+        Has each vmobject become the part of its source between the
+        corresponding lower and upper bounds, as pointwise_become_partial
+        would, but finds the partial curves for all of them in one pass
+        """
+        partials = []
+        for vmob, source, a, b in zip(vmobjects, sources, lower, upper):
+            vmob.unshare_data()
+            vmob.data["joint_angle"] = source.get_joint_angles()[:, np.newaxis]
+            vmob._joint_angles_version = -1
+            if a <= 0 and b >= 1:
+                vmob.set_points(source.get_points(), refresh=False)
+                vmob.note_copied_joint_angles(approximate=False)
+            elif source.get_num_curves() > 0:
+                partials.append((vmob, source, a, b))
+        if not partials:
+            return
+
+        # Partial curves include three portions:
         # - A start, which is some ending portion of an inner quadratic
         # - A middle section, which matches the curve exactly
         # - An end, which is the starting portion of a later inner quadratic
-
-        lower_index, lower_residue = integer_interpolate(0, num_curves, a)
-        upper_index, upper_residue = integer_interpolate(0, num_curves, b)
-        i1 = 2 * lower_index
-        i2 = 2 * lower_index + 3
-        i3 = 2 * upper_index
-        i4 = 2 * upper_index + 3
-
-        new_points = vm_points.copy()
-        if num_curves == 0:
-            new_points[:] = 0
-            return self
-        if lower_index == upper_index:
-            tup = partial_quadratic_bezier_points(vm_points[i1:i2], lower_residue, upper_residue)
-            new_points[:i1] = tup[0]
-            new_points[i1:i4] = tup
-            new_points[i4:] = tup[2]
-        else:
-            low_tup = partial_quadratic_bezier_points(vm_points[i1:i2], lower_residue, 1)
-            high_tup = partial_quadratic_bezier_points(vm_points[i3:i4], 0, upper_residue)
-            new_points[0:i1] = low_tup[0]
-            new_points[i1:i2] = low_tup
-            # Keep new_points i2:i3 as they are
-            new_points[i3:i4] = high_tup
-            new_points[i4:] = high_tup[2]
-        self.data["joint_angle"][:i1] = 0
-        self.data["joint_angle"][i4:] = 0
-        self.set_points(new_points, refresh=False)
-        return self
+        vmobs, sources, lower, upper = zip(*partials)
+        new_paths, in_bounds = partial_quadratic_bezier_paths(
+            [source.get_points() for source in sources], lower, upper
+        )
+        for vmob, new_points, inside in zip(vmobs, new_paths, in_bounds):
+            vmob.data["joint_angle"][~inside] = 0
+            vmob.set_points(new_points, refresh=False)
+            vmob.note_copied_joint_angles(approximate=True)
 
     def get_subcurve(self, a: float, b: float) -> Self:
         vmob = self.copy()
@@ -1067,6 +1175,20 @@ class VMobject(Mobject):
         if len(points) <= 1:
             return np.zeros(0, dtype='i4')
 
+        # Copies of the same shape, typically even shifted ones, share a triangulation
+        rel_points = np.round(points - points[0], 4) + 0.0  # Drops signed zeros
+        points_hash = hashlib.sha1(rel_points.tobytes()).digest()
+        if points_hash in POINTS_HASH_TO_TRIANGULATION:
+            POINTS_HASH_TO_TRIANGULATION.move_to_end(points_hash)
+            return POINTS_HASH_TO_TRIANGULATION[points_hash]
+        tri_indices = self.compute_triangulation(points)
+        tri_indices.setflags(write=False)
+        POINTS_HASH_TO_TRIANGULATION[points_hash] = tri_indices
+        if len(POINTS_HASH_TO_TRIANGULATION) > MAX_CACHED_TRIANGULATIONS:
+            POINTS_HASH_TO_TRIANGULATION.popitem(last=False)
+        return tri_indices
+
+    def compute_triangulation(self, points: Vect3Array) -> np.ndarray:
         normal_vector = self.get_unit_normal()
 
         # Rotate points such that unit normal vector is OUT
@@ -1109,7 +1231,17 @@ class VMobject(Mobject):
 
     def refresh_joint_angles(self) -> Self:
         for mob in self.get_family():
-            mob.needs_new_joint_angles = True
+            mob._joint_angles_version = -1
+        return self
+
+    def note_copied_joint_angles(self, approximate: bool) -> Self:
+        """
+        Joint angles read in from another mobject, as when interpolating, are
+        taken as current, but approximate ones are recomputed once the
+        animation producing them has finished
+        """
+        self._joint_angles_version = self._points_version
+        self._joint_angles_are_interpolated = approximate
         return self
 
     def get_joint_angles(self, refresh: bool = False) -> np.ndarray:
@@ -1117,14 +1249,15 @@ class VMobject(Mobject):
         The 'joint product' is a 4-vector holding the cross and dot
         product between tangent vectors at a joint
         """
-        if not self.needs_new_joint_angles and not refresh:
+        if not refresh and self._joint_angles_version == self._points_version:
             return self.data["joint_angle"][:, 0]
 
         if "joint_angle" in self.locked_data_keys:
             return self.data["joint_angle"][:, 0]
 
-        self.needs_new_joint_angles = False
-        self._data_has_changed = True
+        self._joint_angles_version = self._points_version
+        self._joint_angles_are_interpolated = False
+        self.note_changed_derived_data()
 
         # Rotate points such that positive z direction is the normal
         points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
@@ -1170,7 +1303,8 @@ class VMobject(Mobject):
         return self.data["joint_angle"][:, 0]
 
     def lock_matching_data(self, vmobject1: VMobject, vmobject2: VMobject) -> Self:
-        for mob in [self, vmobject1, vmobject2]:
+        for mob in (*self.get_family(), *vmobject1.get_family(), *vmobject2.get_family()):
+            mob.get_unit_normal()
             mob.get_joint_angles()
         super().lock_matching_data(vmobject1, vmobject2)
         return self
@@ -1178,11 +1312,14 @@ class VMobject(Mobject):
     def triggers_refresh(func: Callable):
         @wraps(func)
         def wrapper(self, *args, refresh=True, **kwargs):
+            current = self.get_current_shape_data()
             func(self, *args, **kwargs)
             if refresh:
                 self.subpath_end_indices = None
                 self.refresh_joint_angles()
                 self.refresh_unit_normal()
+            else:
+                self.keep_shape_data(current)
             return self
         return wrapper
 
@@ -1202,6 +1339,7 @@ class VMobject(Mobject):
         for mob in self.get_family(recurse):
             if not mob.has_points():
                 continue
+            mob.unshare_data()
             inner_ends = mob.get_subpath_end_indices()[:-1]
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
@@ -1225,6 +1363,16 @@ class VMobject(Mobject):
             self.make_smooth(approx=True)
         return self
 
+    def apply_points_function(self, *args, **kwargs) -> Self:
+        # Shifting, scaling and rotating leave joint angles and normals alone,
+        # while other functions passed through here come with triggers_refresh
+        family = self.family_members_with_points()
+        current = [mob.get_current_shape_data() for mob in family]
+        super().apply_points_function(*args, **kwargs)
+        for mob, mob_current in zip(family, current):
+            mob.keep_shape_data(mob_current)
+        return self
+
     @triggers_refresh
     def stretch(self, *args, **kwargs) -> Self:
         return super().stretch(*args, **kwargs)
@@ -1247,13 +1395,34 @@ class VMobject(Mobject):
             **kwargs
         )
         for mob in self.get_family():
-            mob.get_unit_normal(refresh=True)
+            mob.refresh_unit_normal()
+        return self
+
+    def interpolate(
+        self,
+        mobject1: VMobject,
+        mobject2: VMobject,
+        alpha: float,
+        *args, **kwargs
+    ) -> Self:
+        # Joint angles and normals are interpolated along with the points
+        for mob in (mobject1, mobject2):
+            mob.get_joint_angles()
+            mob.get_unit_normal()
+        super().interpolate(mobject1, mobject2, alpha, *args, **kwargs)
+        self.keep_shape_data((True, True))
+        self.note_copied_joint_angles(
+            approximate=(0 < alpha < 1 and "point" not in self.locked_data_keys)
+        )
         return self
 
     def set_animating_status(self, is_animating: bool, recurse: bool = True):
         super().set_animating_status(is_animating, recurse)
-        for submob in self.get_family(recurse):
-            submob.get_joint_angles(refresh=True)
+        if not is_animating:
+            for submob in self.get_family(recurse):
+                if submob._joint_angles_are_interpolated:
+                    submob._joint_angles_version = -1
+                    submob.note_changed_data()
         return self
 
     # For shaders
@@ -1276,9 +1445,11 @@ class VMobject(Mobject):
         return self
 
     def get_shader_data(self) -> np.ndarray:
-        # Do we want this elsewhere? Say whenever points are refreshed or something?
+        self.get_unit_normal()
         self.get_joint_angles()
-        self.data["base_normal"][0::2] = self.data["point"][0]
+        if self._base_point_version != self._points_version:
+            self.data["base_normal"][0::2] = self.data["point"][0]
+            self._base_point_version = self._points_version
         return super().get_shader_data()
 
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
@@ -1355,10 +1526,18 @@ class DashedVMobject(VMobject):
             # be the end of the last dash
             alphas /= (1 - full_d_alpha + partial_d_alpha)
 
-            self.add(*[
-                vmobject.get_subcurve(alpha, alpha + partial_d_alpha)
-                for alpha in alphas[:-1]
-            ])
+            if type(vmobject).pointwise_become_partial is VMobject.pointwise_become_partial:
+                dashes = [vmobject.copy() for alpha in alphas[:-1]]
+                VMobject.pointwise_become_partial_batch(
+                    dashes, [vmobject] * len(dashes),
+                    alphas[:-1], alphas[:-1] + partial_d_alpha,
+                )
+            else:
+                dashes = [
+                    vmobject.get_subcurve(alpha, alpha + partial_d_alpha)
+                    for alpha in alphas[:-1]
+                ]
+            self.add(*dashes)
         # Family is already taken care of by get_subcurve
         # implementation
         self.match_style(vmobject, recurse=False)
@@ -228,6 +228,7 @@ class VectorField(VMobject):
         return self
 
     def update_vectors(self):
+        self.unshare_data()
         tip_width = self.tip_width_ratio * self.stroke_width
         tip_len = self.tip_len_to_width * tip_width
         samples = self.sample_points
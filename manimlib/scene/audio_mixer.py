@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import BinaryIO, Iterator
+
+    from pydub import AudioSegment
+
+
+class AudioMixer(object):
+    """
+    A timeline of sounds for a scene's soundtrack.
+
+    Sounds are only recorded as they're added, each file being decoded once
+    no matter how often it plays.  The track is mixed when it's written out,
+    a fixed number of samples at a time, so neither adding sounds nor writing
+    the track ever holds more than one block of the mix in memory.
+    """
+    def __init__(
+        self,
+        sample_rate: int = 48000,
+        n_channels: int = 2,
+        # Number of samples per channel mixed at a time
+        block_size: int = 2**16,
+    ):
+        self.sample_rate = sample_rate
+        self.n_channels = n_channels
+        self.block_size = block_size
+        # Each clip is an array of shape (n_samples, n_channels), as
+        # floats between -1 and 1, at the mixer's sample rate
+        self.clips: list[np.ndarray] = []
+        self.clip_cache: dict[str, np.ndarray] = dict()
+        # Parallel to clips, when each starts and ends, in samples
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        # Amplitude factors applied to each clip, and, while it plays,
+        # to all the sound added before it
+        self.gains: list[float] = []
+        self.background_gains: list[float] = []
+
+    def segment_to_clip(self, segment: AudioSegment) -> np.ndarray:
+        segment = segment.set_frame_rate(self.sample_rate)
+        segment = segment.set_channels(self.n_channels)
+        segment = segment.set_sample_width(2)
+        samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        return samples.reshape((-1, self.n_channels)) / 2**15
+
+    def get_clip(self, file_path: str) -> np.ndarray:
+        if file_path not in self.clip_cache:
+            from pydub import AudioSegment
+            self.clip_cache[file_path] = self.segment_to_clip(AudioSegment.from_file(file_path))
+        return self.clip_cache[file_path]
+
+    def get_duration(self) -> float:
+        return max(self.ends, default=0) / self.sample_rate
+
+    def add_clip(
+        self,
+        clip: np.ndarray,
+        time: float | None = None,
+        gain: float | None = None,
+        gain_to_background: float | None = None
+    ) -> None:
+        """
+        Plays clip starting at time, in seconds, or else at the current end
+        of the track.  Gains are in decibels, as for pydub, with gain_to_background
+        turning down whatever was already added for as long as the clip plays.
+        """
+        if time is None:
+            time = self.get_duration()
+        if time < 0:
+            raise Exception("Adding sound at timestamp < 0")
+        start = int(round(time * self.sample_rate))
+        self.clips.append(clip)
+        self.starts.append(start)
+        self.ends.append(start + len(clip))
+        self.gains.append(10**((gain or 0) / 20))
+        self.background_gains.append(10**((gain_to_background or 0) / 20))
+
+    def add_sound(
+        self,
+        file_path: str,
+        time: float | None = None,
+        gain: float | None = None,
+        gain_to_background: float | None = None
+    ) -> None:
+        self.add_clip(self.get_clip(file_path), time, gain, gain_to_background)
+
+    def add_segment(
+        self,
+        segment: AudioSegment,
+        time: float | None = None,
+        gain_to_background: float | None = None
+    ) -> None:
+        self.add_clip(self.segment_to_clip(segment), time, None, gain_to_background)
+
+    def get_blocks(self, duration: float | None = None) -> Iterator[np.ndarray]:
+        """
+        Yields the mixed track, block by block, as arrays of shape
+        (n_samples, n_channels) running for the given duration, or else
+        until the last sound ends
+        """
+        if duration is None:
+            duration = self.get_duration()
+        n_samples = int(round(duration * self.sample_rate))
+        starts = np.array(self.starts, dtype=int)
+        ends = np.array(self.ends, dtype=int)
+
+        for block_start in range(0, n_samples, self.block_size):
+            block_end = min(block_start + self.block_size, n_samples)
+            block = np.zeros((block_end - block_start, self.n_channels), dtype=np.float32)
+            # Clips are mixed in the order they were added, since each
+            # may turn down those before it
+            for index in np.flatnonzero((starts < block_end) & (ends > block_start)):
+                lh = max(starts[index], block_start)
+                rh = min(ends[index], block_end)
+                if self.background_gains[index] != 1:
+                    block[lh - block_start:rh - block_start] *= self.background_gains[index]
+                clip = self.clips[index][lh - starts[index]:rh - starts[index]]
+                block[lh - block_start:rh - block_start] += self.gains[index] * clip
+            yield block
+
+    def write_raw(self, stream: BinaryIO, duration: float | None = None) -> None:
+        """
+        Writes the mixed track to stream as interleaved, signed 16-bit,
+        little-endian samples, the format ffmpeg calls s16le
+        """
+        for block in self.get_blocks(duration):
+            samples = np.clip(block * 2**15, -2**15, 2**15 - 1).astype("<i2")
+            stream.write(samples.tobytes())
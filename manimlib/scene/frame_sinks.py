@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess as sp
+
+import numpy as np
+from PIL import Image
+
+from manimlib.constants import FFMPEG_BIN
+from manimlib.utils.file_ops import guarantee_existence
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Sequence
+
+
+class FrameSink(object):
+    """
+    Somewhere for a SceneFileWriter to send the frames it renders.
+
+    Each frame arrives as the raw bytes of its rgba pixels, one byte per
+    channel, with rows running from the top of the image to the bottom.
+    All calls to write_frame happen on the file writer's writing thread.
+    """
+    def open(self, width: int, height: int, fps: float) -> None:
+        self.width = width
+        self.height = height
+        self.fps = fps
+
+    def write_frame(self, raw_bytes: bytes) -> None:
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        pass
+
+    def get_frame_array(self, raw_bytes: bytes) -> np.ndarray:
+        """
+        Returns the frame as an array of shape (height, width, 4)
+        """
+        frame = np.frombuffer(raw_bytes, dtype=np.uint8)
+        return frame.reshape((self.height, self.width, 4))
+
+
+class FFmpegSink(FrameSink):
+    """
+    Encodes frames to a movie file with ffmpeg
+    """
+    def __init__(
+        self,
+        file_path: str,
+        video_codec: str = "libx264",
+        pixel_format: str = "yuv420p",
+        saturation: float = 1.0,
+        gamma: float = 1.0,
+        # Further arguments for the encoder, e.g. ["-preset", "ultrafast"]
+        ffmpeg_args: Sequence[str] = (),
+    ):
+        self.file_path = file_path
+        self.video_codec = video_codec
+        self.pixel_format = pixel_format
+        self.saturation = saturation
+        self.gamma = gamma
+        self.ffmpeg_args = list(ffmpeg_args)
+        self.writing_process: sp.Popen | None = None
+
+    def get_command(self) -> list[str]:
+        command = [
+            FFMPEG_BIN,
+            '-y',  # overwrite output file if it exists
+            '-f', 'rawvideo',
+            '-s', f'{self.width}x{self.height}',  # size of one frame
+            '-pix_fmt', 'rgba',
+            '-r', str(self.fps),  # frames per second
+            '-i', '-',  # The input comes from a pipe
+            '-an',  # Tells FFMPEG not to expect any audio
+            '-loglevel', 'error',
+        ]
+        # Frames already arrive the right way up, so a filter
+        # is only needed to adjust their colors
+        if self.saturation != 1 or self.gamma != 1:
+            command += ['-vf', f'eq=saturation={self.saturation}:gamma={self.gamma}']
+        if self.video_codec:
+            command += ['-vcodec', self.video_codec]
+        if self.pixel_format:
+            command += ['-pix_fmt', self.pixel_format]
+        command += self.ffmpeg_args
+        command += [self.file_path]
+        return command
+
+    def open(self, width: int, height: int, fps: float) -> None:
+        super().open(width, height, fps)
+        self.writing_process = sp.Popen(self.get_command(), stdin=sp.PIPE)
+
+    def write_frame(self, raw_bytes: bytes) -> None:
+        self.writing_process.stdin.write(raw_bytes)
+
+    def close(self) -> None:
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        self.writing_process.terminate()
+
+
+class CallbackSink(FrameSink):
+    """
+    Passes each frame, as an array of shape (height, width, 4), to a function.
+    To feed frames to a generator instead, prime it with next and pass in
+    its send method.
+    """
+    def __init__(self, callback: Callable[[np.ndarray], object]):
+        self.callback = callback
+
+    def write_frame(self, raw_bytes: bytes) -> None:
+        self.callback(self.get_frame_array(raw_bytes))
+
+
+class MemorySink(FrameSink):
+    """
+    Keeps every frame in the list frames, as arrays of
+    shape (height, width, 4)
+    """
+    def __init__(self):
+        self.frames: list[np.ndarray] = []
+
+    def write_frame(self, raw_bytes: bytes) -> None:
+        self.frames.append(self.get_frame_array(raw_bytes))
+
+
+class PipeSink(FrameSink):
+    """
+    Writes the raw bytes of each frame to a file, most usefully a named pipe
+    (FIFO) read by another process.  Opening a named pipe blocks until
+    something opens it for reading.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def open(self, width: int, height: int, fps: float) -> None:
+        super().open(width, height, fps)
+        self.file = open(self.path, "wb")
+
+    def write_frame(self, raw_bytes: bytes) -> None:
+        self.file.write(raw_bytes)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class SocketSink(FrameSink):
+    """
+    Sends the raw bytes of each frame over a socket, connecting either to
+    a (host, port) pair over TCP, or to the path of a unix domain socket
+    """
+    def __init__(self, address: tuple[str, int] | str):
+        self.address = address
+        self.socket: socket.socket | None = None
+
+    def open(self, width: int, height: int, fps: float) -> None:
+        super().open(width, height, fps)
+        if isinstance(self.address, str):
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.connect(self.address)
+
+    def write_frame(self, raw_bytes: bytes) -> None:
+        self.socket.sendall(raw_bytes)
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+class ImageSequenceSink(FrameSink):
+    """
+    Saves each frame as a numbered image file in a directory
+    """
+    def __init__(self, directory: str, file_name_format: str = "{:05}.png"):
+        self.directory = directory
+        self.file_name_format = file_name_format
+        self.n_frames = 0
+
+    def open(self, width: int, height: int, fps: float) -> None:
+        super().open(width, height, fps)
+        guarantee_existence(self.directory)
+
+    def write_frame(self, raw_bytes: bytes) -> None:
+        file_name = self.file_name_format.format(self.n_frames)
+        image = Image.fromarray(self.get_frame_array(raw_bytes), "RGBA")
+        image.save(os.path.join(self.directory, file_name))
+        self.n_frames += 1
+
+
+def get_frame_sink(spec: str) -> FrameSink:
+    """
+    Makes a sink from a description of where frames should go, one of
+    "images:DIRECTORY", "tcp:HOST:PORT", "unix:SOCKET_PATH", or else
+    the path of a file or named pipe
+    """
+    kind, _, target = spec.partition(":")
+    if kind == "images":
+        return ImageSequenceSink(target)
+    if kind == "tcp":
+        host, _, port = target.rpartition(":")
+        return SocketSink((host, int(port)))
+    if kind == "unix":
+        return SocketSink(target)
+    return PipeSink(spec)
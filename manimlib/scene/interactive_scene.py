@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import itertools as it
 import numpy as np
-import pyperclip
-from IPython.core.getipython import get_ipython
 
 from manimlib.animation.fading import FadeIn
 from manimlib.constants import ARROW_SYMBOLS, CTRL_SYMBOL, DELETE_SYMBOL, SHIFT_SYMBOL
@@ -29,6 +27,7 @@ from manimlib.scene.scene import Scene
 from manimlib.scene.scene import SceneState
 from manimlib.scene.scene import PAN_3D_KEY
 from manimlib.utils.family_ops import extract_mobject_family_members
+from manimlib.utils.spatial_index import BoundingBoxIndex
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.tex_file_writing import LatexError
 
@@ -260,6 +259,7 @@ class InteractiveScene(Scene):
                 for mob in selectable
                 for submob in mob.family_members_with_points()
             ]
+        self.selection_search_index = BoundingBoxIndex(self.selection_search_set)
 
     def refresh_selection_scope(self):
         curr = list(self.selection)
@@ -345,6 +345,9 @@ class InteractiveScene(Scene):
     # Functions for keyboard actions
 
     def copy_selection(self):
+        from IPython.core.getipython import get_ipython
+        import pyperclip
+
         names = []
         shell = get_ipython()
         for mob in self.selection:
@@ -358,6 +361,8 @@ class InteractiveScene(Scene):
         pyperclip.copy(", ".join(names))
 
     def paste_selection(self):
+        import pyperclip
+
         clipboard_str = pyperclip.paste()
         # Try pasting a mobject
         try:
@@ -400,12 +405,11 @@ class InteractiveScene(Scene):
         self.is_selecting = False
         if self.selection_rectangle in self.mobjects:
             self.remove(self.selection_rectangle)
-            additions = []
-            for mob in reversed(self.get_selection_search_set()):
-                if self.selection_rectangle.is_touching(mob):
-                    additions.append(mob)
-                    if self.selection_rectangle.get_arc_length() < 1e-2:
-                        break
+            additions = self.selection_search_index.get_mobjects_touching_box(
+                self.selection_rectangle.get_bounding_box(), buff=1e-2
+            )[::-1]
+            if self.selection_rectangle.get_arc_length() < 1e-2:
+                additions = additions[:1]
             self.toggle_from_selection(*additions)
 
     def prepare_grab(self):
@@ -569,13 +573,9 @@ class InteractiveScene(Scene):
             )
 
     def handle_sweeping_selection(self, point: Vect3):
-        mob = self.point_to_mobject(
-            point,
-            search_set=self.get_selection_search_set(),
-            buff=SMALL_BUFF
-        )
-        if mob is not None:
-            self.add_to_selection(mob)
+        mobs = self.selection_search_index.get_mobjects_touching_point(point, buff=SMALL_BUFF)
+        if mobs:
+            self.add_to_selection(mobs[-1])
 
     def choose_color(self, point: Vect3):
         # Search through all mobject on the screen, not just the palette
@@ -619,6 +619,8 @@ class InteractiveScene(Scene):
 
     # Copying code to recreate state
     def copy_frame_positioning(self):
+        import pyperclip
+
         frame = self.frame
         center = frame.get_center()
         height = frame.get_height()
@@ -635,4 +637,6 @@ class InteractiveScene(Scene):
         pyperclip.copy(call)
 
     def copy_cursor_position(self):
+        import pyperclip
+
         pyperclip.copy(str(tuple(self.mouse_point.get_center().round(2))))
@@ -2,18 +2,14 @@ from __future__ import annotations
 
 from collections import OrderedDict
 import inspect
+import itertools as it
 import os
 import platform
-import pyperclip
 import random
 import time
 import re
 from functools import wraps
 
-from IPython.terminal import pt_inputhooks
-from IPython.terminal.embed import InteractiveShellEmbed
-from IPython.core.getipython import get_ipython
-
 import numpy as np
 from tqdm.auto import tqdm as ProgressDisplay
 
@@ -38,8 +34,10 @@ from manimlib.mobject.mobject import Point
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.shader_wrapper import VShaderWrapper
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
+from manimlib.utils.hashing import get_hash
 from manimlib.utils.iterables import batch_by_property
 
 from typing import TYPE_CHECKING
@@ -66,11 +64,16 @@ class Scene(object):
     pan_sensitivity: float = 0.5
     scroll_sensitivity: float = 20
     drag_to_pan: bool = True
-    max_num_saved_states: int = 50
+    # Memory allowed for the data of mobjects saved for undo
+    max_saved_states_nbytes: int = 256 * 2**20
     default_camera_config: dict = dict()
     default_window_config: dict = dict()
     default_file_writer_config: dict = dict()
     samples = 0
+    # With adaptive_preview, the fractions of the window's resolution which
+    # a preview that can't keep up with the frame rate steps down through,
+    # after first giving up multisampling and supersampled fill
+    reduced_preview_resolutions = (1.0, 0.7, 0.5, 0.35)
     # Euler angles, in degrees
     default_frame_orientation = (0, 0)
 
@@ -87,6 +90,10 @@ class Scene(object):
         preview: bool = True,
         presenter_mode: bool = False,
         show_animation_progress: bool = False,
+        profile_updaters: bool = False,
+        # In a preview, drop frames and lower quality as needed
+        # to keep up with the frame rate
+        adaptive_preview: bool = False,
         embed_exception_mode: str = "",
         embed_error_sound: bool = False,
     ):
@@ -98,6 +105,8 @@ class Scene(object):
         self.preview = preview
         self.presenter_mode = presenter_mode
         self.show_animation_progress = show_animation_progress
+        self.profile_updaters = profile_updaters
+        self.adaptive_preview = adaptive_preview
         self.embed_exception_mode = embed_exception_mode
         self.embed_error_sound = embed_error_sound
 
@@ -125,14 +134,19 @@ class Scene(object):
         self.file_writer = SceneFileWriter(self, **self.file_writer_config)
         self.mobjects: list[Mobject] = [self.camera.frame]
         self.render_groups: list[Mobject] = []
+        self.last_render_state: list | None = None
+        self.last_frame_is_reused: bool = False
+        self.preview_quality_level: int = 0
+        self.frames_at_quality_level: int = 0
+        self.preview_render_time: float = 0.0
         self.id_to_mobject_map: dict[int, Mobject] = dict()
         self.num_plays: int = 0
         self.time: float = 0
         self.skip_time: float = 0
         self.original_skipping_status: bool = self.skip_animations
         self.checkpoint_states: dict[str, list[tuple[Mobject, Mobject]]] = dict()
-        self.undo_stack = []
-        self.redo_stack = []
+        self.undo_stack: list[SceneState] = []
+        self.redo_stack: list[SceneState] = []
 
         if self.start_at_animation_number is not None:
             self.skip_animations = True
@@ -157,6 +171,8 @@ class Scene(object):
         self.virtual_animation_start_time: float = 0
         self.real_animation_start_time: float = time.time()
         self.file_writer.begin()
+        if self.profile_updaters:
+            Mobject.updater_profile = dict()
 
         self.setup()
         try:
@@ -186,10 +202,23 @@ class Scene(object):
     def tear_down(self) -> None:
         self.stop_skipping()
         self.file_writer.finish()
+        if self.profile_updaters:
+            self.print_updater_profile()
+            Mobject.updater_profile = None
         if self.window:
             self.window.destroy()
             self.window = None
 
+    def print_updater_profile(self, max_rows: int = 20) -> None:
+        profile = Mobject.updater_profile
+        if not profile:
+            return
+        rows = sorted(profile.items(), key=lambda item: -item[1][0])[:max_rows]
+        lines = [f"{'Total (s)':>10} {'Calls':>8} {'Mean (ms)':>10}  Updater"]
+        for name, (total, n_calls) in rows:
+            lines.append(f"{total:10.3f} {n_calls:8d} {1000 * total / n_calls:10.3f}  {name}")
+        log.info(f"Time spent in updaters for {self}\n" + "\n".join(lines))
+
     def interact(self) -> None:
         """
         If there is a window, enter a loop
@@ -220,6 +249,10 @@ class Scene(object):
         self.save_state()
         self.show_animation_progress = show_animation_progress
 
+        # IPython is slow to import, so is only loaded once needed
+        from IPython.terminal import pt_inputhooks
+        from IPython.terminal.embed import InteractiveShellEmbed
+
         # Create embedded IPython terminal configured to have access to
         # the local namespace of the caller
         caller_frame = inspect.currentframe().f_back
@@ -290,6 +323,8 @@ class Scene(object):
     # Only these methods should touch the camera
 
     def get_image(self) -> Image:
+        if self.preview_quality_level > 0:
+            self.set_preview_quality_level(0)
         if self.window is not None:
             self.camera.use_window_fbo(False)
             self.camera.capture(*self.render_groups)
@@ -305,8 +340,16 @@ class Scene(object):
     def update_frame(self, dt: float = 0, force_draw: bool = False) -> None:
         self.increment_time(dt)
         self.update_mobjects(dt)
+        self.last_frame_is_reused = False
         if self.skip_animations and not force_draw:
             return
+        if self.file_writer.is_reusing_partial_movie and not force_draw:
+            # The frames for this play were already written on an earlier run,
+            # but shader data is still gathered so that any state derived from
+            # it matches that of a run where every frame is drawn
+            for group in self.render_groups:
+                group.refresh_shader_wrappers(self.camera.ctx)
+            return
 
         if self.is_window_closing():
             raise EndScene()
@@ -317,7 +360,19 @@ class Scene(object):
             self.window._window.dispatch_events()
             return
 
+        if not force_draw and self.can_reuse_last_frame():
+            self.last_frame_is_reused = True
+            return
+
+        adapt_quality = self.is_adapting_preview_quality()
+        if adapt_quality and self.preview_quality_level > 0 and not self.has_render_state_changed():
+            # Nothing is moving, so there's time to draw at full quality
+            self.set_preview_quality_level(0)
+
+        capture_start = time.perf_counter()
         self.camera.capture(*self.render_groups)
+        if adapt_quality:
+            self.adapt_preview_quality(time.perf_counter() - capture_start)
 
         if self.window and not self.skip_animations:
             vt = self.time - self.virtual_animation_start_time
@@ -326,14 +381,156 @@ class Scene(object):
 
     def emit_frame(self) -> None:
         if not self.skip_animations:
-            self.file_writer.write_frame(self.camera)
+            self.file_writer.write_frame(
+                self.camera,
+                repeat_last_frame=self.last_frame_is_reused,
+            )
+
+    def get_render_state(self) -> list:
+        # Everything, beyond the data of the render groups, which
+        # determines what camera.capture would draw
+        frame = self.camera.frame
+        light_source = self.camera.light_source
+        return [
+            *self.render_groups,
+            frame.data.tobytes(),
+            light_source.data.tobytes(),
+            *(
+                np.array(value).tobytes()
+                for mob in [frame, *it.chain(*(
+                    group.get_family() for group in self.render_groups
+                ))]
+                for value in mob.uniforms.values()
+            ),
+        ]
+
+    def can_reuse_last_frame(self) -> bool:
+        """
+        When nothing has changed since the last captured frame, e.g. during
+        a wait with no updaters, that frame can be written again rather
+        than redrawn and read back from the GPU
+        """
+        if self.window is not None:
+            self.last_render_state = None
+            return False
+        return not self.has_render_state_changed()
+
+    def has_render_state_changed(self) -> bool:
+        """
+        Whether anything affecting what would be drawn has changed since
+        the last time this was called
+        """
+        if any(group._data_has_changed for group in self.render_groups):
+            self.last_render_state = None
+            return True
+        render_state = self.get_render_state()
+        if render_state == self.last_render_state:
+            return False
+        self.last_render_state = render_state
+        return True
+
+    # Related to adaptive previews
+
+    def is_adapting_preview_quality(self) -> bool:
+        return all([
+            self.adaptive_preview,
+            self.window is not None,
+            not self.file_writer.write_to_movie,
+        ])
+
+    def set_preview_quality_level(self, level: int) -> None:
+        """
+        Level 0 is full quality.  Higher levels draw the preview without
+        multisampling, with fill at half its usual resolution, and at the
+        resolution reduced_preview_resolutions[level - 1] relative to the window
+        """
+        self.preview_quality_level = level
+        self.frames_at_quality_level = 0
+        if level == 0:
+            self.camera.set_preview_resolution(None)
+            VShaderWrapper.fill_canvas_scale = 1.0
+        else:
+            scale = self.reduced_preview_resolutions[level - 1]
+            self.camera.set_preview_resolution(scale)
+            VShaderWrapper.fill_canvas_scale = 0.5 * scale
+
+    def adapt_preview_quality(self, render_time: float) -> None:
+        """
+        Keeps a running average of how long frames take to draw at the current
+        quality level, stepping down a level when that leaves too little of each
+        frame for everything else, and back up when it's far below that
+        """
+        if self.frames_at_quality_level == 0:
+            self.preview_render_time = render_time
+        else:
+            self.preview_render_time = 0.8 * self.preview_render_time + 0.2 * render_time
+        self.frames_at_quality_level += 1
+        if self.frames_at_quality_level < 5:
+            return
+
+        budget = 0.7 / self.camera.fps
+        level = self.preview_quality_level
+        if self.preview_render_time > budget and level < len(self.reduced_preview_resolutions):
+            self.set_preview_quality_level(level + 1)
+        elif self.preview_render_time < 0.2 * budget and level > 0:
+            self.set_preview_quality_level(level - 1)
+
+    def skip_times_behind_real_time(self, times: np.ndarray) -> Iterable[float]:
+        """
+        Passes over any of the times which real time has already gone beyond,
+        so that a preview which can't keep up drops frames rather than slowing
+        down, but always ends on the last one
+        """
+        # Times are relative to the start of this animation, while the
+        # real and virtual start times mark the end of any skipping
+        offset = self.time - self.virtual_animation_start_time
+        for t in times[:-1]:
+            if time.time() - self.real_animation_start_time < offset + t:
+                yield t
+        yield times[-1]
 
     # Related to updating
 
     def update_mobjects(self, dt: float) -> None:
-        for mobject in self.mobjects:
+        for mobject in self.get_mobjects_in_update_order():
             mobject.update(dt)
 
+    def get_mobjects_in_update_order(self) -> list[Mobject]:
+        """
+        Scene mobjects are updated in the order they were added, except that
+        those holding updaters which declare they read from another mobject
+        in the scene are updated after it
+        """
+        top_level_mobjects = set(self.mobjects)
+        mob_to_prereqs = dict()
+        for mob in self.mobjects:
+            prereqs = [
+                top_level_mob
+                for dependency in mob.get_updater_dependencies()
+                for top_level_mob in (dependency, *dependency.get_ancestors())
+                if top_level_mob in top_level_mobjects and top_level_mob is not mob
+            ]
+            if prereqs:
+                mob_to_prereqs[mob] = prereqs
+        if not mob_to_prereqs:
+            return self.mobjects
+
+        # Depth-first ordering, where any cycles are simply broken
+        result = []
+        visited = set()
+
+        def visit(mob):
+            if mob in visited:
+                return
+            visited.add(mob)
+            for prereq in mob_to_prereqs.get(mob, []):
+                visit(prereq)
+            result.append(mob)
+
+        for mob in self.mobjects:
+            visit(mob)
+        return result
+
     def should_update_mobjects(self) -> bool:
         return self.always_update_mobjects or any(
             mob.has_updaters() for mob in self.mobjects
@@ -539,6 +736,10 @@ class Scene(object):
             return [run_time]
 
         times = np.arange(0, run_time, 1 / self.camera.fps) + 1 / self.camera.fps
+        if n_iterations is None:
+            n_iterations = len(times)
+        if self.is_adapting_preview_quality() and len(times) > 0:
+            times = self.skip_times_behind_real_time(times)
 
         self.file_writer.set_progress_display_description(sub_desc=desc)
 
@@ -580,14 +781,30 @@ class Scene(object):
             kw["override_skip_animations"] = True
         return self.get_time_progression(duration, **kw)
 
-    def pre_play(self):
+    def get_play_hash(self, *play_args) -> str | None:
+        """
+        Describes the state of the scene going into a play or wait call,
+        together with the arguments of that call, so that the partial
+        movie it produces can be reused whenever this hash comes up again
+        """
+        if not self.file_writer.is_caching_partial_movies():
+            return None
+        return get_hash(
+            self.file_writer.get_output_settings(),
+            self.mobjects,
+            play_args,
+            np.random.get_state()[1],
+            random.getstate(),
+        )
+
+    def pre_play(self, *play_args):
         if self.presenter_mode and self.num_plays == 0:
             self.hold_loop()
 
         self.update_skipping_status()
 
         if not self.skip_animations:
-            self.file_writer.begin_animation()
+            self.file_writer.begin_animation(self.get_play_hash(*play_args))
 
         if self.window:
             self.virtual_animation_start_time = self.time
@@ -649,7 +866,7 @@ class Scene(object):
         animations = list(map(prepare_animation, proto_animations))
         for anim in animations:
             anim.update_rate_info(run_time, rate_func, lag_ratio)
-        self.pre_play()
+        self.pre_play(animations)
         self.begin_animations(animations)
         self.progress_through_animations(animations)
         self.finish_animations(animations)
@@ -662,7 +879,7 @@ class Scene(object):
         note: str = None,
         ignore_presenter_mode: bool = False
     ):
-        self.pre_play()
+        self.pre_play(duration, stop_condition)
         self.update_mobjects(dt=0)  # Any problems with this?
         if self.presenter_mode and not self.skip_animations and not ignore_presenter_mode:
             if note:
@@ -681,6 +898,8 @@ class Scene(object):
         self.post_play()
 
     def hold_loop(self):
+        if self.preview_quality_level > 0:
+            self.set_preview_quality_level(0)
         while self.hold_on_wait:
             self.update_frame(dt=1 / self.camera.fps)
         self.hold_on_wait = True
@@ -731,9 +950,20 @@ class Scene(object):
             return
         self.redo_stack = []
         self.undo_stack.append(state)
-        if len(self.undo_stack) > self.max_num_saved_states:
+        while len(self.undo_stack) > 1 and self.get_undo_stack_nbytes() > self.max_saved_states_nbytes:
             self.undo_stack.pop(0)
 
+    def get_undo_stack_nbytes(self) -> int:
+        """
+        Bytes of mobject data held by the undo stack, counting each
+        snapshot once however many states refer to it, and as if it
+        did not share its data with anything
+        """
+        copies_to_nbytes = dict()
+        for state in self.undo_stack:
+            copies_to_nbytes.update(state.copies_to_nbytes)
+        return sum(copies_to_nbytes.values())
+
     def undo(self):
         if self.undo_stack:
             self.redo_stack.append(self.get_state())
@@ -758,6 +988,9 @@ class Scene(object):
         revert to the state of the scene the first time this function
         was called on a block of code starting with that comment.
         """
+        from IPython.core.getipython import get_ipython
+        import pyperclip
+
         shell = get_ipython()
         if shell is None or self.window is None:
             raise Exception(
@@ -994,15 +1227,38 @@ class SceneState():
         if ignore:
             for mob in ignore:
                 self.mobjects_to_copies.pop(mob, None)
+        # The data version of each mobject when its copy was made
+        self.mobjects_to_versions: dict[Mobject, int] = dict()
+        # Keyed by the ids of the copies
+        self.copies_to_nbytes: dict[int, int] = dict()
 
-        last_m2c = scene.undo_stack[-1].mobjects_to_copies if scene.undo_stack else dict()
+        last_state = scene.undo_stack[-1] if scene.undo_stack else None
         for mob in self.mobjects_to_copies:
             # If it hasn't changed since the last state, just point to the
             # same copy as before
-            if mob in last_m2c and last_m2c[mob].looks_identical(mob):
-                self.mobjects_to_copies[mob] = last_m2c[mob]
+            if last_state is not None and last_state.has_unchanged_copy(mob):
+                mob_copy = last_state.mobjects_to_copies[mob]
             else:
-                self.mobjects_to_copies[mob] = mob.copy()
+                # Copies share data arrays with the mobjects they're made
+                # from, until either is changed
+                mob_copy = mob.get_snapshot()
+            self.mobjects_to_copies[mob] = mob_copy
+            self.mobjects_to_versions[mob] = mob._data_version
+            self.copies_to_nbytes[id(mob_copy)] = sum(
+                sm.data.nbytes for sm in mob_copy.get_family()
+            )
+
+    def has_unchanged_copy(self, mob: Mobject) -> bool:
+        if self.mobjects_to_versions.get(mob) != mob._data_version:
+            return False
+        # Uniforms are changed without touching the data version
+        return all(
+            sm1.uniforms.keys() == sm2.uniforms.keys() and all(
+                np.array_equal(value, sm2.uniforms[key])
+                for key, value in sm1.uniforms.items()
+            )
+            for sm1, sm2 in zip(mob.get_family(), self.mobjects_to_copies[mob].get_family())
+        )
 
     def __eq__(self, state: SceneState):
         return all((
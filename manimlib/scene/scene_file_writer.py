@@ -2,29 +2,39 @@ from __future__ import annotations
 
 import os
 import platform
+import queue
 import shutil
 import subprocess as sp
 import sys
+import threading
+import time
+from collections import deque
 
-import numpy as np
-from pydub import AudioSegment
 from tqdm.auto import tqdm as ProgressDisplay
 from pathlib import Path
 
 from manimlib.constants import FFMPEG_BIN
 from manimlib.logger import log
 from manimlib.mobject.mobject import Mobject
+from manimlib.scene.audio_mixer import AudioMixer
+from manimlib.scene.frame_sinks import FFmpegSink
 from manimlib.utils.file_ops import add_extension_if_not_present
 from manimlib.utils.file_ops import get_sorted_integer_files
 from manimlib.utils.file_ops import guarantee_existence
+from manimlib.utils.file_ops import link_or_copy_file
 from manimlib.utils.sounds import get_full_sound_file_path
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Sequence
+
+    import moderngl
     from PIL.Image import Image
+    from pydub import AudioSegment
 
     from manimlib.camera.camera import Camera
+    from manimlib.scene.frame_sinks import FrameSink
     from manimlib.scene.scene import Scene
 
 
@@ -34,6 +44,10 @@ class SceneFileWriter(object):
         scene: Scene,
         write_to_movie: bool = False,
         break_into_partial_movies: bool = False,
+        # If true, each partial movie file is also stored under a hash of
+        # the scene state and animations producing it, and reused on later
+        # runs rather than being re-rendered.
+        cache_partial_movies: bool = False,
         save_pngs: bool = False,  # TODO, this currently does nothing
         png_mode: str = "RGBA",
         save_last_frame: bool = False,
@@ -53,10 +67,27 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # Further arguments for ffmpeg when encoding movies, e.g. ["-crf", "18"]
+        ffmpeg_args: Sequence[str] = (),
+        # If false, sounds are only logged in added_sounds, e.g. for when
+        # this scene is one of several pieces to be combined elsewhere
+        mix_sounds: bool = True,
+        # Frames are read from the GPU into a ring of this many pixel
+        # buffers, so that reading out one frame overlaps with rendering
+        # the next few
+        n_frame_buffers: int = 3,
+        # Maximum number of frames waiting to be piped to ffmpeg by
+        # the writer thread before rendering blocks
+        max_queued_frames: int = 8,
+        # Further places to send each rendered frame, alongside or instead
+        # of a movie file, e.g. a CallbackSink or SocketSink.  These stay
+        # open for the whole scene, across partial movies.
+        frame_sinks: Sequence[FrameSink] = (),
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
         self.break_into_partial_movies = break_into_partial_movies
+        self.cache_partial_movies = cache_partial_movies
         self.save_pngs = save_pngs
         self.png_mode = png_mode
         self.save_last_frame = save_last_frame
@@ -74,11 +105,29 @@ class SceneFileWriter(object):
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.ffmpeg_args = list(ffmpeg_args)
+        self.mix_sounds = mix_sounds
+        self.n_frame_buffers = n_frame_buffers
+        self.max_queued_frames = max_queued_frames
+        self.frame_sinks = list(frame_sinks)
 
         # State during file writing
-        self.writing_process: sp.Popen | None = None
+        self.movie_sink: FFmpegSink | None = None
+        self.active_sinks: list[FrameSink] = []
+        self.frame_sinks_are_open: bool = False
+        self.writing_thread: threading.Thread | None = None
+        self.writing_error: Exception | None = None
+        self.frame_queue: queue.Queue = queue.Queue(maxsize=max(max_queued_frames, 1))
+        self.free_frame_buffers: list[moderngl.Buffer] = []
+        # Entries of None stand for a repeat of the frame before
+        self.pending_frame_buffers: deque[moderngl.Buffer | None] = deque()
+        self.last_frame_bytes: bytes | None = None
+        self.n_written_frames: int = 0
+        self.writing_time: float = 0.0
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
+        self.is_reusing_partial_movie: bool = False
+        self.partial_movie_cache_path: str | None = None
         self.init_output_directories()
         self.init_audio()
 
@@ -101,6 +150,10 @@ class SceneFileWriter(object):
                 self.partial_movie_directory = guarantee_existence(os.path.join(
                     movie_dir, "partial_movie_files", scene_name,
                 ))
+                # Shared between scenes, since files are named by content
+                self.partial_movie_cache_directory = guarantee_existence(os.path.join(
+                    movie_dir, "partial_movie_files", ".cache",
+                ))
         # A place to save mobjects
         self.saved_mobject_directory = os.path.join(
             out_dir, "mobjects", str(self.scene)
@@ -143,6 +196,12 @@ class SceneFileWriter(object):
         )
         return result
 
+    def get_cached_partial_movie_path(self, play_hash: str) -> str:
+        return os.path.join(
+            self.partial_movie_cache_directory,
+            play_hash + self.movie_file_extension,
+        )
+
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
@@ -182,9 +241,8 @@ class SceneFileWriter(object):
     # Sound
     def init_audio(self) -> None:
         self.includes_sound: bool = False
-
-    def create_audio_segment(self) -> None:
-        self.audio_segment = AudioSegment.silent()
+        self.added_sounds: list[tuple] = []
+        self.audio_mixer = AudioMixer()
 
     def add_audio_segment(
         self,
@@ -192,28 +250,8 @@ class SceneFileWriter(object):
         time: float | None = None,
         gain_to_background: float | None = None
     ) -> None:
-        if not self.includes_sound:
-            self.includes_sound = True
-            self.create_audio_segment()
-        segment = self.audio_segment
-        curr_end = segment.duration_seconds
-        if time is None:
-            time = curr_end
-        if time < 0:
-            raise Exception("Adding sound at timestamp < 0")
-
-        new_end = time + new_segment.duration_seconds
-        diff = new_end - curr_end
-        if diff > 0:
-            segment = segment.append(
-                AudioSegment.silent(int(np.ceil(diff * 1000))),
-                crossfade=0,
-            )
-        self.audio_segment = segment.overlay(
-            new_segment,
-            position=int(1000 * time),
-            gain_during_overlay=gain_to_background,
-        )
+        self.includes_sound = True
+        self.audio_mixer.add_segment(new_segment, time, gain_to_background)
 
     def add_sound(
         self,
@@ -222,24 +260,66 @@ class SceneFileWriter(object):
         gain: float | None = None,
         gain_to_background: float | None = None
     ) -> None:
+        self.added_sounds.append((sound_file, time, gain, gain_to_background))
+        if not self.mix_sounds:
+            return
         file_path = get_full_sound_file_path(sound_file)
-        new_segment = AudioSegment.from_file(file_path)
-        if gain:
-            new_segment = new_segment.apply_gain(gain)
-        self.add_audio_segment(new_segment, time, gain_to_background)
+        self.includes_sound = True
+        self.audio_mixer.add_sound(file_path, time, gain, gain_to_background)
 
     # Writers
     def begin(self) -> None:
         if not self.break_into_partial_movies and self.write_to_movie:
             self.open_movie_pipe(self.get_movie_file_path())
+        elif self.frame_sinks:
+            self.open_frame_pipe()
+
+    def is_caching_partial_movies(self) -> bool:
+        return all([
+            self.cache_partial_movies,
+            self.break_into_partial_movies,
+            self.write_to_movie,
+            # Reused movies have no frames rendered to pass on to other sinks
+            not self.frame_sinks,
+        ])
 
-    def begin_animation(self) -> None:
-        if self.break_into_partial_movies and self.write_to_movie:
-            self.open_movie_pipe(self.get_next_partial_movie_path())
+    def get_output_settings(self) -> tuple:
+        # Everything which affects the encoded partial movie files,
+        # apart from what is being drawn
+        return (
+            self.scene.camera.get_pixel_shape(),
+            self.scene.camera.fps,
+            self.scene.camera.background_rgba,
+            self.movie_file_extension,
+            self.video_codec,
+            self.pixel_format,
+            self.saturation,
+            self.gamma,
+            self.ffmpeg_args,
+        )
+
+    def begin_animation(self, play_hash: str | None = None) -> None:
+        if not (self.break_into_partial_movies and self.write_to_movie):
+            return
+        movie_path = self.get_next_partial_movie_path()
+        if play_hash is not None and self.is_caching_partial_movies():
+            self.partial_movie_cache_path = self.get_cached_partial_movie_path(play_hash)
+            if os.path.exists(self.partial_movie_cache_path):
+                link_or_copy_file(self.partial_movie_cache_path, movie_path)
+                self.is_reusing_partial_movie = True
+                return
+        self.open_movie_pipe(movie_path)
 
     def end_animation(self) -> None:
-        if self.break_into_partial_movies and self.write_to_movie:
+        if not (self.break_into_partial_movies and self.write_to_movie):
+            return
+        if self.is_reusing_partial_movie:
+            self.is_reusing_partial_movie = False
+        else:
             self.close_movie_pipe()
+            if self.partial_movie_cache_path is not None and not self.ended_with_interrupt:
+                link_or_copy_file(self.final_file_path, self.partial_movie_cache_path)
+        self.partial_movie_cache_path = None
 
     def finish(self) -> None:
         if self.write_to_movie:
@@ -250,6 +330,10 @@ class SceneFileWriter(object):
             if self.includes_sound:
                 self.add_sound_to_video()
             self.print_file_ready_message(self.get_movie_file_path())
+            self.print_frame_rate_message()
+        if self.writing_thread is not None:
+            self.close_frame_pipe()
+        self.close_frame_sinks()
         if self.save_last_frame:
             self.scene.update_frame(force_draw=True)
             self.save_final_image(self.scene.get_image())
@@ -261,31 +345,16 @@ class SceneFileWriter(object):
         self.final_file_path = file_path
         self.temp_file_path = stem + "_temp" + ext
 
-        fps = self.scene.camera.fps
-        width, height = self.scene.camera.get_pixel_shape()
-
-        vf_arg = 'vflip'
-        # if self.pixel_format.startswith("yuv"):
-        vf_arg += f',eq=saturation={self.saturation}:gamma={self.gamma}'
-
-        command = [
-            FFMPEG_BIN,
-            '-y',  # overwrite output file if it exists
-            '-f', 'rawvideo',
-            '-s', f'{width}x{height}',  # size of one frame
-            '-pix_fmt', 'rgba',
-            '-r', str(fps),  # frames per second
-            '-i', '-',  # The input comes from a pipe
-            '-vf', vf_arg,
-            '-an',  # Tells FFMPEG not to expect any audio
-            '-loglevel', 'error',
-        ]
-        if self.video_codec:
-            command += ['-vcodec', self.video_codec]
-        if self.pixel_format:
-            command += ['-pix_fmt', self.pixel_format]
-        command += [self.temp_file_path]
-        self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        self.movie_sink = FFmpegSink(
+            self.temp_file_path,
+            video_codec=self.video_codec,
+            pixel_format=self.pixel_format,
+            saturation=self.saturation,
+            gamma=self.gamma,
+            ffmpeg_args=self.ffmpeg_args,
+        )
+        self.movie_sink.open(*self.scene.camera.get_pixel_shape(), self.scene.camera.fps)
+        self.open_frame_pipe()
 
         if not self.quiet:
             self.progress_display = ProgressDisplay(
@@ -296,6 +365,53 @@ class SceneFileWriter(object):
             )
             self.set_progress_display_description()
 
+    def open_frame_pipe(self) -> None:
+        """
+        Starts the writing thread, which passes rendered frames on to
+        the movie file being written, if any, and to each frame sink
+        """
+        if self.writing_thread is not None:
+            # Frames were only going to the frame sinks until now
+            self.close_frame_pipe()
+        self.open_frame_sinks()
+        self.active_sinks = [
+            *([self.movie_sink] if self.movie_sink is not None else []),
+            *self.frame_sinks,
+        ]
+        self.init_frame_buffers()
+        self.writing_error = None
+        self.writing_thread = threading.Thread(
+            target=self.write_queued_frames,
+            daemon=True,
+        )
+        self.writing_thread.start()
+        self.pipe_open_time = time.perf_counter()
+
+    def close_frame_pipe(self) -> None:
+        while self.pending_frame_buffers:
+            self.flush_oldest_frame_buffer()
+        self.frame_queue.put(None)
+        self.writing_thread.join()
+        self.writing_thread = None
+        self.active_sinks = []
+        self.release_frame_buffers()
+        if self.writing_error is not None:
+            raise self.writing_error
+
+    def open_frame_sinks(self) -> None:
+        if self.frame_sinks_are_open:
+            return
+        for sink in self.frame_sinks:
+            sink.open(*self.scene.camera.get_pixel_shape(), self.scene.camera.fps)
+        self.frame_sinks_are_open = True
+
+    def close_frame_sinks(self) -> None:
+        if not self.frame_sinks_are_open:
+            return
+        for sink in self.frame_sinks:
+            sink.close()
+        self.frame_sinks_are_open = False
+
     def use_fast_encoding(self):
         self.video_codec = "libx264rgb"
         self.pixel_format = "rgb32"
@@ -320,6 +436,8 @@ class SceneFileWriter(object):
     def end_insert(self):
         self.close_movie_pipe()
         self.write_to_movie = False
+        if self.frame_sinks:
+            self.open_frame_pipe()
         self.print_file_ready_message(self.inserted_file_path)
 
     def has_progress_display(self):
@@ -339,17 +457,66 @@ class SceneFileWriter(object):
             full_desc += " " * (desc_len - len(full_desc))
         self.progress_display.set_description(full_desc)
 
-    def write_frame(self, camera: Camera) -> None:
-        if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
+    def init_frame_buffers(self) -> None:
+        camera = self.scene.camera
+        width, height = camera.get_pixel_shape()
+        n_bytes = width * height * camera.n_channels
+        self.free_frame_buffers = [
+            camera.ctx.buffer(reserve=n_bytes)
+            for _ in range(max(self.n_frame_buffers, 1))
+        ]
+        self.pending_frame_buffers.clear()
+        self.last_frame_bytes = None
+
+    def release_frame_buffers(self) -> None:
+        for buffer in self.free_frame_buffers:
+            buffer.release()
+        self.free_frame_buffers = []
+
+    def write_frame(self, camera: Camera, repeat_last_frame: bool = False) -> None:
+        if self.writing_thread is not None and not self.is_reusing_partial_movie:
+            if repeat_last_frame and (self.pending_frame_buffers or self.last_frame_bytes):
+                self.pending_frame_buffers.append(None)
+            else:
+                while not self.free_frame_buffers:
+                    self.flush_oldest_frame_buffer()
+                buffer = self.free_frame_buffers.pop()
+                camera.read_fbo_into(buffer, top_row_first=True)
+                self.pending_frame_buffers.append(buffer)
+            while len(self.pending_frame_buffers) > self.n_frame_buffers:
+                self.flush_oldest_frame_buffer()
             if self.progress_display is not None:
                 self.progress_display.update()
 
+    def flush_oldest_frame_buffer(self) -> None:
+        if self.writing_error is not None:
+            raise self.writing_error
+        # By now the read into this buffer has most likely finished,
+        # so mapping it should not stall the pipeline
+        buffer = self.pending_frame_buffers.popleft()
+        if buffer is not None:
+            self.last_frame_bytes = buffer.read()
+            self.free_frame_buffers.append(buffer)
+        self.frame_queue.put(self.last_frame_bytes)
+
+    def write_queued_frames(self) -> None:
+        # Runs on the writing thread, so that encoding and piping
+        # to ffmpeg happens alongside rendering
+        while (raw_bytes := self.frame_queue.get()) is not None:
+            if self.writing_error is not None:
+                continue
+            try:
+                for sink in self.active_sinks:
+                    sink.write_frame(raw_bytes)
+                self.n_written_frames += 1
+            except Exception as error:
+                self.writing_error = error
+
     def close_movie_pipe(self) -> None:
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
-        self.writing_process.terminate()
+        self.close_frame_pipe()
+        self.movie_sink.close()
+        self.movie_sink = None
+        self.writing_time += time.perf_counter() - self.pipe_open_time
         if self.progress_display is not None:
             self.progress_display.close()
 
@@ -409,18 +576,16 @@ class SceneFileWriter(object):
     def add_sound_to_video(self) -> None:
         movie_file_path = self.get_movie_file_path()
         stem, ext = os.path.splitext(movie_file_path)
-        sound_file_path = stem + ".wav"
-        # Makes sure sound file length will match video file
-        self.add_audio_segment(AudioSegment.silent(0))
-        self.audio_segment.export(
-            sound_file_path,
-            bitrate='312k',
-        )
         temp_file_path = stem + "_temp" + ext
+        mixer = self.audio_mixer
         commands = [
             FFMPEG_BIN,
             "-i", movie_file_path,
-            "-i", sound_file_path,
+            # The mixed sound is piped in as raw samples
+            "-f", "s16le",
+            "-ar", str(mixer.sample_rate),
+            "-ac", str(mixer.n_channels),
+            "-i", "-",
             '-y',  # overwrite output file if it exists
             "-c:v", "copy",
             "-c:a", "aac",
@@ -433,9 +598,11 @@ class SceneFileWriter(object):
             # "-shortest",
             temp_file_path,
         ]
-        sp.call(commands)
+        mux_process = sp.Popen(commands, stdin=sp.PIPE)
+        mixer.write_raw(mux_process.stdin)
+        mux_process.stdin.close()
+        mux_process.wait()
         shutil.move(temp_file_path, movie_file_path)
-        os.remove(sound_file_path)
 
     def save_final_image(self, image: Image) -> None:
         file_path = self.get_image_file_path()
@@ -446,6 +613,15 @@ class SceneFileWriter(object):
         if not self.quiet:
             log.info(f"File ready at {file_path}")
 
+    def print_frame_rate_message(self) -> None:
+        if self.quiet or self.n_written_frames == 0 or self.writing_time == 0:
+            return
+        log.info("Wrote {} frames in {:.2f} seconds ({:.1f} frames per second)".format(
+            self.n_written_frames,
+            self.writing_time,
+            self.n_written_frames / self.writing_time,
+        ))
+
     def should_open_file(self) -> bool:
         return any([
             self.show_file_location_upon_completion,
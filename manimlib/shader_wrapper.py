@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import itertools as it
 import os
 import re
 
@@ -21,6 +22,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import List, Optional, Dict
+    from manimlib.mobject.mobject import Mobject
     from manimlib.typing import UniformDict
 
 # Mobjects that should be rendered with
@@ -43,7 +45,7 @@ class ShaderWrapper(object):
         code_replacements: dict[str, str] = dict(),
     ):
         self.ctx = ctx
-        self.vert_data = vert_data
+        self.vert_data = np.zeros(0, dtype=vert_data.dtype)
         self.vert_attributes = vert_data.dtype.names
         self.shader_folder = shader_folder
         self.depth_test = depth_test
@@ -98,6 +100,8 @@ class ShaderWrapper(object):
     def init_vertex_objects(self):
         self.vbo = None
         self.vaos = []
+        self.n_verts = 0
+        self.mobject_slots = []
 
     def add_texture(self, name: str, texture: moderngl.Texture):
         max_units = self.ctx.info['GL_MAX_TEXTURE_IMAGE_UNITS']
@@ -151,26 +155,70 @@ class ShaderWrapper(object):
 
     def read_in(self, data_list: Iterable[np.ndarray]):
         total_len = sum(map(len, data_list))
+        self.mobject_slots = []
         if total_len == 0:
-            if self.vbo is not None:
-                self.vbo.clear()
+            self.set_n_verts(0)
             return
 
-        # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
-            self.vert_data = np.concatenate(data_list)
-        else:
-            np.concatenate(data_list, out=self.vert_data)
-
-        # Either create new vbo, or read data into it
-        total_size = self.vert_data.itemsize * total_len
-        if self.vbo is not None and self.vbo.size != total_size:
-            self.release()  # This sets vbo to be None
-        if self.vbo is None:
-            self.vbo = self.ctx.buffer(self.vert_data)
+        # The vbo is only reallocated when it needs to grow, and then with
+        # room to spare, so that it and the vaos persist as the number of
+        # vertices changes
+        if self.vbo is None or total_len > len(self.vert_data):
+            self.release()
+            capacity = max(total_len, 2 * len(self.vert_data))
+            self.vert_data = np.zeros(capacity, dtype=self.vert_data.dtype)
+            self.vbo = self.ctx.buffer(reserve=self.vert_data.nbytes)
             self.generate_vaos()
-        else:
-            self.vbo.write(self.vert_data)
+
+        np.concatenate(data_list, out=self.vert_data[:total_len])
+        self.vbo.write(self.vert_data[:total_len])
+        self.set_n_verts(total_len)
+
+    def read_in_mobjects(self, mobjects: list[Mobject]):
+        """
+        Equivalent to calling read_in on the shader data of each mobject,
+        except that each mobject is given a slot of the vbo, and when the
+        same mobjects are read in again, only those whose data has changed
+        since are gathered and written
+        """
+        slots = self.mobject_slots
+        if len(slots) != len(mobjects) or any(s[0] is not m for s, m in zip(slots, mobjects)):
+            self.read_in_new_mobjects(mobjects)
+            return
+
+        dirty_start, dirty_end = self.n_verts, 0
+        for slot in slots:
+            mob, data, version, start, end = slot
+            if mob.data is data and mob._data_version == version:
+                continue
+            shader_data = mob.get_shader_data()
+            if len(shader_data) != end - start:
+                self.read_in_new_mobjects(mobjects)
+                return
+            self.vert_data[start:end] = shader_data
+            slot[1:3] = [mob.data, mob._data_version]
+            dirty_start = min(dirty_start, start)
+            dirty_end = max(dirty_end, end)
+
+        if dirty_end > dirty_start:
+            self.vbo.write(
+                self.vert_data[dirty_start:dirty_end],
+                offset=dirty_start * self.vert_data.itemsize
+            )
+
+    def read_in_new_mobjects(self, mobjects: list[Mobject]):
+        data_list = [mob.get_shader_data() for mob in mobjects]
+        self.read_in(data_list)
+        ends = list(it.accumulate(map(len, data_list)))
+        self.mobject_slots = [
+            [mob, mob.data, mob._data_version, end - len(data), end]
+            for mob, data, end in zip(mobjects, data_list, ends)
+        ]
+
+    def set_n_verts(self, n_verts: int):
+        self.n_verts = n_verts
+        for vao in self.vaos:
+            vao.vertices = n_verts
 
     def generate_vaos(self):
         # Vertex array object
@@ -191,6 +239,8 @@ class ShaderWrapper(object):
             texture.use(tid)
 
     def render(self):
+        if self.n_verts == 0:
+            return
         for vao in self.vaos:
             vao.render()
 
@@ -217,6 +267,10 @@ class ShaderWrapper(object):
 
 
 class VShaderWrapper(ShaderWrapper):
+    # Scale for the resolution of the canvas fill is drawn to, which
+    # previews may lower to draw faster, see get_fill_canvas
+    fill_canvas_scale: float = 1.0
+
     def __init__(
         self,
         ctx: moderngl.context.Context,
@@ -309,6 +363,8 @@ class VShaderWrapper(ShaderWrapper):
         self.fill_vao = None
         self.fill_border_vao = None
         self.vaos = []
+        self.n_verts = 0
+        self.mobject_slots = []
 
     def generate_vaos(self):
         self.stroke_vao = self.ctx.vertex_array(
@@ -342,16 +398,18 @@ class VShaderWrapper(ShaderWrapper):
 
     # Rendering
     def render_stroke(self):
-        if self.stroke_vao is None:
+        if self.stroke_vao is None or self.n_verts == 0:
             return
         self.stroke_vao.render()
 
     def render_fill(self):
-        if self.fill_vao is None:
+        if self.fill_vao is None or self.n_verts == 0:
             return
 
         original_fbo = self.ctx.fbo
-        fill_tx_fbo, fill_tx_vao, depth_tx_fbo = self.fill_canvas
+        fill_tx_fbo, fill_tx_vao, depth_tx_fbo = VShaderWrapper.get_fill_canvas(
+            self.ctx, VShaderWrapper.fill_canvas_scale
+        )
 
         # Render to a separate texture, due to strange alpha compositing
         # for the blended winding calculation
@@ -390,6 +448,9 @@ class VShaderWrapper(ShaderWrapper):
         original_fbo.use()
         gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
         gl.glBlendEquation(gl.GL_FUNC_ADD)
+        # In case the canvas is not the one bound in pre_render
+        fill_tx_fbo.color_attachments[0].use(self.texture_names_to_ids['Texture'])
+        depth_tx_fbo.color_attachments[0].use(self.texture_names_to_ids['DepthTexture'])
         fill_tx_vao.render()
 
         # Return to original blending state
@@ -398,7 +459,10 @@ class VShaderWrapper(ShaderWrapper):
     # Static method returning one shared value across all VShaderWrappers
     @lru_cache
     @staticmethod
-    def get_fill_canvas(ctx: moderngl.Context) -> Tuple[Framebuffer, VertexArray, Framebuffer]:
+    def get_fill_canvas(
+        ctx: moderngl.Context,
+        scale: float = 1.0,
+    ) -> Tuple[Framebuffer, VertexArray, Framebuffer]:
         """
         Because VMobjects with fill are rendered in a funny way, using
         alpha blending to effectively compute the winding number around
@@ -408,9 +472,14 @@ class VShaderWrapper(ShaderWrapper):
         This returns a texture, loaded into a frame buffer, and a vao
         which can display that texture as a simple quad onto a screen,
         along with the rgb value which is meant to be discarded.
+
+        Its resolution is twice that of the camera, times scale.
         """
         cam_config = get_configuration(parse_cli())['camera_config']
-        size = (cam_config['pixel_width'], cam_config['pixel_height'])
+        size = (
+            max(int(scale * cam_config['pixel_width']), 1),
+            max(int(scale * cam_config['pixel_height']), 1),
+        )
         double_size = (2 * size[0], 2 * size[1])
 
         # Important to make sure dtype is floating point (not fixed point)
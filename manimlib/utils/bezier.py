@@ -27,68 +27,178 @@ CLOSED_THRESHOLD = 0.001
 
 def bezier(
     points: Sequence[float | FloatArray] | VectNArray
-) -> Callable[[float], float | FloatArray]:
+) -> Callable[[float | FloatArray], float | FloatArray]:
     if len(points) == 0:
         raise Exception("bezier cannot be calld on an empty list")
 
     n = len(points) - 1
-
-    def result(t: float) -> float | FloatArray:
-        return sum(
-            ((1 - t)**(n - k)) * (t**k) * choose(n, k) * point
-            for k, point in enumerate(points)
-        )
+    coefs = [choose(n, k) for k in range(n + 1)]
+
+    def result(t: float | FloatArray) -> float | FloatArray:
+        if np.ndim(t) == 0:
+            return sum(
+                ((1 - t)**(n - k)) * (t**k) * coef * point
+                for k, (coef, point) in enumerate(zip(coefs, points))
+            )
+        # With the index of control points last, arrays of t broadcast
+        # against each point just as they would against one
+        point_array = np.moveaxis(np.asarray(points, dtype=float), 0, -1)
+        exponents = np.arange(n + 1)
+        t = np.asarray(t, dtype=float)[..., np.newaxis]
+        weights = np.array(coefs, dtype=float) * (1 - t)**(n - exponents) * t**exponents
+        return (weights * point_array).sum(-1)
 
     return result
 
 
 def partial_bezier_points(
-    points: Sequence[Scalable],
+    points: Sequence[Scalable] | np.ndarray,
     a: float,
     b: float
-) -> list[Scalable]:
+) -> np.ndarray:
     """
     Given an list of points which define
     a bezier curve, and two numbers 0<=a<b<=1,
-    return an list of the same size, which
+    return an array of the same size, which
     describes the portion of the original bezier
     curve on the interval [a, b].
 
-    This algorithm is pretty nifty, and pretty dense.
+    Both steps are de Casteljau's algorithm, run on
+    all control points at once.
     """
+    points = np.array(points, dtype=float)
     if a == 1:
-        return [points[-1]] * len(points)
+        return np.repeat(points[-1:], len(points), axis=0)
 
-    a_to_1 = [
-        bezier(points[i:])(a)
-        for i in range(len(points))
-    ]
+    n = len(points) - 1
+    # The i-th control point for the portion on [a, 1] is the last
+    # point left after n - i rounds of interpolating neighbors
+    a_to_1 = np.empty_like(points)
+    a_to_1[n] = points[n]
+    for k in range(1, n + 1):
+        points = (1 - a) * points[:-1] + a * points[1:]
+        a_to_1[n - k] = points[-1]
+
+    # Whereas the i-th control point for the portion of that on
+    # [0, end_prop] is the first point left after i rounds
     end_prop = (b - a) / (1. - a)
-    return [
-        bezier(a_to_1[:i + 1])(end_prop)
-        for i in range(len(points))
-    ]
+    result = np.empty_like(a_to_1)
+    result[0] = a_to_1[0]
+    for k in range(1, n + 1):
+        a_to_1 = (1 - end_prop) * a_to_1[:-1] + end_prop * a_to_1[1:]
+        result[k] = a_to_1[0]
+    return result
 
 
 # Shortened version of partial_bezier_points just for quadratics,
 # since this is called a fair amount
 def partial_quadratic_bezier_points(
     points: Sequence[VectN] | VectNArray,
-    a: float,
-    b: float
-) -> list[VectN]:
-    if a == 1:
-        return 3 * [points[-1]]
+    a: float | FloatArray,
+    b: float | FloatArray
+) -> np.ndarray:
+    """
+    Works on a single curve, with points of shape (3, dim), or on
+    many at once, with points of shape (..., 3, dim) and a and b
+    either numbers or arrays matching the leading shape
+    """
+    points = np.asarray(points)
+    p0, p1, p2 = (points[..., i, :] for i in range(3))
+    a = np.asarray(a, dtype=float)[..., np.newaxis]
+    b = np.asarray(b, dtype=float)[..., np.newaxis]
 
     def curve(t):
-        return points[0] * (1 - t) * (1 - t) + 2 * points[1] * t * (1 - t) + points[2] * t * t
-    # bezier(points)
-    h0 = curve(a) if a > 0 else points[0]
-    h2 = curve(b) if b < 1 else points[2]
-    h1_prime = (1 - a) * points[1] + a * points[2]
-    end_prop = (b - a) / (1. - a)
+        return p0 * (1 - t) * (1 - t) + 2 * p1 * t * (1 - t) + p2 * t * t
+
+    h0 = curve(a)
+    h2 = curve(b)
+    h1_prime = (1 - a) * p1 + a * p2
+    # Where a is 1, everything collapses onto the last point
+    end_prop = np.divide(b - a, 1. - a, out=np.zeros(a.shape), where=(a < 1))
     h1 = (1 - end_prop) * h0 + end_prop * h1_prime
-    return [h0, h1, h2]
+    return np.stack([h0, h1, h2], axis=-2)
+
+
+def subdivide_quadratic_bezier_path(
+    points: VectNArray,
+    n_inserts: Sequence[int] | np.ndarray
+) -> VectNArray:
+    """
+    Given the 2n + 1 anchors and handles of a path of n quadratic bezier
+    curves, break the i-th curve into n_inserts[i] + 1 pieces of equal
+    parameter length
+    """
+    n_inserts = np.asarray(n_inserts, dtype=int)
+    n_pieces = n_inserts + 1
+    curve_indices = np.repeat(np.arange(len(n_inserts)), n_pieces)
+    # Position of each piece within its curve
+    piece_indices = np.arange(len(curve_indices)) - np.repeat(np.cumsum(n_pieces) - n_pieces, n_pieces)
+    curves = points[2 * curve_indices[:, np.newaxis] + np.arange(3)]
+    pieces = partial_quadratic_bezier_points(
+        curves,
+        piece_indices / n_pieces[curve_indices],
+        (piece_indices + 1) / n_pieces[curve_indices],
+    )
+    return np.vstack([points[:1], pieces[:, 1:].reshape(-1, points.shape[1])])
+
+
+def partial_quadratic_bezier_paths(
+    paths: Sequence[VectNArray],
+    lower: Sequence[float] | FloatArray,
+    upper: Sequence[float] | FloatArray,
+) -> tuple[list[VectNArray], list[np.ndarray]]:
+    """
+    For each path of quadratic bezier curves, given by its 2n + 1 anchors
+    and handles with n > 0, find the portion from lower[i] to upper[i] of
+    the way through its curves.  The number of points stays the same, with
+    those outside the portion collapsed onto its ends.  All paths are
+    handled in one pass.
+
+    Alongside the new paths, this returns for each one a boolean array
+    marking which of its points are on curves touched by the portion.
+    """
+    if len(paths) == 0:
+        return [], []
+    lengths = np.array([len(path) for path in paths])
+    starts = np.cumsum(lengths) - lengths
+    points = np.concatenate(paths)
+    n_curves = (lengths - 1) // 2
+
+    lower_index, lower_residue = integer_interpolate_array(0, n_curves, lower)
+    upper_index, upper_residue = integer_interpolate_array(0, n_curves, upper)
+    same_curve = (lower_index == upper_index)
+    low_curves = partial_quadratic_bezier_points(
+        points[(starts + 2 * lower_index)[:, np.newaxis] + np.arange(3)],
+        lower_residue,
+        np.where(same_curve, upper_residue, 1),
+    )
+    high_curves = partial_quadratic_bezier_points(
+        points[(starts + 2 * upper_index)[:, np.newaxis] + np.arange(3)],
+        np.where(same_curve, lower_residue, 0),
+        upper_residue,
+    )
+
+    # For each point, which path it's in and where it sits in that path
+    path_indices = np.repeat(np.arange(len(paths)), lengths)
+    low_index = (2 * lower_index)[path_indices]
+    high_index = (2 * upper_index)[path_indices]
+    local_index = np.arange(len(points)) - starts[path_indices]
+
+    new_points = points.copy()
+    before = local_index < low_index
+    new_points[before] = low_curves[path_indices[before], 0]
+    in_low = ~before & (local_index < low_index + 3)
+    new_points[in_low] = low_curves[path_indices[in_low], (local_index - low_index)[in_low]]
+    after = local_index >= high_index + 3
+    in_high = (local_index >= high_index) & ~after
+    new_points[in_high] = high_curves[path_indices[in_high], (local_index - high_index)[in_high]]
+    new_points[after] = high_curves[path_indices[after], 2]
+
+    split_indices = starts[1:]
+    return (
+        np.split(new_points, split_indices),
+        np.split(~(before | after), split_indices),
+    )
 
 
 # Linear interpolation variants
@@ -150,6 +260,25 @@ def integer_interpolate(
     return (value, residue)
 
 
+def integer_interpolate_array(
+    start: int | np.ndarray,
+    end: int | np.ndarray,
+    alpha: float | FloatArray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Version of integer_interpolate for arrays of alphas and/or ends
+    """
+    alpha = np.asarray(alpha, dtype=float)
+    start, end, alpha = np.broadcast_arrays(start, end, alpha)
+    values = interpolate(start, end, alpha).astype(int)
+    residues = ((end - start) * alpha) % 1
+    values[alpha <= 0] = start[alpha <= 0]
+    residues[alpha <= 0] = 0
+    values[alpha >= 1] = end[alpha >= 1] - 1
+    residues[alpha >= 1] = 1.0
+    return values, residues
+
+
 def mid(start: Scalable, end: Scalable) -> Scalable:
     return (start + end) / 2.0
 
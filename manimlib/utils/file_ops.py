@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import shutil
 
 import numpy as np
 import validators
@@ -25,6 +26,20 @@ def guarantee_existence(path: str) -> str:
     return os.path.abspath(path)
 
 
+def link_or_copy_file(src: str, dst: str) -> str:
+    """
+    Makes dst a hard link to src where the file system allows it,
+    and otherwise falls back to copying the file
+    """
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+    return dst
+
+
 def find_file(
     file_name: str,
     directories: Iterable[str] | None = None,
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
+import os
+import sysconfig
+import types
+
+import numpy as np
+
+from manimlib.mobject.mobject import Mobject
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+PRIMITIVE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+# Code from these directories is taken not to change between runs
+LIBRARY_DIRS = tuple(dict.fromkeys(
+    os.path.join(os.path.normcase(os.path.realpath(path)), "")
+    for path in [
+        os.path.dirname(os.path.dirname(__file__)),
+        *(sysconfig.get_paths()[key] for key in ["stdlib", "platstdlib", "purelib", "platlib"]),
+    ]
+))
+
+
+def get_hash(*objects: Any) -> str:
+    """
+    Returns a hex digest describing the given objects, such that
+    the same description in a later process yields the same hash.
+
+    Mobjects contribute the data and uniforms of their full family,
+    functions contribute their bytecode, constants and closures, along
+    with the global values they refer to when defined outside of manimlib
+    and installed packages, e.g. in a scene file (modules of such code
+    contribute their source), and
+    animations (or any other object with a __dict__ from manimlib)
+    contribute their attributes.  Anything else falls back to its repr,
+    which for most objects includes a memory address, so that such
+    objects never produce a stale cache hit.
+    """
+    hasher = hashlib.sha256()
+    memo = dict()
+    for obj in objects:
+        update_hash(hasher, obj, memo)
+    return hasher.hexdigest()[:32]
+
+
+def update_hash(hasher, obj: Any, memo: dict[int, int]) -> None:
+    if isinstance(obj, PRIMITIVE_TYPES) or isinstance(obj, np.generic):
+        hasher.update(f"{type(obj).__name__}:{obj!r};".encode())
+        return
+    if isinstance(obj, np.ndarray):
+        hasher.update(f"array:{obj.dtype.str}:{obj.shape};".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+        return
+
+    # Objects which might reference themselves are only described once
+    if id(obj) in memo:
+        hasher.update(f"ref:{memo[id(obj)]};".encode())
+        return
+    memo[id(obj)] = len(memo)
+
+    if isinstance(obj, Mobject):
+        update_hash_with_mobject(hasher, obj, memo)
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"{type(obj).__name__}:{len(obj)};".encode())
+        for item in obj:
+            update_hash(hasher, item, memo)
+    elif isinstance(obj, (set, frozenset)):
+        # Iteration order of sets is not stable between processes
+        for digest in sorted(get_hash(item) for item in obj):
+            hasher.update(digest.encode())
+    elif isinstance(obj, dict):
+        hasher.update(f"dict:{len(obj)};".encode())
+        for key, value in obj.items():
+            update_hash(hasher, key, memo)
+            update_hash(hasher, value, memo)
+    elif isinstance(obj, types.MethodType):
+        update_hash(hasher, obj.__func__, memo)
+        update_hash(hasher, obj.__self__, memo)
+    elif isinstance(obj, types.FunctionType):
+        hasher.update(f"function:{obj.__module__}.{obj.__qualname__};".encode())
+        update_hash(hasher, obj.__code__, memo)
+        update_hash(hasher, obj.__defaults__, memo)
+        update_hash(hasher, obj.__kwdefaults__, memo)
+        for cell in (obj.__closure__ or []):
+            try:
+                update_hash(hasher, cell.cell_contents, memo)
+            except ValueError:
+                # Empty cell
+                hasher.update(b"empty_cell;")
+        if is_user_code(obj.__code__):
+            # Constants and helper functions at the module level of a
+            # scene file can be edited between runs
+            for name in get_global_names(obj.__code__):
+                if name in obj.__globals__:
+                    update_hash(hasher, name, memo)
+                    update_hash(hasher, obj.__globals__[name], memo)
+    elif isinstance(obj, types.CodeType):
+        hasher.update(obj.co_code)
+        update_hash(hasher, obj.co_consts, memo)
+        update_hash(hasher, obj.co_names, memo)
+    elif isinstance(obj, types.ModuleType):
+        hasher.update(f"module:{obj.__name__};".encode())
+        file_name = getattr(obj, "__file__", None)
+        if file_name and is_user_file(file_name):
+            update_hash_with_file(hasher, file_name)
+    elif isinstance(obj, type):
+        hasher.update(f"type:{obj.__module__}.{obj.__qualname__};".encode())
+        for name, value in vars(obj).items():
+            if isinstance(value, types.FunctionType) and is_user_code(value.__code__):
+                update_hash(hasher, name, memo)
+                update_hash(hasher, value, memo)
+    elif type(obj).__module__.startswith("manimlib") and hasattr(obj, "__dict__"):
+        update_hash(hasher, type(obj), memo)
+        update_hash(hasher, vars(obj), memo)
+    else:
+        hasher.update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+
+def is_user_code(code: types.CodeType) -> bool:
+    return is_user_file(code.co_filename)
+
+
+@lru_cache
+def is_user_file(file_name: str) -> bool:
+    path = os.path.normcase(os.path.realpath(file_name))
+    return not path.startswith(LIBRARY_DIRS)
+
+
+def update_hash_with_file(hasher, file_name: str) -> None:
+    if not os.path.isfile(file_name):
+        hasher.update(b"no_file;")
+        return
+    stat = os.stat(file_name)
+    hasher.update(get_file_digest(file_name, stat.st_size, stat.st_mtime_ns))
+
+
+@lru_cache
+def get_file_digest(file_name: str, size: int, mtime_ns: int) -> bytes:
+    # Keyed by size and modification time, so that large files like
+    # textures are only read again once they change
+    with open(file_name, "rb") as fp:
+        return hashlib.sha256(fp.read()).digest()
+
+
+def get_global_names(code: types.CodeType) -> list[str]:
+    """
+    Names which code, or code nested within it like that of a lambda,
+    might look up among the globals of its module
+    """
+    names = dict.fromkeys(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(dict.fromkeys(get_global_names(const)))
+    return list(names)
+
+
+def update_hash_with_mobject(hasher, mobject: Mobject, memo: dict[int, int]) -> None:
+    for mob in mobject.get_family():
+        memo.setdefault(id(mob), len(memo))
+        update_hash(hasher, type(mob), memo)
+        update_hash(hasher, mob.data, memo)
+        update_hash(hasher, mob.uniforms, memo)
+        update_hash(hasher, len(mob.submobjects), memo)
+        update_hash(hasher, mob.shader_folder, memo)
+        update_hash(hasher, mob.shader_code_replacements, memo)
+        update_hash(hasher, mob.texture_paths, memo)
+        # Image files can be edited in place between runs
+        for path in mob.texture_paths.values():
+            update_hash_with_file(hasher, path)
+        update_hash(hasher, mob.depth_test, memo)
+        update_hash(hasher, mob.z_index, memo)
+        update_hash(hasher, mob.updaters, memo)
+        update_hash(hasher, mob.updating_suspended, memo)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+
+import moderngl
+
+from manimlib.logger import log
+
+
+RENDER_BACKENDS = ("default", "egl", "software")
+
+# Where glvnd looks for Mesa's EGL implementation on most linux distributions
+MESA_EGL_VENDOR_FILE = "/usr/share/glvnd/egl_vendor.d/50_mesa.json"
+
+PROBE_VERTEX_SHADER = '''
+    #version 330
+    in vec2 point;
+    void main() {
+        gl_Position = vec4(point, 0.0, 1.0);
+    }
+'''
+
+PROBE_GEOMETRY_SHADER = '''
+    #version 330
+    layout (points) in;
+    layout (points, max_vertices = 1) out;
+    void main() {
+        gl_Position = gl_in[0].gl_Position;
+        EmitVertex();
+        EndPrimitive();
+    }
+'''
+
+PROBE_FRAGMENT_SHADER = '''
+    #version 330
+    out vec4 color;
+    void main() {
+        color = vec4(1.0);
+    }
+'''
+
+
+def create_standalone_context(
+    backend: str = "default",
+    software_threads: int = 0,
+) -> moderngl.Context:
+    """
+    Creates an OpenGL context which does not need a window.
+
+    "default" lets moderngl choose how, falling back to EGL if that fails,
+    as it does on machines with no display.  "egl" always uses EGL.
+    "software" uses EGL with Mesa's llvmpipe rasterizer, for machines with
+    no GPU, drawing with software_threads threads (0 for Mesa's default).
+    """
+    if backend not in RENDER_BACKENDS:
+        raise ValueError(
+            f"Unknown render backend {backend}, must be one of {RENDER_BACKENDS}"
+        )
+    if backend == "software":
+        # These are read by Mesa when the context is created, so they
+        # only need to be set before that
+        os.environ["LIBGL_ALWAYS_SOFTWARE"] = "1"
+        os.environ["GALLIUM_DRIVER"] = "llvmpipe"
+        if software_threads > 0:
+            os.environ["LP_NUM_THREADS"] = str(software_threads)
+        if os.path.exists(MESA_EGL_VENDOR_FILE):
+            os.environ.setdefault("__EGL_VENDOR_LIBRARY_FILENAMES", MESA_EGL_VENDOR_FILE)
+        ctx = moderngl.create_standalone_context(backend="egl")
+        renderer = ctx.info["GL_RENDERER"]
+        if "llvmpipe" not in renderer:
+            log.warning(f"Software rendering was requested, but the renderer is {renderer}")
+        return ctx
+    if backend == "egl":
+        return moderngl.create_standalone_context(backend="egl")
+    try:
+        return moderngl.create_standalone_context()
+    except Exception as err:
+        log.warning(f"Could not create an OpenGL context ({err}), trying EGL instead")
+        return moderngl.create_standalone_context(backend="egl")
+
+
+def get_missing_capabilities(ctx: moderngl.Context) -> list[str]:
+    """
+    Returns a description of each feature used in rendering which the
+    context lacks, so that an unsuitable driver is reported up front
+    rather than failing partway through a scene
+    """
+    if ctx.version_code < 330:
+        return [f"OpenGL 3.3 (found {ctx.info['GL_VERSION']})"]
+
+    missing = []
+    try:
+        ctx.program(
+            vertex_shader=PROBE_VERTEX_SHADER,
+            geometry_shader=PROBE_GEOMETRY_SHADER,
+            fragment_shader=PROBE_FRAGMENT_SHADER,
+        ).release()
+    except Exception:
+        missing.append("geometry shaders")
+
+    # VMobject fill is drawn to floating point textures, see VShaderWrapper.get_fill_canvas
+    for dtype, components in [("f2", 4), ("f4", 1)]:
+        try:
+            texture = ctx.texture((4, 4), components=components, dtype=dtype)
+            fbo = ctx.framebuffer(texture)
+            fbo.release()
+            texture.release()
+        except Exception:
+            missing.append(f"rendering to {dtype} textures")
+    return missing
+
+
+def get_renderer_description(ctx: moderngl.Context) -> str:
+    return "{} ({}, OpenGL {})".format(
+        ctx.info["GL_RENDERER"],
+        ctx.info["GL_VENDOR"],
+        ctx.info["GL_VERSION"],
+    )
@@ -365,12 +365,13 @@ def get_closest_point_on_line(a: VectN, b: VectN, p: VectN) -> VectN:
 
 
 def get_winding_number(points: Sequence[Vect2 | Vect3]) -> float:
-    total_angle = 0
-    for p1, p2 in adjacent_pairs(points):
-        d_angle = angle_of_vector(p2) - angle_of_vector(p1)
-        d_angle = ((d_angle + PI) % TAU) - PI
-        total_angle += d_angle
-    return total_angle / TAU
+    points = np.array(points, dtype=float).reshape(len(points), -1)
+    if len(points) == 0:
+        return 0.0
+    angles = np.arctan2(points[:, 1], points[:, 0])
+    d_angles = np.roll(angles, -1) - angles
+    d_angles = ((d_angles + PI) % TAU) - PI
+    return d_angles.sum() / TAU
 
 
 ##
@@ -431,17 +432,12 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
         list(range(e0, e1))
         for e0, e1 in zip([0, *ring_ends], ring_ends)
     ]
+    if len(rings) == 0:
+        return []
     epsilon = 1e-6
 
     def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
+        return abs(abs(get_winding_number(verts[rings[ring_id]] - point)) - 1) < epsilon
 
     # Points at the same position may cause problems
     for i in rings:
@@ -451,38 +447,32 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
         verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
 
     # First, we should know which rings are directly contained in it for each ring
-
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
+    ring_starts = np.array([0, *ring_ends[:-1]], dtype=int)
+    ring_stops = np.array(ring_ends, dtype=int)
+    xs = verts[:ring_ends[-1], 0]
+    ys = verts[:ring_ends[-1], 1]
+    right = np.maximum.reduceat(xs, ring_starts)
+    left = np.minimum.reduceat(xs, ring_starts)
+    top = np.maximum.reduceat(ys, ring_starts)
+    bottom = np.minimum.reduceat(ys, ring_starts)
+    # Shoelace formula, without closing each ring
+    cum_cross = np.hstack([0, np.cumsum(cross2d(verts[1:, :2], verts[:-1, :2]))])
+    area = np.abs(cum_cross[ring_stops - 1] - cum_cross[ring_starts]) / 2
 
     # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
-    rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
+    rings_sorted = np.argsort(-area, kind="stable")
 
     chilren = [[] for i in rings]
-    ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
-        leave=False,
-        ascii=True if platform.system() == 'Windows' else None,
-        dynamic_ncols=True,
-        desc="SVG Triangulation",
-        delay=3,
-    )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
+    for idx, i in enumerate(rings_sorted):
+        # Only test winding numbers for the larger rings whose
+        # bounding boxes contain this one, starting from the smallest
+        candidates = rings_sorted[:idx][::-1]
+        candidates = candidates[
+            (left[candidates] <= left[i]) & (right[i] <= right[candidates]) &
+            (bottom[candidates] <= bottom[i]) & (top[i] <= top[candidates])
+        ]
+        for j in candidates:
+            if is_in(verts[rings[i][0]], j):
                 chilren[j].append(i)
                 break
 
@@ -499,6 +489,9 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
             used[j] = True
             v += rings[j]
             ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
+        res += [v[i] for i in earcut(
+            np.array(verts[v, :2], dtype=np.float32),
+            np.array(ring_ends, dtype=np.uint32),
+        )]
 
     return res
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from manimlib.mobject.mobject import Mobject
+    from manimlib.typing import Vect3, Vect3Array
+
+
+class BoundingBoxIndex(object):
+    """
+    Holds the bounding boxes of a list of mobjects in a single array, so that
+    asking which of them touch a point or a box is one vectorized test rather
+    than a call to each mobject.  A mobject's box is only read again once its
+    data has changed, as tracked by its data version.
+    """
+    def __init__(self, mobjects: Iterable[Mobject] = ()):
+        self.set_mobjects(mobjects)
+
+    def set_mobjects(self, mobjects: Iterable[Mobject]) -> None:
+        self.mobjects = list(mobjects)
+        self.versions = np.full(len(self.mobjects), -1)
+        # Lower left and upper right corners
+        self.boxes = np.zeros((len(self.mobjects), 2, 3))
+
+    def refresh(self) -> None:
+        versions = np.fromiter(
+            (mob._data_version for mob in self.mobjects),
+            dtype=int,
+            count=len(self.mobjects),
+        )
+        for index in np.flatnonzero(versions != self.versions):
+            self.boxes[index] = self.mobjects[index].get_bounding_box()[[0, 2]]
+        self.versions = versions
+
+    def get_indices_touching_point(self, point: Vect3, buff: float = 0) -> np.ndarray:
+        """
+        Matches Mobject.is_point_touching for each mobject
+        """
+        self.refresh()
+        return np.flatnonzero((
+            (self.boxes[:, 0] - buff <= point) & (point <= self.boxes[:, 1] + buff)
+        ).all(1))
+
+    def get_indices_touching_box(self, box: Vect3Array, buff: float = 0) -> np.ndarray:
+        """
+        Matches Mobject.is_touching against a mobject with the given
+        bounding box, for each mobject
+        """
+        self.refresh()
+        return np.flatnonzero(~(
+            (self.boxes[:, 1] < box[0] - buff).any(1) | (self.boxes[:, 0] > box[2] + buff).any(1)
+        ))
+
+    def get_mobjects_touching_point(self, point: Vect3, buff: float = 0) -> list[Mobject]:
+        return [self.mobjects[i] for i in self.get_indices_touching_point(point, buff)]
+
+    def get_mobjects_touching_box(self, box: Vect3Array, buff: float = 0) -> list[Mobject]:
+        return [self.mobjects[i] for i in self.get_indices_touching_box(box, buff)]
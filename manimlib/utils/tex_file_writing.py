@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import os
 import re
@@ -11,8 +12,17 @@ from manimlib.logger import log
 from manimlib.utils.directories import get_tex_dir
 from manimlib.utils.simple_functions import hash_string
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Iterable
+
 
 SAVED_TEX_CONFIG = {}
+# Compilations which were requested in a batch, keyed by svg file path
+PENDING_TEX_SVG_FILES: dict[str, Future] = {}
+TEX_COMPILATION_POOL: list[ThreadPoolExecutor] = []
 
 
 def get_tex_template_config(template_name: str) -> dict[str, str]:
@@ -51,10 +61,23 @@ def get_tex_config() -> dict[str, str]:
     return SAVED_TEX_CONFIG
 
 
-def tex_content_to_svg_file(
-    content: str, template: str, additional_preamble: str,
-    short_tex: str
-) -> str:
+def get_tex_compilation_pool() -> ThreadPoolExecutor:
+    # Only create once, then reuse for the rest of the session
+    if not TEX_COMPILATION_POOL:
+        TEX_COMPILATION_POOL.append(ThreadPoolExecutor(
+            max_workers=os.cpu_count(),
+            thread_name_prefix="tex_compilation",
+        ))
+    return TEX_COMPILATION_POOL[0]
+
+
+def get_full_tex(
+    content: str, template: str, additional_preamble: str
+) -> tuple[str, str]:
+    """
+    Returns the full tex document for the given content,
+    together with the compiler which should be used for it
+    """
     tex_config = get_tex_config()
     if not template or template == tex_config["template"]:
         compiler = tex_config["compiler"]
@@ -73,17 +96,64 @@ def tex_content_to_svg_file(
         content,
         "\\end{document}"
     )) + "\n"
+    return full_tex, compiler
+
 
-    svg_file = os.path.join(
-        get_tex_dir(), hash_string(full_tex) + ".svg"
-    )
-    if not os.path.exists(svg_file):
+def get_tex_svg_file_path(full_tex: str) -> str:
+    return os.path.join(get_tex_dir(), hash_string(full_tex) + ".svg")
+
+
+def tex_content_to_svg_file(
+    content: str, template: str, additional_preamble: str,
+    short_tex: str
+) -> str:
+    full_tex, compiler = get_full_tex(content, template, additional_preamble)
+    svg_file = get_tex_svg_file_path(full_tex)
+    if svg_file in PENDING_TEX_SVG_FILES:
+        # Already being compiled as part of a batch
+        PENDING_TEX_SVG_FILES.pop(svg_file).result()
+    elif not os.path.exists(svg_file):
         # If svg doesn't exist, create it
         with display_during_execution("Writing " + short_tex):
             create_tex_svg(full_tex, svg_file, compiler)
     return svg_file
 
 
+def tex_contents_to_svg_files(
+    tex_args: Iterable[tuple[str, str, str]],
+    wait: bool = True
+) -> list[str]:
+    """
+    Batch version of tex_content_to_svg_file, taking in tuples of
+    (content, template, additional_preamble).  Any svg files which don't
+    exist yet are compiled concurrently by a pool of worker threads.
+
+    If wait is False, this returns without waiting on those compilations,
+    and a later call to tex_content_to_svg_file for one of the same
+    contents only waits on that one.
+    """
+    svg_files = []
+    for content, template, additional_preamble in tex_args:
+        full_tex, compiler = get_full_tex(content, template, additional_preamble)
+        svg_file = get_tex_svg_file_path(full_tex)
+        if svg_file not in PENDING_TEX_SVG_FILES and not os.path.exists(svg_file):
+            PENDING_TEX_SVG_FILES[svg_file] = get_tex_compilation_pool().submit(
+                create_tex_svg, full_tex, svg_file, compiler
+            )
+        svg_files.append(svg_file)
+
+    pending_files = list(dict.fromkeys(
+        svg_file
+        for svg_file in svg_files
+        if svg_file in PENDING_TEX_SVG_FILES
+    ))
+    if wait and pending_files:
+        with display_during_execution(f"Writing {len(pending_files)} tex files"):
+            for svg_file in pending_files:
+                PENDING_TEX_SVG_FILES.pop(svg_file).result()
+    return svg_files
+
+
 def create_tex_svg(full_tex: str, svg_file: str, compiler: str) -> None:
     if compiler == "latex":
         program = "latex"
@@ -96,8 +166,10 @@ def create_tex_svg(full_tex: str, svg_file: str, compiler: str) -> None:
             f"Compiler '{compiler}' is not implemented"
         )
 
-    # Write tex file
-    root, _ = os.path.splitext(svg_file)
+    # Write tex file.  Intermediate files are named by process, and the svg is
+    # only moved into place once complete, so that separate processes can
+    # safely compile the same file at the same time
+    root = os.path.splitext(svg_file)[0] + f"_{os.getpid()}"
     with open(root + ".tex", "w", encoding="utf-8") as tex_file:
         tex_file.write(full_tex)
 
@@ -132,10 +204,12 @@ def create_tex_svg(full_tex: str, svg_file: str, compiler: str) -> None:
         "-v",
         "0",
         "-o",
-        f"\"{svg_file}\"",
+        f"\"{root}.svg\"",
         ">",
         os.devnull
     )))
+    if os.path.exists(root + ".svg"):
+        os.replace(root + ".svg", svg_file)
 
     # Cleanup superfluous documents
     for ext in (".tex", dvi_ext, ".log", ".aux"):